@@ -0,0 +1,76 @@
+"""Add votes user/post unique constraint
+
+Revision ID: f1d6b3a8c259
+Revises: e5b2c8f1a437
+Create Date: 2026-10-18 23:12:47.205913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.ranking import hot_score
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d6b3a8c259'
+down_revision: Union[str, Sequence[str], None] = 'e5b2c8f1a437'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    votes = sa.table('votes', sa.column('id', sa.String), sa.column('user_id', sa.String),
+                     sa.column('post_id', sa.String), sa.column('vote_type', sa.Integer),
+                     sa.column('created_at', sa.DateTime(timezone=True)))
+    posts = sa.table('posts', sa.column('id', sa.String), sa.column('upvotes', sa.Integer),
+                     sa.column('downvotes', sa.Integer), sa.column('created_at', sa.DateTime(timezone=True)),
+                     sa.column('score', sa.Integer), sa.column('hot_score', sa.Float))
+    bind = op.get_bind()
+
+    # Racing first votes could insert twice; keep each user's latest vote per post
+    affected = [r.post_id for r in bind.execute(
+        sa.select(votes.c.post_id).group_by(votes.c.user_id, votes.c.post_id).having(sa.func.count() > 1)
+    )]
+    if affected:
+        newer = votes.alias('newer')
+        bind.execute(votes.delete().where(sa.exists().where(
+            newer.c.user_id == votes.c.user_id,
+            newer.c.post_id == votes.c.post_id,
+            sa.or_(
+                newer.c.created_at > votes.c.created_at,
+                sa.and_(newer.c.created_at == votes.c.created_at, newer.c.id > votes.c.id),
+            ),
+        )))
+        # Every duplicate was counted; recount those posts from the surviving votes
+        counts = bind.execute(
+            sa.select(
+                posts.c.id, posts.c.created_at,
+                sa.func.count(votes.c.id).filter(votes.c.vote_type == 1).label('up'),
+                sa.func.count(votes.c.id).filter(votes.c.vote_type == -1).label('down'),
+            ).select_from(posts.outerjoin(votes, votes.c.post_id == posts.c.id))
+            .where(posts.c.id.in_(set(affected))).group_by(posts.c.id, posts.c.created_at)
+        ).all()
+        bind.execute(
+            posts.update().where(posts.c.id == sa.bindparam('b_id')).values(
+                upvotes=sa.bindparam('b_up'), downvotes=sa.bindparam('b_down'),
+                score=sa.bindparam('b_score'), hot_score=sa.bindparam('b_hot'),
+            ),
+            [{"b_id": r.id, "b_up": r.up, "b_down": r.down, "b_score": r.up - r.down,
+              "b_hot": hot_score(r.up - r.down, r.created_at) if r.created_at else 0.0} for r in counts],
+        )
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('votes') as batch_op:
+        batch_op.create_unique_constraint('uq_votes_user_post', ['user_id', 'post_id'])
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('votes') as batch_op:
+        batch_op.drop_constraint('uq_votes_user_post', type_='unique')
+    # ### end Alembic commands ###
@@ -1,19 +1,23 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.user import User
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.platform_repository import PlatformCounterRepository
 from app.repositories.user_repository import UserRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.core.security import (
-    get_password_hash, verify_password, create_access_token, 
-    create_refresh_token, create_verification_token, create_reset_token,
-    decode_token
+    get_password_hash_async, verify_password_async, create_access_token,
+    create_verification_token, create_reset_token, decode_token
 )
 from app.services.email_service import email_service
+from app.services.auth_cache import auth_cache
 import datetime
 
 class AuthController:
     def __init__(self, db: Session):
         self.db = db
         self.user_repo = UserRepository(db)
+        self.token_repo = RefreshTokenRepository(db)
 
     async def register(self, body) -> dict:
         existing = self.user_repo.get_by_email(body.email)
@@ -23,7 +27,7 @@ class AuthController:
         user_data = {
             "name": body.name,
             "email": body.email,
-            "password_hash": get_password_hash(body.password),
+            "password_hash": await get_password_hash_async(body.password),
             "target_role": getattr(body, 'target_role', None),
             "college": getattr(body, 'college', None),
             "is_verified": False,
@@ -31,13 +35,15 @@ class AuthController:
         }
         
         user = self.user_repo.create(user_data)
+        BadgeRepository(self.db).record_user(commit=False)
+        PlatformCounterRepository(self.db).record_user(commit=False)
 
         # Generate verification token
         user.verification_token = create_verification_token({"sub": user.id})
         self.db.commit()
         
         # Call email service
-        await email_service.send_verification_email(user.email, user.verification_token)
+        await email_service.send_verification_email(user.id, user.verification_token)
         
         return {"message": "Registration successful. Please verify your email.", "user_id": user.id}
 
@@ -53,7 +59,7 @@ class AuthController:
                 detail=f"Account locked. Try again in {minutes} minutes."
             )
 
-        if not user or not verify_password(body.password, user.password_hash):
+        if not user or not await verify_password_async(body.password, user.password_hash):
             if user:
                 user.failed_login_attempts += 1
                 if user.failed_login_attempts >= 5:
@@ -67,9 +73,8 @@ class AuthController:
         user.last_login = datetime.datetime.utcnow()
         
         access_token = create_access_token({"sub": user.id, "role": user.role})
-        refresh_token = create_refresh_token({"sub": user.id})
-        
-        user.hashed_refresh_token = get_password_hash(refresh_token)
+        # Each login starts a new token family
+        refresh_token = self.token_repo.issue(user.id, commit=False)
         self.db.commit()
 
         return {
@@ -83,21 +88,21 @@ class AuthController:
         if not payload or payload.get("type") != "refresh":
             raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
             
-        user_id = payload.get("sub")
-        user = self.user_repo.get_by_id(user_id)
-        
-        if not user or not user.hashed_refresh_token:
+        record = self.token_repo.get_by_token(refresh_token)
+        if not record or record.user_id != payload.get("sub") or record.revoked_at:
             raise HTTPException(status_code=401, detail="User session not found")
 
-        if not verify_password(refresh_token, user.hashed_refresh_token):
-            user.hashed_refresh_token = None
-            self.db.commit()
+        if not self.token_repo.mark_used(record):
+            # A rotated token came back: someone holds a copy, so end the whole login
+            self.token_repo.revoke_family(record.family_id)
             raise HTTPException(status_code=401, detail="Invalid session - potential token reuse detected")
 
+        user = self.user_repo.get_by_id(record.user_id)
+        if not user:
+            raise HTTPException(status_code=401, detail="User session not found")
+
         new_access = create_access_token({"sub": user.id, "role": user.role})
-        new_refresh = create_refresh_token({"sub": user.id})
-        
-        user.hashed_refresh_token = get_password_hash(new_refresh)
+        new_refresh = self.token_repo.issue(user.id, family_id=record.family_id, commit=False)
         self.db.commit()
 
         return {
@@ -107,10 +112,8 @@ class AuthController:
         }
 
     async def logout(self, user_id: str) -> dict:
-        user = self.user_repo.get_by_id(user_id)
-        if user:
-            user.hashed_refresh_token = None
-            self.db.commit()
+        self.token_repo.revoke_user(user_id)
+        auth_cache.invalidate_user(user_id)
         return {"message": "Logged out successfully"}
 
     async def verify_email(self, token: str) -> dict:
@@ -136,7 +139,7 @@ class AuthController:
         user.reset_token = token
         self.db.commit()
         # Send email
-        await email_service.send_password_reset(user.email, token)
+        await email_service.send_password_reset(user.id, token)
         
         return {"message": "Reset link sent", "debug_token": token}
 
@@ -149,8 +152,20 @@ class AuthController:
         if not user or user.reset_token != token:
             raise HTTPException(status_code=400, detail="Invalid reset session")
         
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await get_password_hash_async(new_password)
         user.reset_token = None
-        user.hashed_refresh_token = None 
+        self.token_repo.revoke_user(user.id, commit=False)
         self.db.commit()
+        auth_cache.invalidate_user(user.id)
         return {"message": "Password reset successfully"}
+
+    async def set_role(self, user_id: str, role: str) -> dict:
+        user = self.user_repo.get_by_id(user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        user.role = role
+        self.db.commit()
+        # Cached principals carry the role; drop it so the change applies on the next request
+        auth_cache.invalidate_user(user.id)
+        return {"user_id": user.id, "role": user.role}
@@ -5,4 +5,4 @@ from app.controllers.evaluation_controller import EvaluationController
 class BehavioralController(EvaluationController):
     async def process_behavioral_answer(self, user_id: str, data: dict):
         data["round_type"] = "Behavioral"
-        return await self.evaluate_answer(user_id, data)
+        return self.evaluate_answer(user_id, data)
@@ -1,6 +1,7 @@
 # app/controllers/community_controller.py
 from sqlalchemy.orm import Session
 from app.repositories.post_repository import PostRepository
+from app.services.counter_service import post_counters
 from fastapi import HTTPException
 
 class CommunityController:
@@ -12,20 +13,17 @@ class CommunityController:
         data = {**body, "user_id": user_id}
         return self.repo.create_post(data)
 
-    def get_posts(self, filters: dict):
-        return self.repo.list_posts(**filters)
-
     def get_post_detail(self, post_id: str):
         post = self.repo.get_post(post_id)
         if not post:
             raise HTTPException(status_code=404, detail="Post not found")
-        
-        post.view_count += 1
-        self.db.commit()
-        
+
+        # Buffered; flushed to posts.view_count in batches
+        post_counters.incr(post_id, "views")
+
         comments = self.repo.get_comments(post_id)
         return {
-            "post": post,
+            "post": self._with_pending(post),
             "comments": comments
         }
 
@@ -34,4 +32,22 @@ class CommunityController:
         return self.repo.add_comment(data)
 
     def vote(self, user_id: str, post_id: str, vote_type: int):
-        return self.repo.vote(user_id, post_id, vote_type)
+        if vote_type not in (1, -1):
+            raise HTTPException(status_code=400, detail="vote_type must be 1 or -1")
+        post = self.repo.get_post(post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+
+        for field, delta in self.repo.vote(user_id, post_id, vote_type).items():
+            post_counters.incr(post_id, field, delta)
+        return self._with_pending(post)
+
+    def _with_pending(self, post) -> dict:
+        """The post with counter deltas that are buffered but not yet flushed."""
+        data = post.to_dict()
+        pending = post_counters.pending(post.id, ("up", "down", "views"))
+        data["upvotes"] += pending.get("up", 0)
+        data["downvotes"] += pending.get("down", 0)
+        data["view_count"] += pending.get("views", 0)
+        data["score"] += pending.get("up", 0) - pending.get("down", 0)
+        return data
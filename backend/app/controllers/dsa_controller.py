@@ -3,6 +3,10 @@ from sqlalchemy.orm import Session
 from app.models.problem import Problem
 from app.services.ai_service import ai_service
 from app.schemas.dsa import DSASubmissionRequest
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.repositories.readiness_repository import ReadinessRepository
+from app.repositories.streak_repository import StreakRepository
 
 class DSAController:
     def __init__(self, db: Session):
@@ -32,17 +36,10 @@ class DSAController:
         )
         
         # Update streak
-        from app.models.interview_session import PracticeStreak
-        import datetime
-        today = datetime.date.today()
-        streak = self.db.query(PracticeStreak).filter_by(user_id=user_id, date=today).first()
-        if streak:
-            streak.sessions += 1
-        else:
-            streak = PracticeStreak(user_id=user_id, date=today, sessions=1)
-            self.db.add(streak)
-        
-        self.db.commit()
+        StreakRepository(self.db).record_activity(user_id)
+        LeaderboardRepository(self.db).refresh_user(user_id)
+        BadgeRepository(self.db).evaluate(user_id, ["streak"])
+        ReadinessRepository(self.db).mark_dirty(user_id)
         
         # In a real app, we'd save this to a DSASubmissions table
         return review
@@ -2,14 +2,28 @@
 from sqlalchemy.orm import Session
 from app.repositories.evaluation_repository import EvaluationRepository
 from app.services.ai_service import ai_service
+from app.services.job_service import job, job_queue
+from app.core.database import SessionLocal
+from typing import Optional
 from fastapi import HTTPException
+import uuid
 
 class EvaluationController:
     def __init__(self, db: Session):
         self.db = db
         self.repo = EvaluationRepository(db)
 
-    async def evaluate_answer(self, user_id: str, data: dict):
+    def evaluate_answer(self, user_id: str, data: dict, idempotency_key: Optional[str] = None):
+        """Queue the AI evaluation; poll GET /jobs/{job_id} for the report."""
+        record = job_queue.enqueue(
+            "evaluation.evaluate_answer",
+            {"user_id": user_id, "data": data, "session_id": uuid.uuid4().hex},
+            idempotency_key=idempotency_key,
+            user_id=user_id,
+        )
+        return {"job_id": record["id"], "poll_token": record.get("poll_token"), "status": record["status"]}
+
+    async def run_evaluation(self, user_id: str, data: dict, session_id: Optional[str] = None):
         # 1. AI Evaluation
         try:
             ai_report = await ai_service.evaluate_interview_response(
@@ -23,6 +37,7 @@ class EvaluationController:
         # 2. Map AI Report to DB Model
         scores = ai_report.get("scores", {})
         db_data = {
+            "id": session_id or uuid.uuid4().hex,
             "user_id": user_id,
             "question": data.get("question"),
             "answer": data.get("answer"),
@@ -70,3 +85,12 @@ class EvaluationController:
 
     def get_history(self, user_id: str):
         return self.repo.get_user_history(user_id)
+
+
+@job("evaluation.evaluate_answer")
+async def evaluate_answer_job(user_id: str, data: dict, session_id: Optional[str] = None):
+    db = SessionLocal()
+    try:
+        return await EvaluationController(db).run_evaluation(user_id, data, session_id)
+    finally:
+        db.close()
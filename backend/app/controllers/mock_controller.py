@@ -2,6 +2,12 @@
 from sqlalchemy.orm import Session
 from app.services.ai_service import ai_service
 from app.models.interview_session import InterviewSession
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.repositories.readiness_repository import ReadinessRepository
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.repositories.session_repository import SessionRepository, MOCK_SUMMARY_COLUMNS
+from app.services.data_version import dashboard_versions
 import json
 
 class MockController:
@@ -24,11 +30,23 @@ class MockController:
             conversation_history=data.get("conversation_history", [])
         )
         self.db.add(session)
+        self.db.flush()
+        AnalyticsRepository(self.db).record_session(session, commit=False)
+        LeaderboardRepository(self.db).refresh_user(user_id, commit=False)
+        BadgeRepository(self.db).evaluate(user_id, ["session"], commit=False)
+        ReadinessRepository(self.db).mark_dirty(user_id, commit=False)
         self.db.commit()
+        dashboard_versions.bump(user_id)
         self.db.refresh(session)
         return session
 
-    def get_history(self, user_id: str):
-        return self.db.query(InterviewSession).filter_by(
-            user_id=user_id
-        ).order_by(InterviewSession.created_at.desc()).all()
+    def get_history(self, user_id: str, cursor: str = None, limit: int = 20):
+        # Summary columns only; the transcript is fetched per session, not per list
+        rows, next_cursor = SessionRepository(self.db).list_summaries(
+            user_id, "mock", cursor, limit, columns=MOCK_SUMMARY_COLUMNS
+        )
+        return {
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+            "sessions": [dict(r._mapping) for r in rows],
+        }
@@ -2,6 +2,8 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.repositories.user_repository import UserRepository
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.leaderboard_repository import LeaderboardRepository
 from app.schemas.user import UserUpdate
 from app.models.user import User
 
@@ -72,4 +74,7 @@ class ProfileController:
             setattr(user, key, value)
         
         self.db.commit()
+        # Privacy toggles and college are denormalized into the rank table
+        LeaderboardRepository(self.db).refresh_user(user_id)
+        BadgeRepository(self.db).evaluate(user_id, ["profile"])
         return {"message": "Profile updated successfully", "user": self.get_profile(user_id, user_id)}
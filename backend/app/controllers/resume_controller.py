@@ -2,7 +2,9 @@
 from sqlalchemy.orm import Session
 from app.services.resume_parser import resume_parser
 from app.services.ai_service import ai_service
+from app.services.data_version import dashboard_versions
 from app.models.resume_scan import ResumeScan
+from app.repositories.readiness_repository import ReadinessRepository
 from fastapi import UploadFile, HTTPException
 
 class ResumeController:
@@ -30,7 +32,9 @@ class ResumeController:
             job_description=job_description
         )
         self.db.add(scan)
+        ReadinessRepository(self.db).mark_dirty(user_id, commit=False)
         self.db.commit()
+        dashboard_versions.bump(user_id)
         self.db.refresh(scan)
         
         return {
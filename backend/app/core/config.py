@@ -5,15 +5,53 @@ class Settings(BaseSettings):
     # ── Database & Cache ──────────────────────────────────────────
     DATABASE_URL: str = "sqlite:///./interviewace.db"
     REDIS_URL: str    = "redis://localhost:6379/0"
+    DATA_VERSION_TTL: int = 7 * 24 * 3600       # per-user ETag version tokens in Redis (s)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512       # @cached_response: per-worker LRU of rendered bodies
+    RESPONSE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    RESPONSE_CACHE_LOCAL_TTL: int = 30         # per-worker copy; Redis holds the entry for the route's ttl (s)
     
     # ── Auth (Strict 15m / 7d) ─────────────────────────────────────
     JWT_SECRET: str   = "dev-secret-change-in-prod-12345678"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    PASSWORD_HASH_WORKERS: int = 4            # bcrypt thread pool per process
+    AUTH_TOKEN_CACHE_TTL: int = 60             # verified-token cache lifetime, capped at token exp (s)
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    AUTH_PRINCIPAL_TTL: int = 300              # cached (id, role, is_active) in Redis (s)
+    AUTH_PRINCIPAL_LOCAL_TTL: int = 10         # per-worker copy; bounds cross-worker invalidation lag (s)
     
     # ── AI Services ───────────────────────────────────────────────
     ANTHROPIC_API_KEY: Optional[str] = None
+    ANTHROPIC_BASE_URL: Optional[str] = None   # e.g. a local stub server for load tests
+    AI_MAX_CONCURRENCY: int = 16               # in-flight upstream calls per worker
+    AI_MAX_CONNECTIONS: int = 32               # shared HTTP connection pool size
+    AI_REQUEST_TIMEOUT: float = 60.0
+    AI_LOCK_TTL: int = 120                     # cross-worker single-flight lock lifetime (s)
+    AI_LOCK_POLL_INTERVAL: float = 0.25        # how often lock waiters re-check the cache (s)
+    AI_CACHE_MAX_ENTRIES: int = 1024           # in-process LRU tier in front of Redis
+    AI_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    AI_CACHE_COMPRESS_MIN_BYTES: int = 1024    # payloads above this are zlib-compressed in Redis
+    
+    # ── Rate Limiting (per-route rules live in app/middleware/rate_limit.py) ──
+    RATE_LIMIT_DEFAULT: int = 100              # requests per window per IP, per path
+    RATE_LIMIT_USER_DEFAULT: int = 300         # same, for authenticated users
+    RATE_LIMIT_WINDOW: int = 60                # seconds
+    
+    # ── Uploads ────────────────────────────────────────────────────
+    MAX_RECORDING_MB: int = 250
+    
+    # ── Background Jobs ────────────────────────────────────────────
+    JOB_WORKERS: int = 2                       # worker threads inside each API process
+    JOB_RESULT_TTL: int = 24 * 3600            # how long job records stay pollable (s)
+    JOB_HEARTBEAT_INTERVAL: float = 10.0       # worker liveness beat; also how often lost jobs are reaped (s)
+    JOB_WORKER_TIMEOUT: float = 60.0           # a worker silent this long is presumed dead; its jobs requeue (s)
+    COUNTER_FLUSH_INTERVAL: float = 5.0        # post view/vote counters: Redis -> DB batch period (s)
+    READINESS_REFRESH_INTERVAL: float = 5.0    # how often dirty readiness scores are looked for (s)
+    READINESS_DEBOUNCE: float = 10.0           # quiet time after the first write before recomputing (s)
+    PLATFORM_RECONCILE_INTERVAL: float = 3600.0   # recount platform counters from the tables (s)
+    PLATFORM_EVENTS_APPROXIMATE: bool = True      # Postgres: reconcile the event total from the planner estimate
+    DAILY_SWEEP_INTERVAL: float = 300.0        # how often the once-a-day sweep checks for a new date (s)
     
     # ── External Integrations ──────────────────────────────────────
     CLOUDINARY_URL: Optional[str] = None
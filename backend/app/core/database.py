@@ -1,8 +1,10 @@
 # app/core/database.py
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.pool import QueuePool
 import redis
+import redis.asyncio
 import logging
 from .config import settings
 
@@ -30,11 +32,38 @@ if DATABASE_URL.startswith("sqlite"):
 engine = create_engine(DATABASE_URL, **engine_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def async_database_url(url: str) -> str:
+    """Map the sync DATABASE_URL onto its async driver (aiosqlite / asyncpg)."""
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Async engine for read-heavy async routes; same database, separate pool.
+# File-backed SQLite keeps the default queue pool so concurrent requests get their own connection.
+async_engine_args = {"pool_pre_ping": True}
+if DATABASE_URL.startswith("sqlite"):
+    async_engine_args = {"connect_args": {"check_same_thread": False}}
+    if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+        from sqlalchemy.pool import StaticPool
+        async_engine_args["poolclass"] = StaticPool
+else:
+    async_engine_args.update(pool_size=10, max_overflow=20)
+
+async_engine = create_async_engine(async_database_url(DATABASE_URL), **async_engine_args)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 # Redis Client with Graceful Fallback
 try:
     redis_client = redis.from_url(REDIS_URL, decode_responses=True)
     redis_client.ping()
+    redis_available = True
 except Exception:
+    redis_available = False
     logger.warning("Redis connection failed. Using MockRedis fallback.")
     class MockRedis:
         def get(self, *args, **kwargs): return None
@@ -47,6 +76,23 @@ except Exception:
         def execute(self): return []
     redis_client = MockRedis()
 
+# Async client for per-request hot paths (rate limiting); None means fall back in-process
+async_redis_client = redis.asyncio.from_url(REDIS_URL, decode_responses=True) if redis_available else None
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_redis():
+    return redis_client
+
 def init_db():
     from app.models import Base  # noqa: F401
     Base.metadata.create_all(bind=engine)
@@ -1,49 +1,68 @@
 # app/core/dependencies.py
 from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from .database import SessionLocal, redis_client
-from .security import decode_token
+from .database import get_db, get_async_db
 from .config import settings
+from app.services.auth_cache import Principal, auth_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login", auto_error=False)
 
-def get_db() -> Generator:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-def get_redis():
-    return redis_client
+def _load_principal(db: Session):
+    def load(user_id: str) -> Optional[Principal]:
+        from app.repositories.user_repository import UserRepository
+        row = UserRepository(db).get_principal_row(user_id)
+        return Principal(row.id, row.role, row.is_active) if row else None
+    return load
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
+    """
+    The caller as a slim Principal (id, role, is_active), served from auth_cache,
+    so a warm request touches neither the JWT signature check nor the database.
+    Routes that need profile columns use get_current_user_record instead.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    payload = decode_token(token)
+    # RequestContextMiddleware has already decoded the bearer token
+    payload = getattr(request.state, "token_payload", None) or auth_cache.decode(token)
     if not payload or payload.get("type") != "access":
         raise credentials_exception
     
     user_id: str = payload.get("sub")
     if user_id is None:
         raise credentials_exception
-        
-    # User repository import will happen inside to avoid circular check
+
+    principal = auth_cache.get_principal(user_id, _load_principal(db))
+    if principal is None:
+        raise credentials_exception
+    if not principal.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account is disabled")
+    return principal
+
+async def get_current_user_record(principal: Principal = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Full User row for the caller, for the few routes that render profile fields."""
     from app.repositories.user_repository import UserRepository
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_id(user_id)
-    
+    user = UserRepository(db).get_by_id(principal.id)
     if user is None:
-        raise credentials_exception
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
     return user
 
+async def get_optional_user(request: Request, token: Optional[str] = Depends(optional_oauth2_scheme), db: Session = Depends(get_db)):
+    """Current user if a valid bearer token was sent, else None (guest access)."""
+    if not token:
+        return None
+    try:
+        return await get_current_user(request, token, db)
+    except HTTPException:
+        return None
+
 def require_role(allowed_roles: list):
-    async def role_checker(current_user=Depends(get_current_user)):
+    async def role_checker(current_user: Principal = Depends(get_current_user)):
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
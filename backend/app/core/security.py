@@ -1,25 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
 from jose import jwt, JWTError
+import asyncio
 import datetime
+import hashlib
+import hmac
+import uuid
 from .config import settings
 
 SECRET = settings.JWT_SECRET
 ALGORITHM = settings.JWT_ALGORITHM
 pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is deliberately slow (~250ms of CPU); async callers run it here so the
+# event loop keeps serving, and the pool size caps how many cores it can take.
+_hash_pool = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+
 def get_password_hash(password: str) -> str:
     return pwd_ctx.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_ctx.verify(plain_password, hashed_password)
 
+async def get_password_hash_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, get_password_hash, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, verify_password, plain_password, hashed_password)
+
+def token_digest(token: str) -> str:
+    """Keyed SHA-256 of a high-entropy token (refresh tokens); microseconds, unlike bcrypt."""
+    return hmac.new(SECRET.encode(), token.encode(), hashlib.sha256).hexdigest()
+
 def create_access_token(data: dict) -> str:
     exp = datetime.datetime.utcnow() + datetime.timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return jwt.encode({**data, "exp": exp, "type": "access"}, SECRET, algorithm=ALGORITHM)
 
 def create_refresh_token(data: dict) -> str:
     exp = datetime.datetime.utcnow() + datetime.timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    return jwt.encode({**data, "exp": exp, "type": "refresh"}, SECRET, algorithm=ALGORITHM)
+    # jti keeps two tokens issued to one user in the same second distinct
+    return jwt.encode({**data, "exp": exp, "type": "refresh", "jti": uuid.uuid4().hex}, SECRET, algorithm=ALGORITHM)
 
 def create_verification_token(data: dict) -> str:
     exp = datetime.datetime.utcnow() + datetime.timedelta(hours=24)
@@ -6,11 +6,15 @@ from pathlib import Path
 
 from app.core.config import settings
 from app.core.logging import logger
-from app.middleware.logging_middleware import LoggingMiddleware
-from app.middleware.rate_limit import RateLimitMiddleware
-from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.request_middleware import RequestContextMiddleware
 from app.middleware.error_handler import setup_exception_handlers
 from app.routes import auth
+from app.services.ai_service import ai_service
+from app.services.job_service import job_queue
+from app.services.counter_service import post_counters
+from app.services.readiness_service import readiness_refresher
+from app.services.platform_service import platform_events, platform_reconciler
+from app.services.scheduler_service import daily_sweeper
 
 app = FastAPI(
     title="InterviewAce API",
@@ -31,14 +35,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 3. Logging
-app.add_middleware(LoggingMiddleware)
-
-# 4. Auth (JWT Validation)
-app.add_middleware(AuthMiddleware)
-
-# 5. Rate Limiting (Redis-based)
-app.add_middleware(RateLimitMiddleware, limit=100, window=60)
+# 3. Auth (JWT decoded once into request.state), rate limiting and access logging
+#    in one pure-ASGI layer, so streaming responses pass through untouched
+app.add_middleware(
+    RequestContextMiddleware,
+    limit=settings.RATE_LIMIT_DEFAULT,
+    window=settings.RATE_LIMIT_WINDOW,
+    user_limit=settings.RATE_LIMIT_USER_DEFAULT,
+)
 
 # ── Startup/Shutdown ───────────────────────────────────────────
 @app.on_event("startup")
@@ -47,11 +51,39 @@ def startup():
     from app.core.database import init_db
     init_db()
     Path("recordings").mkdir(exist_ok=True)
+    _index_question_banks()
+    job_queue.start_workers(settings.JOB_WORKERS)
+    post_counters.start_flusher(settings.COUNTER_FLUSH_INTERVAL)
+    readiness_refresher.start(settings.READINESS_REFRESH_INTERVAL, settings.READINESS_DEBOUNCE)
+    platform_events.start_flusher(settings.COUNTER_FLUSH_INTERVAL)
+    platform_reconciler.start(settings.PLATFORM_RECONCILE_INTERVAL)
+    daily_sweeper.start(settings.DAILY_SWEEP_INTERVAL)
+
+def _index_question_banks():
+    from app.core.database import SessionLocal
+    from app.repositories.search_repository import SearchIndexer
+    db = SessionLocal()
+    try:
+        SearchIndexer(db).sync_static()
+    except Exception as e:
+        logger.warning(f"Question bank indexing skipped: {e}")
+    finally:
+        db.close()
+
+@app.on_event("shutdown")
+def shutdown():
+    job_queue.stop_workers()
+    post_counters.stop_flusher()
+    readiness_refresher.stop()
+    platform_events.stop_flusher()
+    platform_reconciler.stop()
+    daily_sweeper.stop()
 
 # ── Static Files ───────────────────────────────────────────────
 app.mount("/recordings", StaticFiles(directory="recordings"), name="recordings")
 
-from app.routes import auth, dashboard, profile, evaluation, resume, dsa, community, tracker, mock, study_plan, prep, systemdesign
+from app.routes import auth, dashboard, profile, evaluation, resume, dsa, community, tracker, mock, study_plan, prep, systemdesign, jobs, search
+from app.routes import analytics, badges, behavioral, leaderboard, questions, sessions, voice
 
 app.include_router(auth.router, prefix="/api")
 app.include_router(dashboard.router, prefix="/api")
@@ -65,6 +97,15 @@ app.include_router(mock.router, prefix="/api")
 app.include_router(study_plan.router, prefix="/api")
 app.include_router(prep.router, prefix="/api")
 app.include_router(systemdesign.router, prefix="/api")
+app.include_router(jobs.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
+app.include_router(analytics.router, prefix="/api")
+app.include_router(badges.router, prefix="/api")
+app.include_router(behavioral.router, prefix="/api")
+app.include_router(leaderboard.router, prefix="/api")
+app.include_router(questions.router, prefix="/api")
+app.include_router(sessions.router, prefix="/api")
+app.include_router(voice.router, prefix="/api")
 
 # ── Health & Root ──────────────────────────────────────────────
 @app.get("/health")
@@ -76,6 +117,12 @@ def health():
         "architecture": "Strict MVC"
     }
 
+@app.get("/health/ai")
+def ai_health():
+    """Upstream vs coalesced Claude call counters, AI cache stats and prompt-token savings for this worker."""
+    return {"metrics": ai_service.metrics, "cache": ai_service.cache.stats(),
+            "prompt_tokens": ai_service.prompt_token_stats()}
+
 @app.get("/")
 def root():
     return {"message": "Welcome to InterviewAce API Take 2 — /docs for Swagger UI"}
@@ -1,18 +0,0 @@
-# app/middleware/auth_middleware.py
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.core.security import decode_token
-
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Attach anonymous by default
-        request.state.user_id = None
-        
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-            payload = decode_token(token)
-            if payload and payload.get("type") == "access":
-                request.state.user_id = payload.get("sub")
-        
-        return await call_next(request)
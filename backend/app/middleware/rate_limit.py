@@ -1,47 +1,150 @@
 # app/middleware/rate_limit.py
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.core.database import redis_client
+"""
+Request rate limiting for RequestContextMiddleware.
+
+Each request costs one atomic Redis round trip: a GCRA (generic cell rate
+algorithm) Lua script that reads and advances a single "theoretical arrival
+time" key. When Redis is unavailable, or a call fails, an in-process token
+bucket with the same limits takes over so the API degrades to per-worker
+limiting instead of no limiting at all.
+
+Limits are chosen per route by longest matching path prefix; authenticated
+callers are keyed by user id (and may get a higher limit), everyone else by IP.
+"""
+import logging
+import math
 import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from app.core.database import async_redis_client
+
+logger = logging.getLogger(__name__)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, limit: int = 100, window: int = 60):
-        super().__init__(app)
+# KEYS[1] = limiter key; ARGV = emission interval (ms), burst tolerance (ms)
+# Returns {allowed (0/1), retry_after_ms, remaining}
+GCRA_SCRIPT = """
+local emission = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + emission
+local allow_at = new_tat - tolerance
+if allow_at > now then
+  return {0, allow_at - now, 0}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {1, 0, math.floor((tolerance - (new_tat - now)) / emission)}
+"""
+
+
+class RateLimitRule:
+    """
+    `limit` requests per `window` seconds for paths starting with `prefix`.
+    user_limit — limit for authenticated callers (defaults to `limit`)
+    per_path   — count each exact path separately instead of the whole prefix
+    """
+    def __init__(self, prefix: str, limit: int, window: int = 60,
+                 user_limit: Optional[int] = None, per_path: bool = False):
+        self.prefix = prefix
         self.limit = limit
         self.window = window
+        self.user_limit = user_limit or limit
+        self.per_path = per_path
+
+
+# Credential endpoints are tight and keyed per caller; AI-backed endpoints are
+# bounded so one user can't drain the upstream concurrency budget.
+DEFAULT_RULES = [
+    RateLimitRule("/api/auth/login", 10, 60),
+    RateLimitRule("/api/auth/register", 5, 60),
+    RateLimitRule("/api/auth/forgot-password", 5, 300),
+    RateLimitRule("/api/auth/reset-password", 5, 300),
+    RateLimitRule("/api/auth/refresh", 30, 60),
+    RateLimitRule("/api/evaluation", 30, 60),
+    RateLimitRule("/api/resume", 20, 60),
+    RateLimitRule("/api/prep", 30, 60),
+    RateLimitRule("/api/systemdesign", 30, 60),
+    RateLimitRule("/api/mock", 60, 60),
+]
+
+
+class TokenBucket:
+    """
+    In-process fallback: one bucket of `limit` tokens per key, refilled at
+    limit/window per second. Keys are kept in a bounded LRU.
+    """
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def hit(self, key: str, limit: int, window: int) -> Tuple[bool, float, int]:
+        now = time.monotonic()
+        rate = limit / window
+        tokens, last = self._buckets.pop(key, (float(limit), now))
+        tokens = min(float(limit), tokens + (now - last) * rate)
+        if tokens >= 1:
+            tokens -= 1
+            allowed, retry_after = True, 0.0
+        else:
+            allowed, retry_after = False, (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed, retry_after, int(tokens)
+
+
+class RateLimiter:
+    """
+    Called by RequestContextMiddleware once per request.
+    hit() returns (allowed, retry_after_seconds, remaining).
+    """
+    def __init__(self, limit: int = 100, window: int = 60, user_limit: Optional[int] = None,
+                 rules: Optional[List[RateLimitRule]] = None, redis=None):
+        # The default rule keeps the old per-path baseline for unmatched routes
+        self.default_rule = RateLimitRule("", limit, window, user_limit=user_limit, per_path=True)
+        self.rules = sorted(DEFAULT_RULES if rules is None else rules,
+                            key=lambda r: len(r.prefix), reverse=True)
+        self.redis = async_redis_client if redis is None else redis
+        self.local = TokenBucket()
+        self._script = None
+        self.metrics = {"redis": 0, "local": 0, "rejected": 0, "redis_errors": 0}
+
+    def rule_for(self, path: str) -> RateLimitRule:
+        for rule in self.rules:
+            if path.startswith(rule.prefix):
+                return rule
+        return self.default_rule
+
+    async def hit(self, client_ip: str, path: str, user_id: Optional[str] = None) -> Tuple[bool, float, int]:
+        rule = self.rule_for(path)
+        identity = f"u:{user_id}" if user_id else f"ip:{client_ip}"
+        limit = rule.user_limit if user_id else rule.limit
+        key = f"rate_limit:{path if rule.per_path else rule.prefix}:{identity}"
+
+        result = None
+        if self.redis is not None:
+            result = await self._redis_hit(key, limit, rule.window)
+        if result is None:
+            self.metrics["local"] += 1
+            result = self.local.hit(key, limit, rule.window)
+        if not result[0]:
+            self.metrics["rejected"] += 1
+        return result
 
-    async def dispatch(self, request: Request, call_next):
-        # We can implement more granular limits in controllers, 
-        # but this provides a global per-IP baseline.
-        client_ip = request.client.host
-        path = request.url.path
-        
-        # Basic bucket logic
-        key = f"rate_limit:{client_ip}:{path}"
-        
+    async def _redis_hit(self, key: str, limit: int, window: int) -> Optional[Tuple[bool, float, int]]:
+        emission_ms = window * 1000 / limit
         try:
-            current = redis_client.get(key)
-            if current and int(current) >= self.limit:
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="Too many requests. Please slow down."
-                )
-            
-            p = redis_client.pipeline()
-            p.incr(key)
-            # Set expiry only if it's a new key
-            if not current:
-                p.expire(key, self.window)
-            p.execute()
-            
-        except HTTPException as e:
-            from fastapi.responses import JSONResponse
-            return JSONResponse(
-                status_code=e.status_code,
-                content={"success": False, "error": e.detail}
+            if self._script is None:
+                self._script = self.redis.register_script(GCRA_SCRIPT)
+            allowed, retry_after_ms, remaining = await self._script(
+                keys=[key], args=[emission_ms, window * 1000]
             )
-        except Exception:
-            # If Redis is down, we allow the request but log it
-            pass
-            
-        return await call_next(request)
+        except Exception as e:
+            self.metrics["redis_errors"] += 1
+            logger.warning(f"Rate limiter falling back to local bucket: {e}")
+            return None
+        self.metrics["redis"] += 1
+        return bool(allowed), math.ceil(float(retry_after_ms)) / 1000, int(remaining)
@@ -0,0 +1,87 @@
+# app/middleware/request_middleware.py
+import json
+import math
+import time
+from app.core.logging import logger
+from app.services.auth_cache import auth_cache
+from app.middleware.rate_limit import RateLimiter
+
+_RATE_LIMITED_BODY = json.dumps(
+    {"success": False, "error": "Too many requests. Please slow down."}
+).encode()
+
+
+class RequestContextMiddleware:
+    """
+    Single pure-ASGI layer replacing the Auth, RateLimit and Logging
+    BaseHTTPMiddleware stack. Per HTTP request it:
+      1. decodes the bearer token once (through the verified-token cache) into
+         request.state (user_id, token_payload), which get_current_user reuses
+      2. applies the rate limit (one async Redis call, keyed per user or per IP)
+      3. writes one structured access-log line when the response completes
+    `receive`/`send` are passed through, so streaming bodies are never buffered.
+    """
+    def __init__(self, app, limit: int = 100, window: int = 60, user_limit: int = None):
+        self.app = app
+        self.rate_limiter = RateLimiter(limit=limit, window=window, user_limit=user_limit)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        state = scope.setdefault("state", {})
+        state["user_id"] = None
+        state["token_payload"] = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                if value[:7] == b"Bearer ":
+                    payload = auth_cache.decode(value[7:].decode("latin-1"))
+                    if payload and payload.get("type") == "access":
+                        state["user_id"] = payload.get("sub")
+                        state["token_payload"] = payload
+                break
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        path = scope["path"]
+        status_code = 500
+
+        allowed, retry_after, _ = await self.rate_limiter.hit(client_ip, path, state["user_id"])
+        if not allowed:
+            status_code = 429
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(_RATE_LIMITED_BODY)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": _RATE_LIMITED_BODY})
+            self._log(scope, state, client_ip, status_code, start)
+            return
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._log(scope, state, client_ip, status_code, start)
+
+    @staticmethod
+    def _log(scope, state, client_ip: str, status_code: int, start: float):
+        logger.info(json.dumps({
+            "event": "access",
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            "user_id": state.get("user_id") or "anonymous",
+            "client": client_ip,
+        }))
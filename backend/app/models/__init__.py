@@ -1,7 +1,8 @@
 # app/models/__init__.py
 from .base import Base
 from .user import User
-from .interview_session import InterviewSession
+from .refresh_token import RefreshToken
+from .interview_session import InterviewSession, PracticeStreak, UserStreak, SessionDailyRollup
 from .evaluation_session import EvaluationSession
 from .interview_tracker import JobApplication
 from .study_plan import ReadinessScore
@@ -12,3 +13,8 @@ from .post import Post
 from .comment import Comment
 from .vote import Vote
 from .resume_scan import ResumeScan
+from .leaderboard import LeaderboardEntry
+from .search_document import SearchDocument
+from .badge import UserBadge, BadgeStat
+from .analytics import AnalyticsEvent, PlatformCounter
+from .counter_batch import AppliedCounterBatch
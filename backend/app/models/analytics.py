@@ -0,0 +1,33 @@
+# app/models/analytics.py
+from sqlalchemy import Column, String, ForeignKey, BigInteger, Float, JSON, Index
+from .base import Base
+
+class AnalyticsEvent(Base):
+    """Client-side product events (page views, feature use) from POST /analytics/event."""
+    __tablename__ = "analytics_events"
+
+    user_id = Column(String(32), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    event_type = Column(String(50), nullable=False)
+    page = Column(String(200), nullable=True)
+    feature = Column(String(100), nullable=True)
+    meta = Column(JSON, nullable=True)
+    session_id = Column(String(64), nullable=True)
+
+    __table_args__ = (
+        # Per-user activity window behind /analytics/dashboard
+        Index("ix_analytics_events_user_created", "user_id", "created_at"),
+    )
+
+class PlatformCounter(Base):
+    """
+    Platform-wide totals behind /analytics/platform, one row per counter
+    (users, sessions, sessions:<type>, scores, events). `value` is the count;
+    `total` is a running sum where one is needed (scores: sum of
+    overall_score over `value` scored sessions). Bumped atomically by
+    PlatformCounterRepository and periodically reconciled against the tables.
+    """
+    __tablename__ = "platform_counters"
+
+    name = Column(String(64), nullable=False, unique=True)
+    value = Column(BigInteger, nullable=False, default=0, server_default="0")
+    total = Column(Float, nullable=False, default=0.0, server_default="0")
@@ -0,0 +1,31 @@
+# app/models/badge.py
+from sqlalchemy import Column, String, ForeignKey, Integer, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from .base import Base
+
+class UserBadge(Base):
+    """
+    One row per badge a user has earned. Written once by
+    BadgeRepository.evaluate() when a session, streak or profile write
+    crosses the badge's threshold; never recomputed on read.
+    """
+    __tablename__ = "user_badges"
+
+    user_id = Column(String(32), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    badge_id = Column(String(40), nullable=False)
+    awarded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Also the per-user lookup index behind /badges/*
+        UniqueConstraint("user_id", "badge_id", name="uq_user_badges_user_badge"),
+    )
+
+class BadgeStat(Base):
+    """
+    How many users hold each badge, for rarity percentages. Bumped atomically
+    alongside each award; the "_users" row counts registered users (the denominator).
+    """
+    __tablename__ = "badge_stats"
+
+    badge_id = Column(String(40), nullable=False, unique=True)
+    earned_count = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,14 @@
+# app/models/counter_batch.py
+from sqlalchemy import Column, String
+from .base import Base
+
+class AppliedCounterBatch(Base):
+    """
+    Ledger of write-behind counter batches (counter_service) already applied.
+    The batch's row is inserted in the same transaction as its counter
+    updates, so a batch replayed after a crash is recognised and skipped.
+    Rows are only needed until the batch leaves Redis; the daily sweep purges old ones.
+    """
+    __tablename__ = "applied_counter_batches"
+
+    batch_id = Column(String(64), nullable=False, unique=True)
@@ -1,5 +1,6 @@
 # app/models/interview_session.py
-from sqlalchemy import Column, String, Text, Float, JSON, ForeignKey, Integer, Date
+from sqlalchemy import Column, String, Text, Float, JSON, ForeignKey, Integer, Date, Index, Boolean, UniqueConstraint
+from sqlalchemy.orm import deferred
 from .base import Base
 
 class InterviewSession(Base):
@@ -14,7 +15,36 @@ class InterviewSession(Base):
     # Final AI Evaluation
     overall_score = Column(Float, default=0.0)
     per_category_scores = Column(JSON, nullable=True) # All 12 param scores
-    conversation_history = Column(JSON, nullable=True)
+    # Heavy payload columns are deferred as one group: list queries never read them,
+    # detail views load them with options(undefer_group("payload")) in one extra SELECT.
+    conversation_history = deferred(Column(JSON, nullable=True), group="payload")
+
+    # Single-answer sessions (voice / behavioral)
+    session_type = Column(String(30), default="mock", server_default="mock", nullable=False)
+    question_id = Column(String(64), nullable=True)
+    question_text = Column(Text, nullable=True)
+    question_type = Column(String(50), nullable=True)
+    answer_text = deferred(Column(Text, nullable=True), group="payload")
+    audio_filename = Column(String(255), nullable=True)  # random per session, served under /recordings
+    audio_sha256 = Column(String(64), nullable=True)     # content hash, for deduplicating uploads
+    duration_secs = Column(Integer, default=0)
+    word_count = Column(Integer, default=0)
+    grade = Column(String(5), nullable=True)
+    evaluation_json = deferred(Column(JSON, nullable=True), group="payload")
+    minute_logs = deferred(Column(JSON, nullable=True), group="payload")
+    dim_scores = Column(JSON, nullable=True)
+    filler_count = Column(Integer, default=0)
+    vocal_filler_count = Column(Integer, default=0)
+    power_word_count = Column(Integer, default=0)
+    star_fulfilled = Column(Integer, default=0)
+    has_quantified = Column(Boolean, default=False)
+    ai_feedback = deferred(Column(Text, nullable=True), group="payload")
+
+    __table_args__ = (
+        # Keyset pagination (app/utils/pagination.py) seeks on (created_at, id) per filter
+        Index("ix_interview_sessions_user_type_created_id", "user_id", "session_type", "created_at", "id"),
+        Index("ix_interview_sessions_user_created_id", "user_id", "created_at", "id"),
+    )
 
 class PracticeStreak(Base):
     __tablename__ = "practice_streaks"
@@ -22,3 +52,43 @@ class PracticeStreak(Base):
     user_id = Column(String(32), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     date = Column(Date, nullable=False)
     sessions = Column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_practice_streaks_user_id_date", "user_id", "date"),
+    )
+
+class UserStreak(Base):
+    """
+    Per-user streak index derived from practice_streaks.
+    Updated by StreakRepository.record_activity() on every session write.
+    """
+    __tablename__ = "user_streaks"
+
+    user_id = Column(String(32), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
+    current_streak = Column(Integer, default=0)
+    longest_streak = Column(Integer, default=0)
+    last_active_date = Column(Date, nullable=True)
+
+class SessionDailyRollup(Base):
+    """
+    Per (user, day, session_type) aggregates behind /sessions/analytics.
+    Maintained by AnalyticsRepository.record_session() on every session write.
+    """
+    __tablename__ = "session_daily_rollups"
+
+    user_id = Column(String(32), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+    session_type = Column(String(30), nullable=False)
+
+    session_count = Column(Integer, default=0)
+    scored_count = Column(Integer, default=0)
+    score_sum = Column(Float, default=0.0)
+    best_score = Column(Float, nullable=True)
+    filler_total = Column(Integer, default=0)
+    vocal_filler_total = Column(Integer, default=0)
+    dim_sums = Column(JSON, nullable=True)    # {dimension: sum of scores}
+    dim_counts = Column(JSON, nullable=True)  # {dimension: sessions that reported it}
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", "session_type", name="uq_session_daily_rollups_user_day_type"),
+    )
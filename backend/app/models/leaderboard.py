@@ -0,0 +1,30 @@
+# app/models/leaderboard.py
+from sqlalchemy import Column, String, ForeignKey, Float, Integer, Boolean, Index
+from .base import Base
+
+class LeaderboardEntry(Base):
+    """
+    Precomputed ranking stats, one row per user with at least one session.
+    Maintained incrementally on session/profile writes, rebuilt in bulk by
+    LeaderboardRepository.rebuild().
+    """
+    __tablename__ = "leaderboard_entries"
+
+    user_id = Column(String(32), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+    # Denormalized from users so ranking never joins the full user row
+    is_public = Column(Boolean, default=True)
+    college   = Column(String(200), nullable=True)
+
+    total_sessions = Column(Integer, default=0)
+    avg_score      = Column(Float, default=0.0)
+    best_score     = Column(Float, default=0.0)
+    streak_days    = Column(Integer, default=0)
+    rank_score     = Column(Float, default=0.0)
+
+    __table_args__ = (
+        Index("ix_leaderboard_public_rank_score", "is_public", "rank_score"),
+        Index("ix_leaderboard_public_avg_score", "is_public", "avg_score"),
+        Index("ix_leaderboard_public_streak_days", "is_public", "streak_days"),
+        Index("ix_leaderboard_public_total_sessions", "is_public", "total_sessions"),
+    )
@@ -1,5 +1,5 @@
 # app/models/post.py
-from sqlalchemy import Column, String, ForeignKey, Text, Integer
+from sqlalchemy import Column, String, ForeignKey, Text, Integer, Float, Index
 from .base import Base
 
 class Post(Base):
@@ -17,3 +17,36 @@ class Post(Base):
     upvotes = Column(Integer, default=0)
     downvotes = Column(Integer, default=0)
     view_count = Column(Integer, default=0)
+    # Ranking columns, maintained by PostRepository.apply_counter_deltas
+    score = Column(Integer, default=0, server_default="0", nullable=False)  # upvotes - downvotes
+    hot_score = Column(Float, default=0.0, server_default="0", nullable=False)
+
+    # Feed pages seek on (created_at, id); one index per filter so any filter
+    # combination can start from its most selective column.
+    __table_args__ = (
+        Index("ix_posts_created_id", "created_at", "id"),
+        Index("ix_posts_company_created_id", "company", "created_at", "id"),
+        Index("ix_posts_role_created_id", "role", "created_at", "id"),
+        Index("ix_posts_round_type_created_id", "round_type", "created_at", "id"),
+        Index("ix_posts_flair_created_id", "flair", "created_at", "id"),
+        # "hot" and "top" feeds seek on (score column, id)
+        Index("ix_posts_hot_score_id", "hot_score", "id"),
+        Index("ix_posts_score_id", "score", "id"),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "title": self.title,
+            "body": self.body,
+            "company": self.company,
+            "role": self.role,
+            "round_type": self.round_type,
+            "flair": self.flair,
+            "upvotes": self.upvotes or 0,
+            "downvotes": self.downvotes or 0,
+            "view_count": self.view_count or 0,
+            "score": self.score or 0,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
@@ -0,0 +1,22 @@
+# app/models/refresh_token.py
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index
+from .base import Base
+
+class RefreshToken(Base):
+    """
+    One issued refresh token. Tokens are stored as a keyed SHA-256 digest, never
+    in the clear. Every rotation stays in the login's family; presenting a token
+    that was already rotated revokes the whole family (reuse detection).
+    """
+    __tablename__ = "refresh_tokens"
+
+    user_id      = Column(String(32), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    family_id    = Column(String(32), nullable=False, index=True)
+    token_digest = Column(String(64), nullable=False, unique=True)
+    expires_at   = Column(DateTime,   nullable=False)
+    used_at      = Column(DateTime,   nullable=True)   # set when rotated
+    revoked_at   = Column(DateTime,   nullable=True)   # logout, password reset or detected reuse
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_active", "user_id", "revoked_at"),
+    )
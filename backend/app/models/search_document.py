@@ -0,0 +1,76 @@
+# app/models/search_document.py
+"""
+One row per searchable item: community posts and comments, DSA problems and
+the static question banks. Rows are written by SearchIndexer in the same
+transaction as the item they mirror.
+
+The full-text index itself lives outside the ORM and is dialect-specific:
+- PostgreSQL: a generated, weighted `search_vector tsvector` column + GIN index.
+- SQLite: an external-content FTS5 table `search_fts` kept in sync by triggers.
+Both are created by the migration, and by the DDL hooks below for create_all().
+"""
+from sqlalchemy import Column, String, Text, Integer, Index, UniqueConstraint, DDL, event
+from .base import Base
+
+DOC_TYPES = ("post", "comment", "problem", "question", "behavioral")
+
+# Objects the autogenerate diff must not touch (see alembic/env.py)
+UNMANAGED_SEARCH_OBJECTS = {"search_vector", "ix_search_documents_vector", "search_fts"}
+
+SQLITE_SEARCH_DDL = [
+    # porter stemming, diacritic folding, and prefix indexes so "kuber*" is a range scan
+    """CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+        title, body, content='search_documents', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS search_documents_ai AFTER INSERT ON search_documents BEGIN
+        INSERT INTO search_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_documents_ad AFTER DELETE ON search_documents BEGIN
+        INSERT INTO search_fts(search_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_documents_au AFTER UPDATE ON search_documents BEGIN
+        INSERT INTO search_fts(search_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO search_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+]
+
+POSTGRES_SEARCH_DDL = [
+    # Title matches weigh more than body matches in ts_rank_cd
+    """ALTER TABLE search_documents ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX ix_search_documents_vector ON search_documents USING gin (search_vector)",
+]
+
+
+class SearchDocument(Base):
+    __tablename__ = "search_documents"
+
+    # Integer key: it is the FTS5 rowid on SQLite, which must be stable across VACUUM
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    doc_type = Column(String(20), nullable=False)   # one of DOC_TYPES
+    ref_id = Column(String(64), nullable=False)     # id of the source row / static item
+    post_id = Column(String(32), nullable=True)     # comments: the post they belong to
+    title = Column(String(300), nullable=False)
+    body = Column(Text, nullable=True)
+
+    # Facets
+    company = Column(String(100), nullable=True)
+    round_type = Column(String(50), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("doc_type", "ref_id", name="uq_search_documents_doc"),
+        Index("ix_search_documents_company", "company"),
+        Index("ix_search_documents_round_type", "round_type"),
+    )
+
+
+for _stmt in SQLITE_SEARCH_DDL:
+    event.listen(SearchDocument.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+for _stmt in POSTGRES_SEARCH_DDL:
+    event.listen(SearchDocument.__table__, "after_create", DDL(_stmt).execute_if(dialect="postgresql"))
+event.listen(SearchDocument.__table__, "before_drop",
+             DDL("DROP TABLE IF EXISTS search_fts").execute_if(dialect="sqlite"))
@@ -1,8 +1,13 @@
 # app/models/study_plan.py
-from sqlalchemy import Column, String, Float, ForeignKey, JSON, Date
+from sqlalchemy import Column, String, Float, ForeignKey, JSON, Date, DateTime, Integer
 from .base import Base
 
 class ReadinessScore(Base):
+    """
+    Materialized readiness per user. Writes that affect it mark the row dirty
+    (ReadinessRepository.mark_dirty); readiness_refresher recomputes dirty
+    rows in the background, so reads never write.
+    """
     __tablename__ = "readiness_scores"
 
     user_id = Column(String(32), ForeignKey("users.id"), unique=True)
@@ -18,6 +23,12 @@ class ReadinessScore(Base):
     
     breakdown = Column(JSON, nullable=True) # Detailed stats
 
+    # Dirty-flag recomputation: dirty_since is the first unprocessed write (NULL = clean),
+    # version counts writes so a recompute racing a newer write leaves the row dirty
+    dirty_since = Column(DateTime, nullable=True, index=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    computed_at = Column(DateTime, nullable=True)
+
 class StudyPlan(Base):
     __tablename__ = "study_plans"
 
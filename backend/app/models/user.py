@@ -11,8 +11,7 @@ class User(Base):
     password_hash = Column(String(255),  nullable=False)
     role          = Column(String(20),   default="user", index=True)  # user, admin, moderator
     
-    # Session Management
-    hashed_refresh_token = Column(String(255), nullable=True)
+    # Session Management: refresh tokens live in refresh_tokens (RefreshToken)
     
     # Profile Information
     bio              = Column(Text,          nullable=True)
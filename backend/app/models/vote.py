@@ -1,5 +1,5 @@
 # app/models/vote.py
-from sqlalchemy import Column, String, ForeignKey, Integer
+from sqlalchemy import Column, String, ForeignKey, Integer, UniqueConstraint
 from .base import Base
 
 class Vote(Base):
@@ -8,3 +8,8 @@ class Vote(Base):
     user_id = Column(String(32), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     post_id = Column(String(32), ForeignKey("posts.id", ondelete="CASCADE"), nullable=False, index=True)
     vote_type = Column(Integer, default=1) # +1 or -1
+
+    __table_args__ = (
+        # One vote per user per post; PostRepository.vote inserts ON CONFLICT DO NOTHING against it
+        UniqueConstraint("user_id", "post_id", name="uq_votes_user_post"),
+    )
@@ -0,0 +1,177 @@
+# app/repositories/analytics_repository.py
+from typing import Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import case, insert
+from app.models.interview_session import InterviewSession, SessionDailyRollup
+from app.repositories.base_repository import upsert_insert
+from app.repositories.platform_repository import PlatformCounterRepository
+from app.repositories.session_repository import SessionRepository
+import datetime
+
+# Only the columns the rollup needs — never the JSON transcripts/evaluations
+_SOURCE_COLUMNS = (
+    InterviewSession.user_id,
+    InterviewSession.session_type,
+    InterviewSession.created_at,
+    InterviewSession.overall_score,
+    InterviewSession.filler_count,
+    InterviewSession.vocal_filler_count,
+    InterviewSession.dim_scores,
+)
+
+
+def _empty_bucket(user_id: str, day: datetime.date, session_type: str) -> dict:
+    return {
+        "user_id": user_id, "day": day, "session_type": session_type,
+        "session_count": 0, "scored_count": 0, "score_sum": 0.0, "best_score": None,
+        "filler_total": 0, "vocal_filler_total": 0, "dim_sums": {}, "dim_counts": {},
+    }
+
+
+def _add_to_bucket(bucket: dict, row) -> dict:
+    bucket["session_count"] += 1
+    if row.overall_score is not None:
+        bucket["scored_count"] += 1
+        bucket["score_sum"] += row.overall_score
+        best = bucket["best_score"]
+        bucket["best_score"] = row.overall_score if best is None else max(best, row.overall_score)
+    bucket["filler_total"] += row.filler_count or 0
+    bucket["vocal_filler_total"] += row.vocal_filler_count or 0
+    if row.dim_scores:
+        sums, counts = dict(bucket["dim_sums"] or {}), dict(bucket["dim_counts"] or {})
+        for dim, score in row.dim_scores.items():
+            sums[dim] = sums.get(dim, 0) + score
+            counts[dim] = counts.get(dim, 0) + 1
+        bucket["dim_sums"], bucket["dim_counts"] = sums, counts
+    return bucket
+
+
+def _session_day(created_at) -> datetime.date:
+    return (created_at or datetime.datetime.now()).date()
+
+
+class AnalyticsRepository:
+    """
+    Daily session rollups. Writes go through record_session()/remove_session();
+    analytics reads at most one small row per (day, session_type) in the window.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _bucket_row(self, user_id: str, day: datetime.date, session_type: str) -> Optional[SessionDailyRollup]:
+        return self.db.query(SessionDailyRollup).filter_by(
+            user_id=user_id, day=day, session_type=session_type
+        ).first()
+
+    # ── Writes ───────────────────────────────────────────────────
+    def record_session(self, session: InterviewSession, commit: bool = True):
+        """
+        Fold one newly written session into its day's rollup row and the platform
+        counters. Call it with commit=False after flushing the session, then
+        commit once, so the row and its counts land in one transaction.
+
+        One upsert creates or increments the row, so concurrent writers for the
+        same day never race on the insert. Dimension sums are JSON and can't be
+        added in SQL; they are merged afterwards, under the row lock the upsert holds.
+        """
+        day = _session_day(session.created_at)
+        session_type = session.session_type or "mock"
+        bucket = _add_to_bucket(_empty_bucket(session.user_id, day, session_type), session)
+        dim_sums, dim_counts = bucket.pop("dim_sums"), bucket.pop("dim_counts")
+
+        stmt = upsert_insert(self.db)(SessionDailyRollup).values(**bucket)
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "day", "session_type"],
+            set_={
+                **{field: getattr(SessionDailyRollup, field) + getattr(stmt.excluded, field)
+                   for field in ("session_count", "scored_count", "score_sum", "filler_total", "vocal_filler_total")},
+                "best_score": case(
+                    (SessionDailyRollup.best_score.is_(None), stmt.excluded.best_score),
+                    (stmt.excluded.best_score > SessionDailyRollup.best_score, stmt.excluded.best_score),
+                    else_=SessionDailyRollup.best_score,
+                ),
+            },
+        ))
+
+        if dim_sums:
+            row = self.db.query(SessionDailyRollup).filter_by(
+                user_id=session.user_id, day=day, session_type=session_type
+            ).populate_existing().one()
+            sums, counts = dict(row.dim_sums or {}), dict(row.dim_counts or {})
+            for dim in dim_sums:
+                sums[dim] = sums.get(dim, 0) + dim_sums[dim]
+                counts[dim] = counts.get(dim, 0) + dim_counts[dim]
+            row.dim_sums, row.dim_counts = sums, counts
+        PlatformCounterRepository(self.db).record_session(session, commit=False)
+
+        if commit:
+            self.db.commit()
+
+    def refresh_bucket(self, user_id: str, day: datetime.date, session_type: str, commit: bool = True):
+        """Recompute one day's row from its sessions (after a delete, best_score can't be decremented)."""
+        start = datetime.datetime.combine(day, datetime.time.min)
+        sessions = self.db.query(*_SOURCE_COLUMNS).filter(
+            InterviewSession.user_id == user_id,
+            InterviewSession.session_type == session_type,
+            InterviewSession.created_at >= start,
+            InterviewSession.created_at < start + datetime.timedelta(days=1),
+        ).all()
+
+        row = self._bucket_row(user_id, day, session_type)
+        if not sessions:
+            if row:
+                self.db.delete(row)
+        else:
+            bucket = _empty_bucket(user_id, day, session_type)
+            for s in sessions:
+                _add_to_bucket(bucket, s)
+            if not row:
+                self.db.add(SessionDailyRollup(**bucket))
+            else:
+                for field, value in bucket.items():
+                    setattr(row, field, value)
+
+        if commit:
+            self.db.commit()
+
+    def remove_session(self, session: InterviewSession, commit: bool = True):
+        """Call after the session row has been deleted (flushed or committed)."""
+        PlatformCounterRepository(self.db).remove_session(session, commit=False)
+        self.refresh_bucket(session.user_id, _session_day(session.created_at), session.session_type or "mock", commit)
+
+    def rebuild(self, user_id: Optional[str] = None, batch_size: int = 5000) -> int:
+        """Recompute rollups from interview_sessions (backfill / repair), streaming slim rows."""
+        query = self.db.query(*_SOURCE_COLUMNS)
+        if user_id:
+            query = query.filter(InterviewSession.user_id == user_id)
+
+        buckets: dict = {}
+        for s in query.execution_options(yield_per=batch_size):
+            day = _session_day(s.created_at)
+            key = (s.user_id, day, s.session_type or "mock")
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _empty_bucket(*key)
+            _add_to_bucket(bucket, s)
+
+        cleared = self.db.query(SessionDailyRollup)
+        if user_id:
+            cleared = cleared.filter(SessionDailyRollup.user_id == user_id)
+        cleared.delete(synchronize_session=False)
+
+        rows = list(buckets.values())
+        for i in range(0, len(rows), batch_size):
+            self.db.execute(insert(SessionDailyRollup), rows[i:i + batch_size])
+        self.db.commit()
+        return len(rows)
+
+    # ── Reads ────────────────────────────────────────────────────
+    def window(self, user_id: str, since: datetime.date) -> list:
+        return self.db.query(SessionDailyRollup).filter(
+            SessionDailyRollup.user_id == user_id,
+            SessionDailyRollup.day >= since,
+        ).order_by(SessionDailyRollup.day).all()
+
+    def latest_session(self, user_id: str, session_type: str):
+        """Summary row (SUMMARY_COLUMNS) of the newest session of a type."""
+        return SessionRepository(self.db).latest_summary(user_id, session_type)
@@ -0,0 +1,214 @@
+# app/repositories/badge_repository.py
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, select
+from app.models.badge import BadgeStat, UserBadge
+from app.models.interview_session import SessionDailyRollup, UserStreak
+from app.models.user import User
+from app.repositories.base_repository import upsert_insert
+
+# ── Badge Definitions ─────────────────────────────────────────────────────────
+BADGE_DEFS = [
+    # Streak badges
+    {"id": "streak_3",    "name": "On a Roll",       "emoji": "🔥",  "desc": "3-day practice streak",              "category": "streak"},
+    {"id": "streak_7",    "name": "Week Warrior",     "emoji": "⚡",  "desc": "7-day practice streak",              "category": "streak"},
+    {"id": "streak_30",   "name": "Iron Discipline",  "emoji": "🏅",  "desc": "30-day practice streak",             "category": "streak"},
+
+    # Sessions count
+    {"id": "sessions_5",  "name": "Getting Started",  "emoji": "🚀",  "desc": "Completed 5 sessions",               "category": "sessions"},
+    {"id": "sessions_25", "name": "Committed",        "emoji": "💪",  "desc": "Completed 25 sessions",              "category": "sessions"},
+    {"id": "sessions_50", "name": "Interview Pro",    "emoji": "💻",  "desc": "Completed 50 sessions",              "category": "sessions"},
+    {"id": "sessions_100","name": "Century Club",     "emoji": "💯",  "desc": "Completed 100 sessions",             "category": "sessions"},
+
+    # Score badges
+    {"id": "score_70",    "name": "Rising Star",      "emoji": "⭐",  "desc": "Average score above 70%",            "category": "score"},
+    {"id": "score_80",    "name": "High Achiever",    "emoji": "🌟",  "desc": "Average score above 80%",            "category": "score"},
+    {"id": "score_90",    "name": "Elite Performer",  "emoji": "🏆",  "desc": "Average score above 90%",            "category": "score"},
+
+    # Variety badges
+    {"id": "variety_3",   "name": "Well-Rounded",     "emoji": "🎯",  "desc": "Practiced 3+ different session types","category": "variety"},
+    {"id": "dsa_ace",     "name": "DSA Ace",          "emoji": "🧠",  "desc": "Completed 10 DSA sessions",          "category": "dsa"},
+    {"id": "behavioral_star","name": "Storyteller",   "emoji": "🎭",  "desc": "Completed 10 behavioral sessions",   "category": "behavioral"},
+
+    # First-time badges
+    {"id": "first_session","name": "First Step",      "emoji": "👣",  "desc": "Completed your first session",       "category": "milestone"},
+    {"id": "profile_complete","name": "Profile Pro",  "emoji": "👤",  "desc": "Filled in college, CGPA and LinkedIn","category": "profile"},
+]
+
+# Award rules: badge id -> (write event that can earn it, stat, minimum value)
+BADGE_RULES = {
+    "first_session":    ("session", "total_sessions", 1),
+    "sessions_5":       ("session", "total_sessions", 5),
+    "sessions_25":      ("session", "total_sessions", 25),
+    "sessions_50":      ("session", "total_sessions", 50),
+    "sessions_100":     ("session", "total_sessions", 100),
+    "score_70":         ("session", "avg_score", 70),
+    "score_80":         ("session", "avg_score", 80),
+    "score_90":         ("session", "avg_score", 90),
+    "variety_3":        ("session", "session_types", 3),
+    "dsa_ace":          ("session", "dsa_sessions", 10),
+    "behavioral_star":  ("session", "behavioral_sessions", 10),
+    "streak_3":         ("streak", "longest_streak", 3),
+    "streak_7":         ("streak", "longest_streak", 7),
+    "streak_30":        ("streak", "longest_streak", 30),
+    "profile_complete": ("profile", "profile_complete", 1),
+}
+BADGE_EVENTS = ("session", "streak", "profile")
+
+# badge_stats row counting registered users: the denominator of every rarity
+USERS_COUNTER = "_users"
+
+
+def _session_stats(rows) -> dict:
+    """Badge stats from (session_type, sessions, scored, score_sum) rollup sums."""
+    by_type, scored, score_sum = {}, 0, 0.0
+    for session_type, sessions, scored_count, type_score_sum in rows:
+        by_type[session_type] = (sessions or 0)
+        scored += scored_count or 0
+        score_sum += type_score_sum or 0.0
+    return {
+        "total_sessions": sum(by_type.values()),
+        "avg_score": score_sum / scored if scored else 0,
+        "session_types": sum(1 for n in by_type.values() if n),
+        "dsa_sessions": by_type.get("dsa", 0),
+        "behavioral_sessions": by_type.get("behavioral", 0),
+    }
+
+
+def _profile_complete(college, cgpa, linkedin_url) -> int:
+    return int(bool(college and cgpa and linkedin_url))
+
+
+def _earned(stats: dict, badge_ids: Iterable[str]) -> List[str]:
+    return [b for b in badge_ids if stats.get(BADGE_RULES[b][1], 0) >= BADGE_RULES[b][2]]
+
+
+class BadgeRepository:
+    """
+    Event-driven badge awards. Session, streak and profile writes call
+    evaluate() with what changed; only rules those events can satisfy, and
+    that the user hasn't already met, are checked. Earned badges are stored
+    once in user_badges and counted in badge_stats.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Stats the rules read ─────────────────────────────────────
+    def _stats(self, user_id: str, events: Iterable[str]) -> dict:
+        stats = {}
+        if "session" in events:
+            # Rollups hold one small row per (day, session_type): no session rows are read
+            stats.update(_session_stats(self.db.query(
+                SessionDailyRollup.session_type,
+                func.sum(SessionDailyRollup.session_count),
+                func.sum(SessionDailyRollup.scored_count),
+                func.sum(SessionDailyRollup.score_sum),
+            ).filter(SessionDailyRollup.user_id == user_id).group_by(SessionDailyRollup.session_type).all()))
+        if "streak" in events:
+            stats["longest_streak"] = self.db.query(UserStreak.longest_streak).filter(
+                UserStreak.user_id == user_id).scalar() or 0
+        if "profile" in events:
+            user = self.db.query(User.college, User.cgpa, User.linkedin_url).filter(User.id == user_id).first()
+            stats["profile_complete"] = _profile_complete(*user) if user else 0
+        return stats
+
+    # ── Writes ───────────────────────────────────────────────────
+    def evaluate(self, user_id: str, events: Iterable[str] = BADGE_EVENTS, commit: bool = True) -> List[str]:
+        """Award whatever the user newly qualifies for after `events`; returns the new badge ids."""
+        events = set(events)
+        held = set(self.db.scalars(select(UserBadge.badge_id).where(UserBadge.user_id == user_id)))
+        pending = [b for b, (event, _, _) in BADGE_RULES.items() if event in events and b not in held]
+        if not pending:
+            return []
+        awarded = self.award(user_id, _earned(self._stats(user_id, {BADGE_RULES[b][0] for b in pending}), pending))
+        if commit:
+            self.db.commit()
+        return awarded
+
+    def award(self, user_id: str, badge_ids: List[str]) -> List[str]:
+        """Insert awards that don't exist yet and count them; concurrent awards of one badge count once."""
+        if not badge_ids:
+            return []
+        stmt = upsert_insert(self.db)(UserBadge).values([{"user_id": user_id, "badge_id": b} for b in badge_ids])
+        awarded = list(self.db.scalars(
+            stmt.on_conflict_do_nothing(index_elements=["user_id", "badge_id"]).returning(UserBadge.badge_id)
+        ))
+        self.bump({b: 1 for b in awarded})
+        return awarded
+
+    def bump(self, deltas: Dict[str, int]):
+        """Atomically add to badge_stats counters, creating rows on first use."""
+        if not deltas:
+            return
+        stmt = upsert_insert(self.db)(BadgeStat).values([{"badge_id": b, "earned_count": n} for b, n in deltas.items()])
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["badge_id"],
+            set_={"earned_count": BadgeStat.earned_count + stmt.excluded.earned_count},
+        ))
+
+    def record_user(self, commit: bool = True):
+        """Count a newly registered user toward the rarity denominator."""
+        self.bump({USERS_COUNTER: 1})
+        if commit:
+            self.db.commit()
+
+    def rebuild(self, batch_size: int = 5000) -> int:
+        """
+        Award every badge users qualify for from grouped queries over the
+        maintained tables, then recount badge_stats (backfill / repair).
+        Existing awards keep their original timestamps.
+        """
+        per_user: Dict[str, dict] = {}
+        session_rows = self.db.query(
+            SessionDailyRollup.user_id, SessionDailyRollup.session_type,
+            func.sum(SessionDailyRollup.session_count),
+            func.sum(SessionDailyRollup.scored_count),
+            func.sum(SessionDailyRollup.score_sum),
+        ).group_by(SessionDailyRollup.user_id, SessionDailyRollup.session_type).all()
+        grouped: Dict[str, list] = {}
+        for user_id, *row in session_rows:
+            grouped.setdefault(user_id, []).append(row)
+        for user_id, rows in grouped.items():
+            per_user[user_id] = _session_stats(rows)
+        for user_id, longest in self.db.query(UserStreak.user_id, UserStreak.longest_streak):
+            per_user.setdefault(user_id, {})["longest_streak"] = longest or 0
+        for user_id, college, cgpa, linkedin_url in self.db.query(User.id, User.college, User.cgpa, User.linkedin_url):
+            per_user.setdefault(user_id, {})["profile_complete"] = _profile_complete(college, cgpa, linkedin_url)
+
+        rows = [
+            {"user_id": user_id, "badge_id": badge_id}
+            for user_id, stats in per_user.items()
+            for badge_id in _earned(stats, BADGE_RULES)
+        ]
+        for i in range(0, len(rows), batch_size):
+            self.db.execute(upsert_insert(self.db)(UserBadge).values(rows[i:i + batch_size]).on_conflict_do_nothing(
+                index_elements=["user_id", "badge_id"]))
+
+        counts = dict(self.db.query(UserBadge.badge_id, func.count(UserBadge.id)).group_by(UserBadge.badge_id).all())
+        counts[USERS_COUNTER] = self.db.query(func.count(User.id)).scalar()
+        self.db.query(BadgeStat).delete(synchronize_session=False)
+        self.bump(counts)
+        self.db.commit()
+        return len(rows)
+
+
+class AsyncBadgeRepository:
+    """Read-only lookups on the async session (get_async_db); awards stay on BadgeRepository."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def for_user(self, user_id: str) -> dict:
+        """{badge_id: (holders, awarded_at or None)} — every counter plus this user's awards in one query."""
+        result = await self.db.execute(
+            select(BadgeStat.badge_id, BadgeStat.earned_count, UserBadge.awarded_at).outerjoin(
+                UserBadge, and_(UserBadge.badge_id == BadgeStat.badge_id, UserBadge.user_id == user_id)
+            )
+        )
+        return {badge_id: (count, awarded_at) for badge_id, count, awarded_at in result}
+
+    async def public_profile(self, user_id: str) -> Optional[tuple]:
+        """(name, is_scores_public, is_streak_public) for an active user, else None."""
+        result = await self.db.execute(select(User.name, User.is_scores_public, User.is_streak_public).where(
+            User.id == user_id, User.is_active == True))
+        return result.first()
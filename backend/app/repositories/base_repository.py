@@ -1,10 +1,17 @@
 # app/repositories/base_repository.py
 from typing import TypeVar, Generic, Type, Optional, List, Any
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+
+def upsert_insert(db: Session):
+    """The dialect's insert() construct, which has on_conflict_do_nothing/do_update (Postgres and SQLite)."""
+    return pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
 class BaseRepository(Generic[ModelType]):
     def __init__(self, model: Type[ModelType], db: Session):
         self.model = model
@@ -0,0 +1,29 @@
+# app/repositories/counter_batch_repository.py
+import datetime
+from sqlalchemy.orm import Session
+from app.models.counter_batch import AppliedCounterBatch
+from app.repositories.base_repository import upsert_insert
+
+
+class CounterBatchRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim(self, batch_id: str) -> bool:
+        """
+        Record the batch in the caller's transaction; False if it was already
+        applied. Commit together with the batch's updates.
+        """
+        inserted = self.db.execute(
+            upsert_insert(self.db)(AppliedCounterBatch).values(batch_id=batch_id)
+            .on_conflict_do_nothing(index_elements=["batch_id"]).returning(AppliedCounterBatch.id)
+        ).first()
+        return inserted is not None
+
+    def purge(self, before: datetime.datetime) -> int:
+        """Drop ledger rows older than `before`; long after their batch left Redis."""
+        deleted = self.db.query(AppliedCounterBatch).filter(
+            AppliedCounterBatch.created_at < before
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
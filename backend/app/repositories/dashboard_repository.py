@@ -1,76 +1,70 @@
 # app/repositories/dashboard_repository.py
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.models.interview_session import InterviewSession, PracticeStreak
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, true
+from app.models.interview_session import InterviewSession, PracticeStreak, UserStreak
 from app.models.evaluation_session import EvaluationSession
 from app.models.resume_scan import ResumeScan
-from app.models.user import User
+from app.models.study_plan import ReadinessScore
+from app.repositories.readiness_repository import readiness_payload
+from app.repositories.streak_repository import effective_streak
 import datetime
 
 class DashboardRepository:
-    def __init__(self, db: Session):
+    """Read side of the dashboard on the async session (get_async_db)."""
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_weekly_stats(self, user_id: str):
-        seven_days_ago = datetime.date.today() - datetime.timedelta(days=7)
-        
-        # Sessions per day
-        sessions = self.db.query(
-            func.date(PracticeStreak.date).label('day'),
-            func.sum(PracticeStreak.sessions).label('count')
-        ).filter(
+    async def get_dashboard(self, user_id: str, days: int = 70) -> dict:
+        """
+        Everything the dashboard shows in one statement: a one-row `totals` CTE
+        (evaluation average, session count, latest ATS), outer-joined to the
+        user's streak and readiness rows and to the calendar CTE. The header
+        columns repeat on each of the at most `days` calendar rows; the weekly
+        chart is the last seven days of the calendar.
+        """
+        today = datetime.date.today()
+        totals = select(
+            select(func.avg(EvaluationSession.overall_score)).where(
+                EvaluationSession.user_id == user_id
+            ).scalar_subquery().label("avg_score"),
+            select(func.count(InterviewSession.id)).where(
+                InterviewSession.user_id == user_id
+            ).scalar_subquery().label("mock_count"),
+            select(ResumeScan.ats_score).where(
+                ResumeScan.user_id == user_id
+            ).order_by(ResumeScan.created_at.desc()).limit(1).scalar_subquery().label("ats_score"),
+        ).cte("totals")
+        calendar = select(PracticeStreak.date, PracticeStreak.sessions).where(
             PracticeStreak.user_id == user_id,
-            PracticeStreak.date >= seven_days_ago
-        ).group_by(func.date(PracticeStreak.date)).all()
-        
-        return {str(s.day): s.count for s in sessions}
+            PracticeStreak.date >= today - datetime.timedelta(days=days),
+        ).cte("calendar")
+
+        rows = (await self.db.execute(
+            select(
+                totals.c.avg_score, totals.c.mock_count, totals.c.ats_score,
+                UserStreak.current_streak, UserStreak.last_active_date,
+                ReadinessScore, calendar.c.date, calendar.c.sessions,
+            ).select_from(totals)
+            .outerjoin(UserStreak, UserStreak.user_id == user_id)
+            .outerjoin(ReadinessScore, ReadinessScore.user_id == user_id)
+            .outerjoin(calendar, true())
+        )).all()
+
+        head = rows[0]
+        # Same rule as StreakRepository.get_current_streak
+        streak = effective_streak(head.current_streak, head.last_active_date, today)
+        streak_calendar = {str(r.date): r.sessions for r in rows if r.date is not None}
+        week_start = str(today - datetime.timedelta(days=7))
 
-    def get_overall_stats(self, user_id: str):
-        # Average Evaluation Score
-        avg_score = self.db.query(func.avg(EvaluationSession.overall_score)).filter(
-            EvaluationSession.user_id == user_id
-        ).scalar() or 0.0
-        
-        # Total Mocks
-        mock_count = self.db.query(func.count(InterviewSession.id)).filter(
-            InterviewSession.user_id == user_id
-        ).scalar() or 0
-        
-        # Latest ATS Score
-        latest_ats = self.db.query(ResumeScan.ats_score).filter(
-            ResumeScan.user_id == user_id
-        ).order_by(ResumeScan.created_at.desc()).first()
-        ats_score = latest_ats[0] if latest_ats else 0.0
-        
-        # Current Streak
-        # (Simplified: check consecutive days from today backwards)
-        streak = 0
-        today = datetime.date.today()
-        for i in range(100):
-            d = today - datetime.timedelta(days=i)
-            exists = self.db.query(PracticeStreak).filter(
-                PracticeStreak.user_id == user_id,
-                PracticeStreak.date == d,
-                PracticeStreak.sessions > 0
-            ).first()
-            if exists:
-                streak += 1
-            else:
-                if i > 0: # Only break if not today (might work today later)
-                    break
-        
         return {
-            "avg_score": round(avg_score, 1),
-            "mock_count": mock_count,
-            "ats_score": round(ats_score, 1),
-            "streak": streak
+            "stats": {
+                "avg_score": round(head.avg_score or 0.0, 1),
+                "mock_count": head.mock_count or 0,
+                "ats_score": round(head.ats_score or 0.0, 1),
+                "streak": streak,
+            },
+            "weekly": {day: n for day, n in streak_calendar.items() if day >= week_start},
+            "calendar": streak_calendar,
+            # Materialized by the readiness refresher; a dashboard view never writes
+            "readiness": readiness_payload(head.ReadinessScore),
         }
-
-    def get_streak_calendar(self, user_id: str, days: int = 70):
-        start_date = datetime.date.today() - datetime.timedelta(days=days)
-        streaks = self.db.query(PracticeStreak).filter(
-            PracticeStreak.user_id == user_id,
-            PracticeStreak.date >= start_date
-        ).all()
-        
-        return {str(s.date): s.sessions for s in streaks}
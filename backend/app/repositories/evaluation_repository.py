@@ -1,33 +1,34 @@
 # app/repositories/evaluation_repository.py
 from sqlalchemy.orm import Session
 from app.models.evaluation_session import EvaluationSession
-from app.models.interview_session import PracticeStreak
-import datetime
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.repositories.readiness_repository import ReadinessRepository
+from app.repositories.streak_repository import StreakRepository
+from app.services.data_version import dashboard_versions
 
 class EvaluationRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def create_session(self, data: dict):
+        """
+        Insert once: a retried job passes the same id and gets the stored row back.
+        The streak, leaderboard, badge and readiness writes commit with the row.
+        """
+        if data.get("id"):
+            existing = self.db.query(EvaluationSession).filter_by(id=data["id"]).first()
+            if existing:
+                return existing
         session = EvaluationSession(**data)
         self.db.add(session)
+        StreakRepository(self.db).record_activity(session.user_id, commit=False)
+        LeaderboardRepository(self.db).refresh_user(session.user_id, commit=False)
+        BadgeRepository(self.db).evaluate(session.user_id, ["streak"], commit=False)
+        ReadinessRepository(self.db).mark_dirty(session.user_id, commit=False)
         self.db.commit()
+        dashboard_versions.bump(session.user_id)
         self.db.refresh(session)
-        
-        # Update streak
-        today = datetime.date.today()
-        streak = self.db.query(PracticeStreak).filter_by(
-            user_id=session.user_id, 
-            date=today
-        ).first()
-        
-        if streak:
-            streak.sessions += 1
-        else:
-            streak = PracticeStreak(user_id=session.user_id, date=today, sessions=1)
-            self.db.add(streak)
-        
-        self.db.commit()
         return session
 
     def get_user_history(self, user_id: str, limit: int = 10):
@@ -0,0 +1,163 @@
+# app/repositories/leaderboard_repository.py
+import datetime
+from typing import Iterable, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, desc, insert, or_, select
+from app.models.leaderboard import LeaderboardEntry
+from app.models.interview_session import InterviewSession, UserStreak
+from app.models.user import User
+from app.repositories.streak_repository import StreakRepository
+
+SORT_COLUMNS = {
+    "rank_score": LeaderboardEntry.rank_score,
+    "avg_score": LeaderboardEntry.avg_score,
+    "streak_days": LeaderboardEntry.streak_days,
+    "total_sessions": LeaderboardEntry.total_sessions,
+}
+
+
+def compute_rank_score(avg_score: float, streak: int, total: int) -> float:
+    """Weighted ranking formula shared by incremental refresh and bulk rebuild."""
+    return round(avg_score * 0.5 + min(streak, 30) * 1.5 + min(total, 50) * 0.3, 1)
+
+
+class LeaderboardRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Set-based stat computation ───────────────────────────────
+    def _session_aggregates(self, user_ids: Optional[Iterable[str]] = None) -> dict:
+        query = self.db.query(
+            InterviewSession.user_id,
+            func.count(InterviewSession.id),
+            func.avg(InterviewSession.overall_score),
+            func.max(InterviewSession.overall_score),
+        )
+        if user_ids is not None:
+            query = query.filter(InterviewSession.user_id.in_(list(user_ids)))
+        rows = query.group_by(InterviewSession.user_id).all()
+        return {
+            user_id: (total, round(avg or 0, 1), round(best or 0, 1))
+            for user_id, total, avg, best in rows
+        }
+
+    def _build_row(self, user_id: str, aggregates: tuple, streak: int, is_public: bool, college: Optional[str]) -> dict:
+        total, avg_score, best_score = aggregates
+        return {
+            "user_id": user_id,
+            "is_public": bool(is_public),
+            "college": college,
+            "total_sessions": total,
+            "avg_score": avg_score,
+            "best_score": best_score,
+            "streak_days": streak,
+            "rank_score": compute_rank_score(avg_score, streak, total),
+        }
+
+    # ── Maintenance ──────────────────────────────────────────────
+    def refresh_user(self, user_id: str, commit: bool = True) -> Optional[LeaderboardEntry]:
+        """Recompute a single user's entry. Called from session, streak and profile writes."""
+        entry = self.db.query(LeaderboardEntry).filter_by(user_id=user_id).first()
+        aggregates = self._session_aggregates([user_id]).get(user_id)
+        user = self.db.query(User.is_scores_public, User.college).filter(User.id == user_id).first()
+
+        if not aggregates or not user:
+            # Only users with at least one session are ranked
+            if entry:
+                self.db.delete(entry)
+                if commit:
+                    self.db.commit()
+            return None
+
+        streak = StreakRepository(self.db).get_current_streak(user_id)
+        row = self._build_row(user_id, aggregates, streak, user.is_scores_public, user.college)
+        if not entry:
+            entry = LeaderboardEntry(**row)
+            self.db.add(entry)
+        else:
+            for field, value in row.items():
+                setattr(entry, field, value)
+
+        if commit:
+            self.db.commit()
+        return entry
+
+    def rebuild(self, batch_size: int = 5000) -> int:
+        """Recompute every entry from a handful of grouped queries."""
+        aggregates = self._session_aggregates()
+        streaks = StreakRepository(self.db).get_current_streaks()
+        users = self.db.query(User.id, User.is_scores_public, User.college).filter(
+            User.id.in_(list(aggregates.keys()))
+        ).all() if aggregates else []
+
+        rows = [
+            self._build_row(u.id, aggregates[u.id], streaks.get(u.id, 0), u.is_scores_public, u.college)
+            for u in users
+        ]
+
+        self.db.query(LeaderboardEntry).delete(synchronize_session=False)
+        for i in range(0, len(rows), batch_size):
+            self.db.execute(insert(LeaderboardEntry), rows[i:i + batch_size])
+        self.db.commit()
+        return len(rows)
+
+    def expire_streaks(self, today: datetime.date) -> int:
+        """
+        A streak lapses with no write at all, so entries still counting one
+        after a day without practice are zeroed and re-ranked. Run once a day.
+        """
+        entries = self.db.query(LeaderboardEntry).outerjoin(
+            UserStreak, UserStreak.user_id == LeaderboardEntry.user_id
+        ).filter(
+            LeaderboardEntry.streak_days > 0,
+            or_(UserStreak.last_active_date == None,
+                UserStreak.last_active_date < today - datetime.timedelta(days=1)),
+        ).all()
+        for entry in entries:
+            entry.streak_days = 0
+            entry.rank_score = compute_rank_score(entry.avg_score, 0, entry.total_sessions)
+        self.db.commit()
+        return len(entries)
+
+
+class AsyncLeaderboardRepository:
+    """Read-only lookups on the async session (get_async_db); maintenance stays on LeaderboardRepository."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def top(self, limit: int = 50, sort_by: str = "rank_score", college: Optional[str] = None) -> list:
+        sort_col = SORT_COLUMNS.get(sort_by, LeaderboardEntry.rank_score)
+        query = select(
+            LeaderboardEntry,
+            User.name, User.cgpa, User.target_role, User.linkedin_url, User.github_url,
+        ).join(User, User.id == LeaderboardEntry.user_id).where(LeaderboardEntry.is_public == True)
+        if college:
+            query = query.where(LeaderboardEntry.college.ilike(f"%{college}%"))
+        result = await self.db.execute(query.order_by(desc(sort_col), desc(LeaderboardEntry.rank_score)).limit(limit))
+        return result.all()
+
+    async def get_entry(self, user_id: str) -> Optional[LeaderboardEntry]:
+        return await self.db.scalar(select(LeaderboardEntry).filter_by(user_id=user_id))
+
+    async def rank_of(self, entry: LeaderboardEntry) -> Optional[int]:
+        if not entry or not entry.is_public:
+            return None
+        ahead = await self.db.scalar(select(func.count(LeaderboardEntry.id)).where(
+            LeaderboardEntry.is_public == True,
+            LeaderboardEntry.rank_score > entry.rank_score,
+        )) or 0
+        return ahead + 1
+
+    async def count_ranked(self) -> int:
+        return await self.db.scalar(select(func.count(LeaderboardEntry.id)).where(
+            LeaderboardEntry.is_public == True
+        )) or 0
+
+    async def colleges(self) -> list:
+        result = await self.db.scalars(select(User.college).where(
+            User.college != None,
+            User.college != "",
+            User.is_scores_public == True
+        ).distinct())
+        return sorted([c for c in result if c])
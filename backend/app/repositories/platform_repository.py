@@ -0,0 +1,155 @@
+# app/repositories/platform_repository.py
+from typing import Dict, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, text
+from app.models.analytics import AnalyticsEvent, PlatformCounter
+from app.models.interview_session import InterviewSession
+from app.models.user import User
+from app.repositories.base_repository import upsert_insert
+from app.repositories.counter_batch_repository import CounterBatchRepository
+
+# Counter names in platform_counters
+USERS = "users"
+SESSIONS = "sessions"
+SESSION_TYPE_PREFIX = "sessions:"
+SCORES = "scores"  # value: scored sessions, total: sum of their overall_score
+EVENTS = "events"
+
+Counts = Dict[str, Tuple[int, float]]  # name -> (value delta or count, total delta or sum)
+
+
+def _session_deltas(session: InterviewSession, sign: int) -> Counts:
+    deltas = {
+        SESSIONS: (sign, 0.0),
+        SESSION_TYPE_PREFIX + (session.session_type or "mock"): (sign, 0.0),
+    }
+    if session.overall_score is not None:
+        deltas[SCORES] = (sign, sign * session.overall_score)
+    return deltas
+
+
+def platform_payload(counters: Counts) -> dict:
+    """The /analytics/platform response from a counters snapshot."""
+    scored, score_sum = counters.get(SCORES, (0, 0.0))
+    return {
+        "total_users": counters.get(USERS, (0, 0.0))[0],
+        "total_sessions": counters.get(SESSIONS, (0, 0.0))[0],
+        "total_events": counters.get(EVENTS, (0, 0.0))[0],
+        "sessions_by_type": {
+            name[len(SESSION_TYPE_PREFIX):]: value
+            for name, (value, _) in sorted(counters.items())
+            if name.startswith(SESSION_TYPE_PREFIX) and value > 0
+        },
+        "avg_score": round(score_sum / scored, 1) if scored else 0,
+    }
+
+
+class PlatformCounterRepository:
+    """
+    Maintained platform totals. User and session writes bump their counters
+    in the same transaction as the row; event counts arrive in batches from
+    the platform_events write-behind buffer. reconcile() recounts everything
+    from the tables (periodically, and after backfills).
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Writes ───────────────────────────────────────────────────
+    def bump(self, deltas: Counts):
+        """Atomically add to counters, creating rows on first use."""
+        deltas = {name: d for name, d in deltas.items() if d[0] or d[1]}
+        if not deltas:
+            return
+        stmt = upsert_insert(self.db)(PlatformCounter).values([
+            {"name": name, "value": value, "total": total} for name, (value, total) in deltas.items()
+        ])
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "value": PlatformCounter.value + stmt.excluded.value,
+                "total": PlatformCounter.total + stmt.excluded.total,
+            },
+        ))
+
+    def record_user(self, commit: bool = True):
+        self.bump({USERS: (1, 0.0)})
+        if commit:
+            self.db.commit()
+
+    def record_session(self, session: InterviewSession, commit: bool = True):
+        self.bump(_session_deltas(session, 1))
+        if commit:
+            self.db.commit()
+
+    def remove_session(self, session: InterviewSession, commit: bool = True):
+        """Call with the deleted row; uses its type and score as they were stored."""
+        self.bump(_session_deltas(session, -1))
+        if commit:
+            self.db.commit()
+
+    def apply_buffered(self, deltas: Dict[str, Dict[str, int]], batch_id: Optional[str] = None):
+        """Apply one CounterBuffer flush: {counter name: {"value": delta}}. A replayed `batch_id` is skipped."""
+        if batch_id and not CounterBatchRepository(self.db).claim(batch_id):
+            self.db.rollback()
+            return
+        self.bump({name: (fields.get("value", 0), 0.0) for name, fields in deltas.items()})
+        self.db.commit()
+
+    # ── Reads ────────────────────────────────────────────────────
+    def snapshot(self) -> Counts:
+        """Every counter in one small read; its cost doesn't grow with the tables."""
+        return {name: (value, total) for name, value, total in
+                self.db.query(PlatformCounter.name, PlatformCounter.value, PlatformCounter.total)}
+
+    # ── Reconciliation ───────────────────────────────────────────
+    def _event_estimate(self) -> Optional[int]:
+        """Planner row estimate for analytics_events on Postgres (no scan); None elsewhere or before ANALYZE."""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return None
+        estimate = self.db.execute(text(
+            "SELECT reltuples FROM pg_class WHERE oid = 'analytics_events'::regclass"
+        )).scalar()
+        return int(estimate) if estimate is not None and estimate >= 0 else None
+
+    def true_counts(self, approximate_events: bool = False) -> Counts:
+        """The counters recomputed from the tables: full scans, so only for reconcile()."""
+        scored, score_sum = self.db.query(
+            func.count(InterviewSession.overall_score), func.sum(InterviewSession.overall_score)
+        ).one()
+        counts = {
+            USERS: (self.db.query(func.count(User.id)).scalar(), 0.0),
+            SESSIONS: (self.db.query(func.count(InterviewSession.id)).scalar(), 0.0),
+            SCORES: (scored, score_sum or 0.0),
+        }
+        for session_type, n in self.db.query(
+            InterviewSession.session_type, func.count(InterviewSession.id)
+        ).group_by(InterviewSession.session_type):
+            counts[SESSION_TYPE_PREFIX + (session_type or "mock")] = (n, 0.0)
+        events = self._event_estimate() if approximate_events else None
+        if events is None:
+            events = self.db.query(func.count(AnalyticsEvent.id)).scalar()
+        counts[EVENTS] = (events, 0.0)
+        return counts
+
+    def reconcile(self, approximate_events: bool = False) -> Dict[str, int]:
+        """
+        Overwrite every counter with its true value and return the drift that
+        was corrected ({name: true - stored}). Writes racing the recount can
+        leave a small error, which the next pass corrects.
+        """
+        stored = self.snapshot()
+        counts = self.true_counts(approximate_events)
+        for name in stored:
+            counts.setdefault(name, (0, 0.0))  # e.g. a session type whose last session was deleted
+        drift = {name: value - stored.get(name, (0, 0.0))[0]
+                 for name, (value, _) in counts.items() if value != stored.get(name, (0, 0.0))[0]}
+
+        stmt = upsert_insert(self.db)(PlatformCounter).values([
+            {"name": name, "value": value, "total": total} for name, (value, total) in counts.items()
+        ])
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"value": stmt.excluded.value, "total": stmt.excluded.total},
+        ))
+        self.db.commit()
+        return drift
@@ -1,40 +1,47 @@
 # app/repositories/post_repository.py
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, func, select, update
 from app.models.post import Post
 from app.models.comment import Comment
 from app.models.vote import Vote
+from app.repositories.base_repository import upsert_insert
+from app.repositories.counter_batch_repository import CounterBatchRepository
+from app.repositories.search_repository import SearchIndexer
+from app.utils.pagination import keyset, page_of
+from app.utils.ranking import hot_score
+import datetime
+
+# Feed sort orders: sort column (None = created_at) and the row attribute the cursor reads
+FEED_SORTS = {
+    "new": (None, "created_at"),
+    "hot": (Post.hot_score, "hot_score"),
+    "top": (Post.score, "score"),
+}
 
 class PostRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def create_post(self, data: dict):
-        post = Post(**data)
+        post = Post(**{**data, "score": 0, "hot_score": hot_score(0, datetime.datetime.now(datetime.timezone.utc))})
         self.db.add(post)
+        self.db.flush()
+        SearchIndexer(self.db).index_post(post)
         self.db.commit()
         self.db.refresh(post)
         return post
 
-    def list_posts(self, company: str = None, role: str = None, round_type: str = None, flair: str = None, limit: int = 20, offset: int = 0):
-        query = self.db.query(Post)
-        if company:
-            query = query.filter(Post.company == company)
-        if role:
-            query = query.filter(Post.role == role)
-        if round_type:
-            query = query.filter(Post.round_type == round_type)
-        if flair:
-            query = query.filter(Post.flair == flair)
-        
-        return query.order_by(desc(Post.created_at)).offset(offset).limit(limit).all()
-
     def get_post(self, post_id: str):
         return self.db.query(Post).filter(Post.id == post_id).first()
 
     def add_comment(self, data: dict):
         comment = Comment(**data)
         self.db.add(comment)
+        self.db.flush()
+        post = self.get_post(comment.post_id)
+        if post:
+            SearchIndexer(self.db).index_comment(comment, post)
         self.db.commit()
         self.db.refresh(comment)
         return comment
@@ -42,29 +49,80 @@ class PostRepository:
     def get_comments(self, post_id: str):
         return self.db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc()).all()
 
-    def vote(self, user_id: str, post_id: str, vote_type: int):
-        # 1. Check if vote exists
-        existing = self.db.query(Vote).filter_by(user_id=user_id, post_id=post_id).first()
-        post = self.get_post(post_id)
-        
-        if existing:
-            # Change vote
-            diff = vote_type - existing.vote_type
-            if vote_type == 1:
-                post.upvotes += 1
-                post.downvotes -= 1
-            else:
-                post.upvotes -= 1
-                post.downvotes += 1
-            existing.vote_type = vote_type
+    def vote(self, user_id: str, post_id: str, vote_type: int) -> dict:
+        """Record a user's vote; returns the counter deltas it causes ({"up": .., "down": ..})."""
+        # Only the request whose row actually lands counts a new vote; racing duplicates insert nothing
+        inserted = self.db.execute(
+            upsert_insert(self.db)(Vote).values(user_id=user_id, post_id=post_id, vote_type=vote_type)
+            .on_conflict_do_nothing(index_elements=["user_id", "post_id"]).returning(Vote.id)
+        ).first()
+        if inserted:
+            deltas = {"up": 1} if vote_type == 1 else {"down": 1}
         else:
-            # New vote
-            vote = Vote(user_id=user_id, post_id=post_id, vote_type=vote_type)
-            self.db.add(vote)
-            if vote_type == 1:
-                post.upvotes += 1
-            else:
-                post.downvotes += 1
-        
+            # Conditional update: repeating (or racing) the same vote changes nothing
+            changed = self.db.execute(
+                update(Vote).where(Vote.user_id == user_id, Vote.post_id == post_id, Vote.vote_type != vote_type)
+                .values(vote_type=vote_type)
+            ).rowcount
+            deltas = {"up": vote_type, "down": -vote_type} if changed else {}
         self.db.commit()
-        return post
+        return deltas
+
+    def apply_counter_deltas(self, deltas: dict, batch_id: str = None):
+        """
+        Apply buffered {post_id: {"up", "down", "views"}} deltas as atomic
+        increments, then re-rank. A `batch_id` that was already applied is skipped.
+        """
+        if batch_id and not CounterBatchRepository(self.db).claim(batch_id):
+            self.db.rollback()
+            return
+        posts = Post.__table__
+        self.db.execute(
+            update(posts).where(posts.c.id == bindparam("b_id")).values(
+                upvotes=func.coalesce(posts.c.upvotes, 0) + bindparam("b_up"),
+                downvotes=func.coalesce(posts.c.downvotes, 0) + bindparam("b_down"),
+                view_count=func.coalesce(posts.c.view_count, 0) + bindparam("b_views"),
+                score=posts.c.score + bindparam("b_up") - bindparam("b_down"),
+            ),
+            [
+                {"b_id": post_id, "b_up": d.get("up", 0), "b_down": d.get("down", 0), "b_views": d.get("views", 0)}
+                for post_id, d in deltas.items()
+            ],
+        )
+
+        voted = [post_id for post_id, d in deltas.items() if d.get("up") or d.get("down")]
+        if voted:
+            rows = self.db.execute(
+                select(posts.c.id, posts.c.score, posts.c.created_at).where(posts.c.id.in_(voted))
+            ).all()
+            self.db.execute(
+                update(posts).where(posts.c.id == bindparam("b_id")).values(hot_score=bindparam("b_hot")),
+                [{"b_id": r.id, "b_hot": hot_score(r.score, r.created_at)} for r in rows],
+            )
+        self.db.commit()
+
+
+class AsyncPostRepository:
+    """Feed reads on the async session (get_async_db); writes stay on PostRepository."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_posts(self, company: str = None, role: str = None, round_type: str = None, flair: str = None,
+                         limit: int = 20, cursor: str = None, include_total: bool = False, sort: str = "new") -> dict:
+        """One feed page in `sort` order (new / hot / top); the next page starts at `next_cursor`."""
+        column, key = FEED_SORTS[sort]
+        query = select(Post)
+        if company:
+            query = query.where(Post.company == company)
+        if role:
+            query = query.where(Post.role == role)
+        if round_type:
+            query = query.where(Post.round_type == round_type)
+        if flair:
+            query = query.where(Post.flair == flair)
+
+        stmt = keyset(query, Post, cursor, limit, self.db.get_bind().dialect.name, column=column)
+        rows = (await self.db.scalars(stmt)).all()
+        posts, next_cursor = page_of(rows, limit, key=key)
+        total = await self.db.scalar(select(func.count()).select_from(query.subquery())) if include_total else None
+        return {"posts": posts, "next_cursor": next_cursor, "has_more": next_cursor is not None, "total": total}
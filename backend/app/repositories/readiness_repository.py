@@ -0,0 +1,148 @@
+# app/repositories/readiness_repository.py
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
+from app.models.evaluation_session import EvaluationSession
+from app.models.interview_session import InterviewSession
+from app.models.resume_scan import ResumeScan
+from app.models.study_plan import ReadinessScore
+from app.repositories.base_repository import upsert_insert
+from app.repositories.streak_repository import StreakRepository
+from app.services.data_version import dashboard_versions
+import datetime
+
+DSA_POINTS = 10.0  # flat until DSA submissions are stored
+
+
+def compute_readiness(stats: dict) -> dict:
+    """
+    Readiness heuristic, 0-100:
+    streak 20% (capped at 30 days), avg evaluation 30%, DSA 20%,
+    latest ATS 15%, sessions 15% (capped at 10).
+    """
+    weights = {
+        "streak": (min(stats["streak"], 30) / 30.0) * 20.0,
+        "evaluation": (stats["avg_score"] / 100.0) * 30.0,
+        "dsa": DSA_POINTS,
+        "ats": (stats["ats_score"] / 100.0) * 15.0,
+        "mock": (min(stats["mock_count"], 10) / 10.0) * 15.0,
+    }
+    return {"score": round(sum(weights.values()), 1), "breakdown": {k: round(v, 1) for k, v in weights.items()}}
+
+
+EMPTY_READINESS = compute_readiness({"streak": 0, "avg_score": 0.0, "ats_score": 0.0, "mock_count": 0})
+
+
+def readiness_payload(row: Optional[ReadinessScore]) -> dict:
+    """API shape of a stored score; users with no activity yet get the zero-stats score."""
+    if row is None:
+        return {**EMPTY_READINESS, "stale": False, "computed_at": None}
+    return {
+        "score": row.total_score,
+        "breakdown": {
+            "streak": row.streak_weight,
+            "evaluation": row.evaluation_weight,
+            "dsa": row.dsa_weight,
+            "ats": row.ats_weight,
+            "mock": row.mock_weight,
+        },
+        # A write landed since computed_at; the refresher will catch up shortly
+        "stale": row.dirty_since is not None or row.computed_at is None,
+        "computed_at": row.computed_at.isoformat() if row.computed_at else None,
+    }
+
+
+class ReadinessRepository:
+    """
+    Maintenance side of readiness_scores. Writes that move the score (sessions,
+    evaluations, DSA submissions, resume scans, streaks) call mark_dirty();
+    the background refresher calls due() and recompute(). Both bump the
+    user's dashboard version once committed; callers passing commit=False
+    bump it themselves after their commit.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Writes ───────────────────────────────────────────────────
+    def mark_dirty(self, user_id: str, commit: bool = True):
+        """Flag the user's score for recompute; one upsert, no reads."""
+        now = datetime.datetime.utcnow()
+        stmt = upsert_insert(self.db)(ReadinessScore).values(user_id=user_id, dirty_since=now, version=1)
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                # Keep the first dirtying write: the debounce window runs from it
+                "dirty_since": func.coalesce(ReadinessScore.dirty_since, stmt.excluded.dirty_since),
+                "version": ReadinessScore.version + 1,
+            },
+        ))
+        if commit:
+            self.db.commit()
+            dashboard_versions.bump(user_id)
+
+    def _stats(self, user_id: str) -> dict:
+        avg_score = self.db.query(func.avg(EvaluationSession.overall_score)).filter(
+            EvaluationSession.user_id == user_id).scalar() or 0.0
+        mock_count = self.db.query(func.count(InterviewSession.id)).filter(
+            InterviewSession.user_id == user_id).scalar() or 0
+        ats_score = self.db.query(ResumeScan.ats_score).filter(ResumeScan.user_id == user_id).order_by(
+            ResumeScan.created_at.desc()).limit(1).scalar() or 0.0
+        return {
+            "avg_score": round(avg_score, 1),
+            "mock_count": mock_count,
+            "ats_score": round(ats_score, 1),
+            "streak": StreakRepository(self.db).get_current_streak(user_id),
+        }
+
+    def recompute(self, user_id: str) -> Optional[ReadinessScore]:
+        """Recompute one score; it stays dirty if another write landed meanwhile."""
+        row = self.db.query(ReadinessScore).filter_by(user_id=user_id).first()
+        if not row:
+            return None
+        seen_version = row.version
+        stats = self._stats(user_id)
+        result = compute_readiness(stats)
+        breakdown = result["breakdown"]
+
+        row.total_score = result["score"]
+        row.streak_weight = breakdown["streak"]
+        row.evaluation_weight = breakdown["evaluation"]
+        row.dsa_weight = breakdown["dsa"]
+        row.ats_weight = breakdown["ats"]
+        row.mock_weight = breakdown["mock"]
+        row.breakdown = {
+            "streak_days": stats["streak"],
+            "avg_interview_score": stats["avg_score"],
+            "latest_ats": stats["ats_score"],
+            "sessions_completed": stats["mock_count"],
+        }
+        row.computed_at = datetime.datetime.utcnow()
+        self.db.flush()
+        self.db.execute(update(ReadinessScore).where(
+            ReadinessScore.user_id == user_id, ReadinessScore.version == seen_version,
+        ).values(dirty_since=None).execution_options(synchronize_session=False))
+        self.db.commit()
+        dashboard_versions.bump(user_id)
+        return row
+
+    # ── Refresher queries ────────────────────────────────────────
+    def due(self, debounce: float, limit: int = 500) -> List[str]:
+        """Users whose first unprocessed write is older than `debounce` seconds, oldest first."""
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(seconds=debounce)
+        return list(self.db.scalars(select(ReadinessScore.user_id).where(
+            ReadinessScore.dirty_since != None, ReadinessScore.dirty_since <= cutoff,
+        ).order_by(ReadinessScore.dirty_since).limit(limit)))
+
+    def expire_streaks(self, today: datetime.date) -> int:
+        """
+        A streak lapses with no write at all, so scores computed before today
+        that counted one are marked dirty once a day.
+        """
+        result = self.db.execute(update(ReadinessScore).where(
+            ReadinessScore.dirty_since == None,
+            ReadinessScore.streak_weight > 0,
+            ReadinessScore.computed_at < datetime.datetime.combine(today, datetime.time.min),
+        ).values(dirty_since=datetime.datetime.utcnow(), version=ReadinessScore.version + 1))
+        self.db.commit()
+        return result.rowcount
+
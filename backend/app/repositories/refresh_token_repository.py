@@ -0,0 +1,70 @@
+# app/repositories/refresh_token_repository.py
+from typing import Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import update
+from app.models.refresh_token import RefreshToken
+from app.core.security import create_refresh_token, token_digest
+from app.core.config import settings
+from .base_repository import BaseRepository
+import datetime
+import uuid
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    def __init__(self, db: Session):
+        super().__init__(RefreshToken, db)
+
+    def issue(self, user_id: str, family_id: Optional[str] = None, commit: bool = True) -> str:
+        """Create a refresh token (new family on login, same family on rotation) and return it."""
+        token = create_refresh_token({"sub": user_id})
+        self.db.add(RefreshToken(
+            user_id=user_id,
+            family_id=family_id or uuid.uuid4().hex,
+            token_digest=token_digest(token),
+            expires_at=datetime.datetime.utcnow() + datetime.timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        ))
+        if commit:
+            self.db.commit()
+        return token
+
+    def get_by_token(self, token: str) -> Optional[RefreshToken]:
+        return self.db.query(RefreshToken).filter(RefreshToken.token_digest == token_digest(token)).first()
+
+    def mark_used(self, record: RefreshToken) -> bool:
+        """Atomically claim a token for rotation; False if it was already used or revoked."""
+        result = self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == record.id, RefreshToken.used_at.is_(None), RefreshToken.revoked_at.is_(None))
+            .values(used_at=datetime.datetime.utcnow())
+        )
+        return result.rowcount == 1
+
+    def revoke_family(self, family_id: str, commit: bool = True):
+        self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.datetime.utcnow())
+        )
+        if commit:
+            self.db.commit()
+
+    def revoke_user(self, user_id: str, commit: bool = True):
+        """Revoke every live token for a user (logout, password reset)."""
+        self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.datetime.utcnow())
+        )
+        if commit:
+            self.db.commit()
+
+    def purge_expired(self, now: Optional[datetime.datetime] = None) -> int:
+        """
+        Delete tokens past expires_at; returns how many. Used, revoked and
+        live rows of the same family are kept until they expire too, so reuse
+        detection still works for any token that could still be presented.
+        """
+        deleted = self.db.query(RefreshToken).filter(
+            RefreshToken.expires_at < (now or datetime.datetime.utcnow())
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
@@ -0,0 +1,258 @@
+# app/repositories/search_repository.py
+"""
+Full-text search over search_documents.
+
+SearchIndexer (sync session) keeps the index current: repositories call it
+in the same transaction as the write they index, and rebuild() backfills
+everything. AsyncSearchRepository (async session) runs queries: every term
+must match, the last one as a prefix ("system desi" finds "system design"),
+results are ranked (BM25 on SQLite FTS5, ts_rank_cd on Postgres), and facet
+counts by company and round come from the same match set. Very broad queries
+are ranked within their newest CANDIDATE_WINDOW matches and report
+total_capped.
+"""
+import re
+from collections import Counter
+from typing import List, Optional
+from sqlalchemy import bindparam, delete, insert, literal, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.comment import Comment
+from app.models.post import Post
+from app.models.problem import Problem
+from app.models.search_document import SearchDocument
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+MAX_TERMS = 8
+FACET_LIMIT = 10
+CANDIDATE_WINDOW = 10_000
+
+
+def parse_terms(q: str) -> List[str]:
+    return [t.lower() for t in _TERM_RE.findall(q or "")][:MAX_TERMS]
+
+
+def fts5_match(terms: List[str]) -> str:
+    """FTS5 MATCH expression: quoted terms ANDed, the last one a prefix."""
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def pg_tsquery(terms: List[str]) -> str:
+    """to_tsquery() input: terms ANDed, the last one a prefix (terms are \\w+ so carry no operators)."""
+    return " & ".join(terms[:-1] + [terms[-1] + ":*"])
+
+
+def make_snippet(body: Optional[str], terms: List[str], words: int = 24) -> str:
+    """~`words` words of body around the first hit, with matched words in <b></b>."""
+    tokens = (body or "").split()
+    hit = re.compile(r"^(\W*)((?:" + "|".join(re.escape(t) for t in terms) + r")\w*)(.*)$", re.IGNORECASE)
+    first = next((i for i, tok in enumerate(tokens) if hit.match(tok)), 0)
+    start = max(0, first - words // 3)
+    window = [hit.sub(r"\1<b>\2</b>\3", tok) for tok in tokens[start:start + words]]
+    return ("… " if start else "") + " ".join(window) + (" …" if start + words < len(tokens) else "")
+
+
+def _static_documents() -> List[dict]:
+    # The banks are module constants next to the routes that serve them
+    from app.routes.behavioral import BEHAVIORAL_QUESTIONS
+    from app.routes.questions import QUESTION_BANK
+
+    docs = []
+    for category, levels in QUESTION_BANK.items():
+        for difficulty, questions in levels.items():
+            for i, question in enumerate(questions):
+                docs.append({
+                    "doc_type": "question", "ref_id": f"{category}:{difficulty}:{i}",
+                    "title": question, "body": f"{category} {difficulty}", "round_type": category,
+                })
+    for q in BEHAVIORAL_QUESTIONS:
+        companies = [c for c in q["companies"] if c != "All"]
+        docs.append({
+            "doc_type": "behavioral", "ref_id": str(q["id"]), "title": q["text"],
+            "body": " ".join(q["companies"]), "round_type": q["type"],
+            "company": companies[0] if len(companies) == 1 else None,
+        })
+    return docs
+
+
+class SearchIndexer:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def upsert(self, doc_type: str, ref_id: str, title: str, body: Optional[str] = None,
+               company: Optional[str] = None, round_type: Optional[str] = None, post_id: Optional[str] = None):
+        """Add or refresh one document; the caller commits."""
+        doc = self.db.query(SearchDocument).filter_by(doc_type=doc_type, ref_id=ref_id).first()
+        if not doc:
+            doc = SearchDocument(doc_type=doc_type, ref_id=ref_id)
+            self.db.add(doc)
+        doc.title = (title or "")[:300]
+        doc.body = body
+        doc.company = company
+        doc.round_type = round_type
+        doc.post_id = post_id
+        return doc
+
+    def remove(self, doc_type: str, ref_id: str):
+        self.db.execute(delete(SearchDocument).where(
+            SearchDocument.doc_type == doc_type, SearchDocument.ref_id == ref_id))
+
+    def index_post(self, post: Post):
+        return self.upsert("post", post.id, post.title, post.body, post.company, post.round_type)
+
+    def index_comment(self, comment: Comment, post: Post):
+        # Comments facet with their post, so "Google" narrows comments too. No title:
+        # the post's title would make every comment match whatever the post matches.
+        return self.upsert("comment", comment.id, "", comment.body, post.company, post.round_type,
+                           post_id=post.id)
+
+    def index_problem(self, problem: Problem):
+        return self.upsert("problem", problem.id, problem.title,
+                           f"{problem.topic} {problem.difficulty}\n{problem.description}", round_type="DSA / Coding")
+
+    def sync_static(self) -> int:
+        """Index the in-code question banks (idempotent; run at startup)."""
+        docs = _static_documents()
+        for d in docs:
+            self.upsert(**d)
+        self.db.commit()
+        return len(docs)
+
+    def rebuild(self) -> int:
+        """Drop and re-derive every document with set-based INSERT ... SELECTs (backfill / repair)."""
+        self.db.execute(delete(SearchDocument))
+        cols = ["doc_type", "ref_id", "title", "body", "company", "round_type", "post_id", "created_at"]
+        self.db.execute(insert(SearchDocument).from_select(cols, select(
+            literal("post"), Post.id, Post.title, Post.body, Post.company, Post.round_type,
+            literal(None), Post.created_at,
+        )))
+        self.db.execute(insert(SearchDocument).from_select(cols, select(
+            literal("comment"), Comment.id, literal(""), Comment.body, Post.company, Post.round_type,
+            Post.id, Comment.created_at,
+        ).join(Post, Post.id == Comment.post_id)))
+        for problem in self.db.query(Problem).yield_per(1000):
+            self.index_problem(problem)
+        if self.db.get_bind().dialect.name == "sqlite":
+            # Merge the FTS b-tree segments written by the bulk insert
+            self.db.execute(text("INSERT INTO search_fts(search_fts) VALUES ('optimize')"))
+        self.db.commit()
+        self.sync_static()
+        return self.db.query(SearchDocument).count()
+
+
+class AsyncSearchRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(self, q: str, doc_types: Optional[List[str]] = None, company: Optional[str] = None,
+                     round_type: Optional[str] = None, limit: int = 20, offset: int = 0,
+                     facets: bool = True) -> dict:
+        terms = parse_terms(q)
+        if not terms:
+            return {"total": 0, "total_capped": False, "results": [], "facets": {"company": [], "round_type": []}}
+
+        if self.db.get_bind().dialect.name == "sqlite":
+            # CROSS JOIN pins the FTS match as the outer loop; otherwise the planner can pick the
+            # doc_type index and re-run the MATCH once per candidate row
+            source = "search_fts CROSS JOIN search_documents d ON d.id = search_fts.rowid"
+            match = "search_fts MATCH :match"
+            rank = "-bm25(search_fts, 4.0, 1.0)"
+            newest = "search_fts.rowid DESC"  # FTS5 walks rowids backwards natively; d.id would sort
+            params = {"match": fts5_match(terms)}
+        else:
+            source = "search_documents d"
+            match = "d.search_vector @@ to_tsquery('english', :match)"
+            rank = "ts_rank_cd(d.search_vector, to_tsquery('english', :match))"
+            newest = "d.id DESC"
+            params = {"match": pg_tsquery(terms)}
+        params["window"] = CANDIDATE_WINDOW
+
+        filters = {"doc_type": None, "company": None, "round_type": None}
+        if doc_types:
+            filters["doc_type"] = "d.doc_type IN :doc_types"
+            params["doc_types"] = list(doc_types)
+        if company:
+            filters["company"] = "d.company = :company"
+            params["company"] = company
+        if round_type:
+            filters["round_type"] = "d.round_type = :round_type"
+            params["round_type"] = round_type
+
+        def hits(skip: Optional[str] = None) -> str:
+            # The newest CANDIDATE_WINDOW matches; ranking, totals and facets never look further,
+            # which bounds a query matching 20% of a million posts to the cost of a narrow one.
+            # Each facet counts with every filter except its own.
+            where = " AND ".join([match] + [f for name, f in filters.items() if f and name != skip])
+            return (f"WITH hits AS (SELECT d.id, d.doc_type, d.ref_id, d.post_id, d.title, d.company, "
+                    f"d.round_type, d.created_at, {rank} AS rank FROM {source} WHERE {where} "
+                    f"ORDER BY {newest} LIMIT :window) ")
+
+        def stmt(sql: str):
+            s = text(sql)
+            return s.bindparams(bindparam("doc_types", expanding=True)) if doc_types else s
+
+        rows = (await self.db.execute(stmt(
+            hits() + "SELECT hits.*, count(*) OVER () AS total FROM hits "
+                     "ORDER BY rank DESC, id DESC LIMIT :limit OFFSET :offset"
+        ), {**params, "limit": limit, "offset": offset})).all()
+        if rows:
+            total = rows[0].total
+        elif offset:
+            total = await self.db.scalar(stmt(hits() + "SELECT count(*) FROM hits"), params)
+        else:
+            total = 0
+
+        facet_counts = {"company": [], "round_type": []}
+        if facets:
+            # Facets whose own filter is unset share the main match set: one grouped pass serves them all
+            shared = [name for name in facet_counts if not filters[name]]
+            if shared:
+                counts = {name: Counter() for name in shared}
+                result = await self.db.execute(stmt(
+                    hits() + f"SELECT {', '.join(shared)}, count(*) AS n FROM hits GROUP BY {', '.join(shared)}"
+                ), params)
+                for r in result:
+                    for name in shared:
+                        if r._mapping[name] is not None:
+                            counts[name][r._mapping[name]] += r.n
+                for name in shared:
+                    facet_counts[name] = [{"value": v, "count": n} for v, n in counts[name].most_common(FACET_LIMIT)]
+            for name in facet_counts:
+                if name in shared:
+                    continue
+                result = await self.db.execute(stmt(
+                    hits(skip=name) + f"SELECT {name} AS value, count(*) AS n FROM hits WHERE {name} IS NOT NULL "
+                                      f"GROUP BY {name} ORDER BY n DESC LIMIT {FACET_LIMIT}"
+                ), params)
+                facet_counts[name] = [{"value": r.value, "count": r.n} for r in result]
+
+        snippets = await self._snippets([r.id for r in rows], terms) if rows else {}
+        return {
+            "total": total,
+            "total_capped": total >= CANDIDATE_WINDOW,
+            "results": [
+                {
+                    "type": r.doc_type,
+                    "id": r.ref_id,
+                    "post_id": r.post_id,
+                    "title": r.title,
+                    "snippet": snippets.get(r.id),
+                    "company": r.company,
+                    "round_type": r.round_type,
+                    "score": round(r.rank, 4),
+                    "created_at": r.created_at.isoformat() if hasattr(r.created_at, "isoformat") else r.created_at,
+                }
+                for r in rows
+            ],
+            "facets": facet_counts,
+        }
+
+    async def _snippets(self, ids: List[int], terms: List[str]) -> dict:
+        """Highlighted body excerpts for one page of results."""
+        # Built here rather than with snippet()/ts_headline(): FTS5 re-runs the whole MATCH
+        # to highlight even a single rowid, which costs more than the search itself.
+        result = await self.db.execute(
+            select(SearchDocument.id, SearchDocument.body).where(SearchDocument.id.in_(ids)))
+        return {r.id: make_snippet(r.body, terms) for r in result}
@@ -0,0 +1,90 @@
+# app/repositories/session_repository.py
+"""
+Slim reads of interview_sessions for list views.
+
+History pages only render a summary row, so they select exactly those
+columns (with a 120-char question preview computed in SQL) instead of whole
+entities. The transcript / evaluation payload columns are a deferred group on
+the model and are only loaded by detail views via `with_payload()`.
+"""
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, undefer_group
+from app.models.interview_session import InterviewSession
+from app.utils.pagination import keyset, page_of
+
+QUESTION_PREVIEW_CHARS = 120
+
+# One row of a voice / behavioral / unified history list
+SUMMARY_COLUMNS = (
+    InterviewSession.id,
+    InterviewSession.session_type,
+    func.substr(InterviewSession.question_text, 1, QUESTION_PREVIEW_CHARS).label("question_text"),
+    InterviewSession.question_type,
+    InterviewSession.overall_score,
+    InterviewSession.grade,
+    InterviewSession.duration_secs,
+    InterviewSession.word_count,
+    InterviewSession.filler_count,
+    InterviewSession.vocal_filler_count,
+    InterviewSession.star_fulfilled,
+    InterviewSession.has_quantified,
+    InterviewSession.dim_scores,
+    InterviewSession.created_at,
+)
+
+# One row of the mock-interview history (no conversation transcript)
+MOCK_SUMMARY_COLUMNS = (
+    InterviewSession.id,
+    InterviewSession.role,
+    InterviewSession.company,
+    InterviewSession.duration_seconds,
+    InterviewSession.overall_score,
+    InterviewSession.per_category_scores,
+    InterviewSession.created_at,
+)
+
+
+def summary_select(user_id: str, session_type: Optional[str] = None, columns=SUMMARY_COLUMNS):
+    """select() of summary columns for one user; usable on sync and async sessions."""
+    stmt = select(*columns).where(InterviewSession.user_id == user_id)
+    if session_type:
+        stmt = stmt.where(InterviewSession.session_type == session_type)
+    return stmt
+
+
+def count_select(user_id: str, session_type: Optional[str] = None):
+    stmt = select(func.count(InterviewSession.id)).where(InterviewSession.user_id == user_id)
+    if session_type:
+        stmt = stmt.where(InterviewSession.session_type == session_type)
+    return stmt
+
+
+def with_payload():
+    """Loader option for detail views: fetch the deferred payload columns with the row."""
+    return undefer_group("payload")
+
+
+class SessionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def list_summaries(self, user_id: str, session_type: Optional[str] = None, cursor: Optional[str] = None,
+                       limit: int = 20, columns=SUMMARY_COLUMNS) -> Tuple[List, Optional[str]]:
+        """One keyset page of summary rows, newest first; returns (rows, next_cursor)."""
+        stmt = keyset(summary_select(user_id, session_type, columns), InterviewSession,
+                      cursor, limit, self.db.get_bind().dialect.name)
+        return page_of(self.db.execute(stmt).all(), limit)
+
+    def count(self, user_id: str, session_type: Optional[str] = None) -> int:
+        return self.db.scalar(count_select(user_id, session_type)) or 0
+
+    def latest_summary(self, user_id: str, session_type: str):
+        return self.db.execute(
+            summary_select(user_id, session_type)
+            .order_by(InterviewSession.created_at.desc(), InterviewSession.id.desc())
+            .limit(1)
+        ).first()
+
+    def get_detail(self, session_id: str) -> Optional[InterviewSession]:
+        return self.db.query(InterviewSession).options(with_payload()).filter_by(id=session_id).first()
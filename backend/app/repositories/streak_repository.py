@@ -0,0 +1,124 @@
+# app/repositories/streak_repository.py
+from typing import Iterable, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select, literal
+from app.models.interview_session import PracticeStreak, UserStreak
+import datetime
+
+
+def effective_streak(current: int, last_active: Optional[datetime.date], today: datetime.date) -> int:
+    """A stored streak is still live if the user practiced today or yesterday."""
+    if not last_active or last_active < today - datetime.timedelta(days=1):
+        return 0
+    return current or 0
+
+
+class StreakRepository:
+    """
+    Single source of truth for practice streaks.
+    Writes go through record_activity(); reads are one indexed row per user.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Writes ───────────────────────────────────────────────────
+    def record_activity(self, user_id: str, day: Optional[datetime.date] = None, commit: bool = True) -> UserStreak:
+        day = day or datetime.date.today()
+
+        row = self.db.query(PracticeStreak).filter_by(user_id=user_id, date=day).first()
+        if row:
+            row.sessions += 1
+        else:
+            self.db.add(PracticeStreak(user_id=user_id, date=day, sessions=1))
+
+        streak = self.db.query(UserStreak).filter_by(user_id=user_id).first()
+        if not streak:
+            streak = UserStreak(user_id=user_id, current_streak=0, longest_streak=0)
+            self.db.add(streak)
+
+        last = streak.last_active_date
+        if last == day:
+            pass
+        elif last == day - datetime.timedelta(days=1):
+            streak.current_streak = (streak.current_streak or 0) + 1
+            streak.last_active_date = day
+        elif last is None or last < day:
+            streak.current_streak = 1
+            streak.last_active_date = day
+        # Activity back-dated before last_active_date only touches practice_streaks
+
+        streak.longest_streak = max(streak.longest_streak or 0, streak.current_streak or 0)
+
+        if commit:
+            self.db.commit()
+        return streak
+
+    # ── Reads ────────────────────────────────────────────────────
+    def get(self, user_id: str) -> Optional[UserStreak]:
+        return self.db.query(UserStreak).filter_by(user_id=user_id).first()
+
+    def get_current_streak(self, user_id: str, today: Optional[datetime.date] = None) -> int:
+        today = today or datetime.date.today()
+        row = self.db.query(UserStreak.current_streak, UserStreak.last_active_date).filter(
+            UserStreak.user_id == user_id
+        ).first()
+        if not row:
+            return 0
+        return effective_streak(row.current_streak, row.last_active_date, today)
+
+    def get_current_streaks(self, user_ids: Optional[Iterable[str]] = None, today: Optional[datetime.date] = None) -> dict:
+        today = today or datetime.date.today()
+        query = self.db.query(UserStreak.user_id, UserStreak.current_streak, UserStreak.last_active_date)
+        if user_ids is not None:
+            query = query.filter(UserStreak.user_id.in_(list(user_ids)))
+        return {
+            user_id: effective_streak(current, last_active, today)
+            for user_id, current, last_active in query.all()
+        }
+
+    # ── Backfill ─────────────────────────────────────────────────
+    def _day_number(self):
+        """Integer day ordinal for PracticeStreak.date on the active dialect."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            return func.julianday(PracticeStreak.date)
+        return PracticeStreak.date - literal(datetime.date(1970, 1, 1))
+
+    def backfill(self, batch_size: int = 5000) -> int:
+        """
+        Rebuild user_streaks from practice_streaks with one gaps-and-islands
+        query: consecutive days share the same (day_number - dense_rank).
+        """
+        island = (self._day_number() - func.dense_rank().over(
+            partition_by=PracticeStreak.user_id,
+            order_by=PracticeStreak.date,
+        )).label("island")
+        days = select(
+            PracticeStreak.user_id, PracticeStreak.date, island,
+        ).where(PracticeStreak.sessions > 0).subquery()
+
+        islands = self.db.execute(
+            select(
+                days.c.user_id,
+                func.count(func.distinct(days.c.date)).label("length"),
+                func.max(days.c.date).label("last_day"),
+            ).group_by(days.c.user_id, days.c.island)
+        ).all()
+
+        per_user: dict = {}
+        for user_id, length, last_day in islands:
+            if isinstance(last_day, str):
+                last_day = datetime.date.fromisoformat(last_day)
+            current = per_user.setdefault(user_id, {
+                "user_id": user_id, "current_streak": 0, "longest_streak": 0, "last_active_date": None,
+            })
+            current["longest_streak"] = max(current["longest_streak"], length)
+            if current["last_active_date"] is None or last_day > current["last_active_date"]:
+                current["last_active_date"] = last_day
+                current["current_streak"] = length
+
+        rows = list(per_user.values())
+        self.db.query(UserStreak).delete(synchronize_session=False)
+        for i in range(0, len(rows), batch_size):
+            self.db.execute(insert(UserStreak), rows[i:i + batch_size])
+        self.db.commit()
+        return len(rows)
@@ -15,3 +15,7 @@ class UserRepository(BaseRepository[User]):
 
     def get_by_reset_token(self, token: str) -> Optional[User]:
         return self.db.query(User).filter(User.reset_token == token).first()
+
+    def get_principal_row(self, user_id: str):
+        """Just the columns authentication needs (id, role, is_active)."""
+        return self.db.query(User.id, User.role, User.is_active).filter(User.id == user_id).first()
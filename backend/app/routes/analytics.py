@@ -1,18 +1,23 @@
 """
 Analytics router — track events, user activity, and platform stats.
+
+/analytics/platform is served from maintained counters (platform_counters),
+never from COUNT(*) over users, sessions or events; see platform_service.
 """
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
 from pydantic import BaseModel
 from typing import Optional
 import datetime
 
 from app.core.database import get_db
-from app.models.analytics_model import AnalyticsEvent
-from app.models.session_model import InterviewSession
-from app.models.user_model import User
-from app.routes.auth import get_current_user, get_optional_user
+from app.core.dependencies import get_current_user, get_optional_user, require_role
+from app.models.analytics import AnalyticsEvent
+from app.models.user import User
+from app.repositories.platform_repository import PlatformCounterRepository, EVENTS, platform_payload
+from app.services.platform_service import platform_events, platform_reconciler
+from app.services.response_cache import cached_response
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -41,13 +46,14 @@ def track_event(
     )
     db.add(event)
     db.commit()
+    platform_events.incr(EVENTS, "value")
     return {"status": "tracked"}
 
 
 @router.get("/dashboard")
 def user_dashboard(
     days: int = Query(30, ge=1, le=365),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """User-level analytics: activity heatmap, most-visited pages, feature usage."""
@@ -84,26 +90,13 @@ def user_dashboard(
 
 
 @router.get("/platform")
+@cached_response(ttl=60)
 def platform_stats(db: Session = Depends(get_db)):
-    """Overall platform stats (public)."""
-    total_users = db.query(User).count()
-    total_sessions = db.query(InterviewSession).count()
-    total_events = db.query(AnalyticsEvent).count()
-
-    # Sessions by type
-    type_counts = db.query(
-        InterviewSession.session_type,
-        func.count(InterviewSession.id)
-    ).group_by(InterviewSession.session_type).all()
+    """Overall platform stats (public): one read of the maintained counters."""
+    return platform_payload(PlatformCounterRepository(db).snapshot())
 
-    # Average score overall
-    avg_score_row = db.query(func.avg(InterviewSession.overall_score)).scalar()
-    avg_score = round(float(avg_score_row), 1) if avg_score_row else 0
 
-    return {
-        "total_users": total_users,
-        "total_sessions": total_sessions,
-        "total_events": total_events,
-        "sessions_by_type": {t: c for t, c in type_counts},
-        "avg_score": avg_score,
-    }
+@router.post("/platform/reconcile")
+def reconcile_platform_stats(current_user: User = Depends(require_role(["admin"]))):
+    """Recount the platform counters from the tables now (after backfills or imports)."""
+    return {"drift": platform_reconciler.reconcile()}
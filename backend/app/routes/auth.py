@@ -1,13 +1,15 @@
 # app/routes/auth.py
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, get_current_user
+from app.core.dependencies import get_db, get_current_user, get_current_user_record, require_role
 from app.controllers.auth_controller import AuthController
 from app.schemas.auth import (
     LoginRequest, RegisterRequest, TokenResponse, 
-    RefreshRequest, VerifyEmailRequest, ForgotPasswordRequest, ResetPasswordRequest
+    RefreshRequest, VerifyEmailRequest, ForgotPasswordRequest, ResetPasswordRequest,
+    RoleUpdateRequest
 )
 from app.models.user import User
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -42,10 +44,20 @@ async def reset_password(body: ResetPasswordRequest, db: Session = Depends(get_d
     return await controller.reset_password(body.token, body.new_password)
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def logout(current_user: Principal = Depends(get_current_user), db: Session = Depends(get_db)):
     controller = AuthController(db)
     return await controller.logout(current_user.id)
 
 @router.get("/me")
-def me(current_user: User = Depends(get_current_user)):
+def me(current_user: User = Depends(get_current_user_record)):
     return {"user": current_user.to_dict()}
+
+@router.put("/users/{user_id}/role")
+async def set_role(
+    user_id: str,
+    body: RoleUpdateRequest,
+    current_user: User = Depends(require_role(["admin"])),
+    db: Session = Depends(get_db),
+):
+    controller = AuthController(db)
+    return await controller.set_role(user_id, body.role)
@@ -1,18 +1,27 @@
 """
 Behavioral router — evaluate answers via AI and persist to DB.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Header
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from pydantic import BaseModel
 from typing import Optional
+import uuid
 
-from app.core.database import get_db
-from app.models.session_model import InterviewSession, PracticeStreak
-from app.routes.auth import get_current_user, get_optional_user
-from app.models.user_model import User
+from app.core.database import get_db, SessionLocal
+from app.core.dependencies import get_current_user, get_optional_user
+from app.models.interview_session import InterviewSession
+from app.models.user import User
 from app.services.ai_service import evaluate_answer
-import datetime
+from app.services.job_service import job, job_queue
+from app.repositories.session_repository import SessionRepository
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.repositories.readiness_repository import ReadinessRepository
+from app.repositories.streak_repository import StreakRepository
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.services.response_cache import cached_response
+from app.services.data_version import dashboard_versions
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/behavioral", tags=["behavioral"])
 
@@ -40,22 +49,31 @@ class EvalRequest(BaseModel):
 
 
 def _upsert_streak(user_id: str, db: Session):
-    today = datetime.date.today().isoformat()
-    row = db.query(PracticeStreak).filter_by(user_id=user_id, date=today).first()
-    if row:
-        row.sessions += 1
-    else:
-        db.add(PracticeStreak(user_id=user_id, date=today, sessions=1))
-    db.commit()
+    StreakRepository(db).record_activity(user_id, commit=False)
 
 
-@router.post("/evaluate")
+@router.post("/evaluate", status_code=202)
 def evaluate(
     body: EvalRequest,
-    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: Optional[User] = Depends(get_optional_user),
 ):
-    result = evaluate_answer(body.question, body.answer, body.round_type)
+    """Queue the evaluation; poll GET /jobs/{job_id} for the result (guests send poll_token as X-Job-Token)."""
+    user_id = current_user.id if current_user else None
+    record = job_queue.enqueue(
+        "behavioral.evaluate",
+        {"question": body.question, "answer": body.answer, "round_type": body.round_type, "user_id": user_id,
+         "session_id": uuid.uuid4().hex},
+        idempotency_key=idempotency_key,
+        user_id=user_id,
+    )
+    return {"job_id": record["id"], "poll_token": record.get("poll_token"), "status": record["status"]}
+
+
+@job("behavioral.evaluate")
+async def evaluate_job(question: str, answer: str, round_type: str, user_id: Optional[str] = None,
+                       session_id: Optional[str] = None):
+    result = await evaluate_answer(question, answer, round_type)
     overall = result.get("overall_score", 0)
 
     # Grade
@@ -65,36 +83,48 @@ def evaluate(
     params = result.get("parameters", {})
     dim_scores = {k: v.get("score", 0) * 10 for k, v in params.items()}
 
-    user_id = current_user.id if current_user else None
-
     if user_id:
-        session = InterviewSession(
-            user_id=user_id,
-            session_type="behavioral",
-            question_text=body.question,
-            question_type=body.round_type,
-            answer_text=body.answer,
-            overall_score=overall,
-            grade=grade,
-            evaluation_json=result,
-            dim_scores=dim_scores,
-            word_count=len(body.answer.split()),
-            filler_count=len(result.get("filler_words", [])),
-            ai_feedback=result.get("sample_answer", ""),
-        )
-        db.add(session)
-
-        # Update streak
-        _upsert_streak(user_id, db)
-        db.commit()
-        db.refresh(session)
-        result["session_id"] = session.id
+        session_id = session_id or uuid.uuid4().hex
+        db = SessionLocal()
+        try:
+            # A retry after a successful commit must not write the session twice
+            if not db.query(InterviewSession.id).filter_by(id=session_id).first():
+                session = InterviewSession(
+                    id=session_id,
+                    user_id=user_id,
+                    session_type="behavioral",
+                    question_text=question,
+                    question_type=round_type,
+                    answer_text=answer,
+                    overall_score=overall,
+                    grade=grade,
+                    evaluation_json=result,
+                    dim_scores=dim_scores,
+                    word_count=len(answer.split()),
+                    filler_count=len(result.get("filler_words", [])),
+                    ai_feedback=result.get("sample_answer", ""),
+                )
+                db.add(session)
+
+                # Everything the session feeds commits with it, so a retry finds all or nothing
+                _upsert_streak(user_id, db)
+                db.flush()
+                AnalyticsRepository(db).record_session(session, commit=False)
+                LeaderboardRepository(db).refresh_user(user_id, commit=False)
+                BadgeRepository(db).evaluate(user_id, ["session", "streak"], commit=False)
+                ReadinessRepository(db).mark_dirty(user_id, commit=False)
+                db.commit()
+                dashboard_versions.bump(user_id)
+            result["session_id"] = session_id
+        finally:
+            db.close()
 
     result["grade"] = grade
     return result
 
 
 @router.get("/questions")
+@cached_response(ttl=3600, vary={"round_type": ("all", "HR", "Behavioral")})
 def get_questions(role: str = "Software Engineer", round_type: str = "all"):
     if round_type == "all":
         return {"questions": BEHAVIORAL_QUESTIONS}
@@ -104,23 +134,22 @@ def get_questions(role: str = "Software Engineer", round_type: str = "all"):
 
 @router.get("/history")
 def get_history(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, le=50),
-    current_user: User = Depends(get_current_user),
+    cursor: str = Query(None),
+    limit: int = Query(10, ge=1, le=50),
+    include_total: bool = Query(False),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    q = db.query(InterviewSession).filter(
-        InterviewSession.user_id == current_user.id,
-        InterviewSession.session_type == "behavioral",
-    ).order_by(desc(InterviewSession.created_at))
-    total = q.count()
-    sessions = q.offset((page - 1) * limit).limit(limit).all()
+    repo = SessionRepository(db)
+    sessions, next_cursor = repo.list_summaries(current_user.id, "behavioral", cursor, limit)
     return {
-        "total": total,
+        "total": repo.count(current_user.id, "behavioral") if include_total else None,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
         "sessions": [
             {
                 "id": s.id,
-                "question_text": (s.question_text or "")[:120],
+                "question_text": s.question_text,
                 "question_type": s.question_type,
                 "overall_score": s.overall_score,
                 "grade": s.grade,
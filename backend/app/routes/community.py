@@ -1,9 +1,11 @@
 # app/routes/community.py
 from fastapi import APIRouter, Depends, Query, Body
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, get_current_user
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import get_db, get_async_db, get_current_user
 from app.controllers.community_controller import CommunityController
-from app.models.user import User
+from app.repositories.post_repository import AsyncPostRepository
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/community", tags=["community"])
 
@@ -13,26 +15,28 @@ async def get_posts(
     role: str = None, 
     round_type: str = None, 
     flair: str = None,
-    limit: int = Query(20, le=100),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str = Query(None),
+    include_total: bool = Query(False),
+    sort: str = Query("new", pattern="^(new|hot|top)$"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    controller = CommunityController(db)
     filters = {
         "company": company,
         "role": role,
         "round_type": round_type,
         "flair": flair,
         "limit": limit,
-        "offset": offset
+        "cursor": cursor,
+        "include_total": include_total,
+        "sort": sort,
     }
-    posts = controller.get_posts(filters)
-    return {"posts": posts}
+    return await AsyncPostRepository(db).list_posts(**filters)
 
 @router.post("/posts")
 async def create_post(
     body: dict = Body(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     controller = CommunityController(db)
@@ -47,7 +51,7 @@ async def get_post(post_id: str, db: Session = Depends(get_db)):
 async def add_comment(
     post_id: str,
     body: dict = Body(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     controller = CommunityController(db)
@@ -57,7 +61,7 @@ async def add_comment(
 async def vote_post(
     post_id: str,
     vote_type: int = Body(..., embed=True),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     controller = CommunityController(db)
@@ -1,19 +1,36 @@
 # app/routes/dashboard.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, get_current_user
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import get_db, get_async_db, get_current_user, get_current_user_record
 from app.controllers.dashboard_controller import DashboardController
 from app.models.user import User
+from app.services.data_version import dashboard_versions
+from app.utils.etag import not_modified
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Clients may keep a copy but must revalidate it; it is one user's data
+DASHBOARD_CACHE_CONTROL = "private, no-cache"
+
 @router.get("")
-async def get_dashboard(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_dashboard(request: Request, response: Response, user: Principal = Depends(get_current_user),
+                        db: AsyncSession = Depends(get_async_db)):
+    # The session connects lazily, so a 304 never touches the database
+    etag = dashboard_versions.etag(user.id)
+    unchanged = not_modified(request, etag, DASHBOARD_CACHE_CONTROL)
+    if unchanged:
+        return unchanged
     controller = DashboardController(db)
-    return controller.get_dashboard_data(user.id)
+    data = await controller.get_dashboard_data(user.id)
+    if etag:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = DASHBOARD_CACHE_CONTROL
+    return data
 
 @router.get("/benchmark")
-async def get_benchmark(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_benchmark(current_user: User = Depends(get_current_user_record), db: Session = Depends(get_db)):
     # Peer benchmarking - simple mock for now as requested
     role = current_user.target_role or "Software Engineer"
     return {
@@ -25,7 +42,7 @@ async def get_benchmark(current_user: User = Depends(get_current_user), db: Sess
     }
 
 @router.get("/charts")
-async def get_charts(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_charts(user: Principal = Depends(get_current_user), db: Session = Depends(get_db)):
     # Skill radar chart data
     return {
         "radar": [
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from app.core.dependencies import get_db, get_current_user
 from app.controllers.dsa_controller import DSAController
 from app.schemas.dsa import DSASubmissionRequest, ProblemRead
-from app.models.user import User
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/dsa", tags=["dsa"])
 
@@ -25,7 +25,7 @@ async def get_problem(problem_id: str, db: Session = Depends(get_db)):
 @router.post("/submit")
 async def submit_solution(
     body: DSASubmissionRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     controller = DSAController(db)
@@ -1,24 +1,26 @@
 # app/routes/evaluation.py
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Body, Header
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db, get_current_user
 from app.controllers.evaluation_controller import EvaluationController
-from app.models.user import User
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/evaluation", tags=["evaluation"])
 
-@router.post("/submit")
+@router.post("/submit", status_code=202)
 async def submit_evaluation(
     data: dict = Body(...),
-    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     controller = EvaluationController(db)
-    return await controller.evaluate_answer(current_user.id, data)
+    return controller.evaluate_answer(current_user.id, data, idempotency_key)
 
 @router.get("/history")
 async def get_evaluation_history(
-    current_user: User = Depends(get_current_user), 
+    current_user: Principal = Depends(get_current_user), 
     db: Session = Depends(get_db)
 ):
     controller = EvaluationController(db)
@@ -1,7 +1,7 @@
 # app/routes/extension.py
 from fastapi import APIRouter, Depends, Body
 from app.routes.auth import get_current_user
-from app.models.user_model import User
+from app.services.auth_cache import Principal
 from typing import List
 
 router = APIRouter(prefix="/extension", tags=["extension"])
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/extension", tags=["extension"])
 async def sync_platform_data(
     platform: str = Body(...),
     problems_solved: List[str] = Body(...),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Stub for browser extension sync.
@@ -0,0 +1,40 @@
+# app/routes/jobs.py
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
+from app.core.dependencies import get_optional_user
+from app.services.auth_cache import Principal
+from app.services.job_service import job_queue
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.get("/{job_id}")
+def get_job_status(
+    job_id: str,
+    job_token: Optional[str] = Header(None, alias="X-Job-Token"),
+    current_user: Optional[Principal] = Depends(get_optional_user),
+):
+    """
+    Poll a background job: queued → running → succeeded | retrying | failed.
+    Only its owner sees it; guests send the poll_token from the 202 as X-Job-Token.
+    """
+    if current_user is None and not job_token:
+        raise HTTPException(status_code=401, detail="Could not validate credentials",
+                            headers={"WWW-Authenticate": "Bearer"})
+    record = job_queue.get(job_id)
+    owner = record is not None and current_user is not None and record.get("user_id") == current_user.id
+    holder = record is not None and bool(job_token) and secrets.compare_digest(
+        job_token, record.get("poll_token") or "")
+    # Someone else's job is reported exactly like a missing one
+    if not (owner or holder):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {
+        "id": record["id"],
+        "name": record["name"],
+        "status": record["status"],
+        "attempts": record["attempts"],
+        "result": record["result"],
+        "error": record["error"],
+        "created_at": record["created_at"],
+        "updated_at": record["updated_at"],
+    }
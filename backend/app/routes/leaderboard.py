@@ -1,130 +1,98 @@
 """
 Leaderboard router — ranks users by score, streak, college, and CGPA.
-GET /leaderboard          — top 50 public users with their stats
-GET /leaderboard/me       — current user's rank and stats
+GET  /leaderboard          — top 50 public users with their stats
+GET  /leaderboard/me       — current user's rank and stats
+POST /leaderboard/rebuild  — admin-only backfill of the streak index and rank table
+
+Stats are served from the precomputed `leaderboard_entries` table, which is
+kept current by LeaderboardRepository.refresh_user() on every session write.
 """
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from app.core.database import get_db
-from app.models.user_model import User
-from app.models.session_model import InterviewSession, PracticeStreak
-from app.routes.auth import get_current_user
-import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import get_db, get_async_db, get_current_user_record, require_role
+from app.models.user import User
+from app.models.leaderboard import LeaderboardEntry
+from app.repositories.leaderboard_repository import LeaderboardRepository, AsyncLeaderboardRepository
+from app.repositories.streak_repository import StreakRepository
+from app.services.response_cache import cached_response
 
 router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
 
 
-def _user_stats(user: User, db: Session) -> dict:
-    """Compute stats needed for ranking."""
-    sessions = db.query(InterviewSession).filter(
-        InterviewSession.user_id == user.id
-    ).all()
-
-    scores = [s.overall_score for s in sessions if s.overall_score is not None]
-    avg_score = round(sum(scores) / len(scores), 1) if scores else 0
-    best_score = round(max(scores), 1) if scores else 0
-    total = len(sessions)
-
-    # Streak
-    streak = 0
-    today = datetime.date.today()
-    for i in range(365):
-        day = (today - datetime.timedelta(days=i)).isoformat()
-        row = db.query(PracticeStreak).filter_by(user_id=user.id, date=day).first()
-        if row and row.sessions > 0:
-            streak += 1
-        elif i > 0:
-            break
-
-    # Rank score — weighted formula
-    rank_score = round(avg_score * 0.5 + min(streak, 30) * 1.5 + min(total, 50) * 0.3, 1)
-
+def _entry_stats(entry: LeaderboardEntry, user) -> dict:
     return {
-        "id": user.id,
+        "id": entry.user_id,
         "name": user.name,
-        "college": user.college or "—",
+        "college": entry.college or "—",
         "cgpa": user.cgpa or "—",
         "target_role": user.target_role or "—",
         "avatar_initials": user.name[0].upper() if user.name else "?",
-        "avg_score": avg_score,
-        "best_score": best_score,
-        "total_sessions": total,
-        "streak_days": streak,
-        "rank_score": rank_score,
-        "linkedin": user.linkedin,
-        "github": user.github,
+        "avg_score": entry.avg_score,
+        "best_score": entry.best_score,
+        "total_sessions": entry.total_sessions,
+        "streak_days": entry.streak_days,
+        "rank_score": entry.rank_score,
+        "linkedin": user.linkedin_url,
+        "github": user.github_url,
     }
 
 
 @router.get("")
-def get_leaderboard(
+async def get_leaderboard(
     limit: int = Query(50, le=100),
     sort_by: str = Query("rank_score", regex="^(rank_score|avg_score|streak_days|total_sessions)$"),
     college: str = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Top users ranked by weighted score.
     Filter by college if provided.
     """
-    q = db.query(User).filter(User.is_public == True)
-    if college:
-        q = q.filter(User.college.ilike(f"%{college}%"))
+    rows = await AsyncLeaderboardRepository(db).top(limit=limit, sort_by=sort_by, college=college)
 
-    users = q.all()
-
-    # Compute stats for each user
     board = []
-    for u in users:
-        try:
-            stats = _user_stats(u, db)
-            if stats["total_sessions"] > 0:  # only show active users
-                board.append(stats)
-        except Exception:
-            pass
-
-    # Sort
-    board.sort(key=lambda x: x.get(sort_by, 0), reverse=True)
-    board = board[:limit]
-
-    # Add rank position
-    for i, entry in enumerate(board):
-        entry["rank"] = i + 1
+    for i, row in enumerate(rows):
+        stats = _entry_stats(row[0], row)
+        stats["rank"] = i + 1
+        board.append(stats)
 
     return {"leaderboard": board, "total": len(board)}
 
 
 @router.get("/colleges")
-def get_colleges(db: Session = Depends(get_db)):
+@cached_response(ttl=300)
+async def get_colleges(db: AsyncSession = Depends(get_async_db)):
     """Distinct colleges for filter dropdown."""
-    rows = db.query(User.college).filter(
-        User.college != None,
-        User.college != "",
-        User.is_public == True
-    ).distinct().all()
-    return {"colleges": sorted([r[0] for r in rows if r[0]])}
+    return {"colleges": await AsyncLeaderboardRepository(db).colleges()}
 
 
 @router.get("/me")
-def my_rank(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+async def my_rank(
+    current_user: User = Depends(get_current_user_record),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get the current user's rank among all public users."""
-    all_users = db.query(User).filter(User.is_public == True).all()
-    board = []
-    for u in all_users:
-        try:
-            stats = _user_stats(u, db)
-            if stats["total_sessions"] > 0:
-                board.append(stats)
-        except Exception:
-            pass
-
-    board.sort(key=lambda x: x["rank_score"], reverse=True)
-    rank = next((i + 1 for i, e in enumerate(board) if e["id"] == current_user.id), None)
-    my_stats = _user_stats(current_user, db)
-    my_stats["rank"] = rank
-    my_stats["total_ranked"] = len(board)
+    repo = AsyncLeaderboardRepository(db)
+    entry = await repo.get_entry(current_user.id)
+    if entry:
+        my_stats = _entry_stats(entry, current_user)
+    else:
+        my_stats = _entry_stats(LeaderboardEntry(
+            user_id=current_user.id, college=current_user.college,
+            avg_score=0, best_score=0, total_sessions=0, streak_days=0, rank_score=0,
+        ), current_user)
+
+    my_stats["rank"] = await repo.rank_of(entry)
+    my_stats["total_ranked"] = await repo.count_ranked()
     return my_stats
+
+
+@router.post("/rebuild")
+def rebuild_leaderboard(
+    current_user: User = Depends(require_role(["admin"])),
+    db: Session = Depends(get_db),
+):
+    """Recompute streaks and every rank entry from grouped aggregates (backfill / repair)."""
+    streak_users = StreakRepository(db).backfill()
+    return {"streak_users": streak_users, "ranked_users": LeaderboardRepository(db).rebuild()}
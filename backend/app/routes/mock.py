@@ -1,11 +1,11 @@
 # app/routes/mock.py
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Body
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Body, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db, get_current_user
 from app.controllers.mock_controller import MockController
 from app.services.ai_service import ai_service
-from app.models.user import User
+from app.services.auth_cache import Principal
 import json
 
 router = APIRouter(prefix="/mock", tags=["mock"])
@@ -19,7 +19,7 @@ async def chat_mock(
     """Streaming chat for mock interview."""
     async def event_generator():
         from app.services.ai_service import mock_interview_stream
-        for chunk in mock_interview_stream(history, message):
+        async for chunk in mock_interview_stream(history, message):
             yield chunk
 
     return StreamingResponse(event_generator(), media_type="text/plain")
@@ -40,7 +40,7 @@ async def mock_interview_session(websocket: WebSocket, db: Session = Depends(get
             # Streaming AI response back over WebSocket
             full_response = ""
             from app.services.ai_service import mock_interview_stream
-            for chunk in mock_interview_stream(history, user_msg.get("message")):
+            async for chunk in mock_interview_stream(history, user_msg.get("message")):
                 await websocket.send_text(json.dumps({"type": "chunk", "text": chunk}))
                 full_response += chunk
             
@@ -56,7 +56,7 @@ async def mock_interview_session(websocket: WebSocket, db: Session = Depends(get
 @router.post("/save")
 async def save_mock_session(
     body: dict = Body(...),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     controller = MockController(db)
@@ -64,8 +64,10 @@ async def save_mock_session(
 
 @router.get("/history")
 async def get_mock_history(
-    user: User = Depends(get_current_user),
+    cursor: str = Query(None),
+    limit: int = Query(20, ge=1, le=50),
+    user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     controller = MockController(db)
-    return controller.get_history(user.id)
+    return controller.get_history(user.id, cursor, limit)
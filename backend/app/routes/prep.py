@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.controllers.prep_controller import PrepController
 from app.core.dependencies import get_current_user
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/prep", tags=["Preparation"])
 
@@ -12,7 +13,7 @@ async def get_company_prep(
     company: str = Query(...),
     role: str = Query("Software Engineer"),
     db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     controller = PrepController(db)
     return await controller.get_company_prep_data(company, role)
@@ -21,7 +22,7 @@ async def get_company_prep(
 async def generate_questions(
     data: dict,
     db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     controller = PrepController(db)
     return await controller.generate_questions(data)
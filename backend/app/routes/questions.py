@@ -2,6 +2,8 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 import json
 
+from app.services.response_cache import cached_response
+
 router = APIRouter(prefix="/questions", tags=["questions"])
 
 # ─── Question bank (local fallback) ──────────────────────────
@@ -106,11 +108,13 @@ Return ONLY valid JSON in this exact format (no markdown):
 
 
 @router.get("/topics")
+@cached_response(ttl=3600, vary={"type": QUESTION_BANK})
 def get_topics(type: str = "DSA / Coding"):
     bank = QUESTION_BANK.get(type, {})
     return {"topics": list(bank.keys()), "type": type}
 
 
 @router.get("/bank")
+@cached_response(ttl=3600)
 def get_question_bank():
     return {"types": list(QUESTION_BANK.keys())}
@@ -3,7 +3,8 @@ from fastapi import APIRouter, UploadFile, File, Form, Depends
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db, get_current_user
 from app.controllers.resume_controller import ResumeController
-from app.models.user import User
+from app.services.response_cache import cached_response
+from app.services.auth_cache import Principal
 
 router = APIRouter(prefix="/resume", tags=["resume"])
 
@@ -12,7 +13,7 @@ async def scan_resume(
     file: UploadFile = File(...),
     job_description: str = Form(""),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     controller = ResumeController(db)
     return await controller.scan_resume(current_user.id, file, job_description)
@@ -20,12 +21,13 @@ async def scan_resume(
 @router.get("/history")
 async def get_history(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     controller = ResumeController(db)
     return controller.get_history(current_user.id)
 
 @router.get("/templates")
+@cached_response(ttl=3600)
 async def get_templates():
     return [
         {"name": "Software Engineer", "role": "SWE", "url": "#"},
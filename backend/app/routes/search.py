@@ -0,0 +1,42 @@
+"""
+Search router — full-text search over community posts and comments, DSA
+problems and the question banks, with facet counts by company and round.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import get_db, get_async_db, require_role
+from app.models.search_document import DOC_TYPES
+from app.models.user import User
+from app.repositories.search_repository import AsyncSearchRepository, SearchIndexer
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("")
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: str = Query(None, description="Comma-separated subset of: " + ", ".join(DOC_TYPES)),
+    company: str = Query(None),
+    round_type: str = Query(None),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0, le=500),
+    facets: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
+):
+    doc_types = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    if doc_types and any(t not in DOC_TYPES for t in doc_types):
+        raise HTTPException(status_code=400, detail=f"types must be among: {', '.join(DOC_TYPES)}")
+    return await AsyncSearchRepository(db).search(
+        q, doc_types=doc_types, company=company, round_type=round_type,
+        limit=limit, offset=offset, facets=facets,
+    )
+
+
+@router.post("/reindex")
+def reindex(
+    current_user: User = Depends(require_role(["admin"])),
+    db: Session = Depends(get_db),
+):
+    """Rebuild the whole search index from source tables (backfill / repair)."""
+    return {"documents": SearchIndexer(db).rebuild()}
@@ -3,33 +3,36 @@ Sessions router — unified history & analytics across all interview types.
 """
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, cast, Date
-from app.core.database import get_db
-from app.models.session_model import InterviewSession, PracticeStreak
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import get_db, get_async_db, require_role
+from app.models.user import User
+from app.models.interview_session import InterviewSession
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.repositories.session_repository import SessionRepository, count_select, summary_select
+from app.repositories.streak_repository import StreakRepository
+from app.utils.pagination import keyset, page_of
 import datetime
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 
 @router.get("/history")
-def get_all_history(
+async def get_all_history(
     user_id: str = Query("guest"),
     session_type: str = Query(None),
-    page: int = Query(1, ge=1),
-    limit: int = Query(20, le=50),
-    db: Session = Depends(get_db),
+    cursor: str = Query(None),
+    limit: int = Query(20, ge=1, le=50),
+    include_total: bool = Query(False),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Paginated history across all session types."""
-    q = db.query(InterviewSession).filter(InterviewSession.user_id == user_id)
-    if session_type:
-        q = q.filter(InterviewSession.session_type == session_type)
-    q = q.order_by(desc(InterviewSession.created_at))
-    total = q.count()
-    items = q.offset((page - 1) * limit).limit(limit).all()
+    """Cursor-paginated history across all session types; pass back next_cursor for the next page."""
+    q = summary_select(user_id, session_type)
+    rows = (await db.execute(keyset(q, InterviewSession, cursor, limit, db.get_bind().dialect.name))).all()
+    items, next_cursor = page_of(rows, limit)
     return {
-        "total": total,
-        "page": page,
-        "pages": (total + limit - 1) // limit,
+        "total": await db.scalar(count_select(user_id, session_type)) if include_total else None,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
         "sessions": [_summary(s) for s in items],
     }
 
@@ -40,73 +43,70 @@ def get_analytics(
     days: int = Query(30),
     db: Session = Depends(get_db),
 ):
-    """Aggregated analytics for the dashboard."""
-    since = datetime.datetime.now() - datetime.timedelta(days=days)
-
-    sessions = db.query(InterviewSession).filter(
-        InterviewSession.user_id == user_id,
-        InterviewSession.created_at >= since,
-    ).all()
+    """Aggregated analytics for the dashboard, served from daily rollups."""
+    since = (datetime.datetime.now() - datetime.timedelta(days=days)).date()
+    repo = AnalyticsRepository(db)
+    rows = repo.window(user_id, since)
 
-    if not sessions:
+    if not rows:
         return _empty_analytics()
 
     by_type = {}
-    for s in sessions:
-        t = s.session_type
-        if t not in by_type:
-            by_type[t] = []
-        by_type[t].append(s)
+    trend_map = {}
+    dim_sums, dim_counts = {}, {}
+    score_sum, scored, best = 0.0, 0, None
+    for r in rows:
+        by_type[r.session_type] = by_type.get(r.session_type, 0) + r.session_count
+        if r.scored_count:
+            day = trend_map.setdefault(r.day.isoformat(), [0.0, 0])
+            day[0] += r.score_sum
+            day[1] += r.scored_count
+            score_sum += r.score_sum
+            scored += r.scored_count
+            best = r.best_score if best is None else max(best, r.best_score)
+        # Per-dimension averages (voice sessions only)
+        if r.session_type == "voice" and r.dim_sums:
+            for k, v in r.dim_sums.items():
+                dim_sums[k] = dim_sums.get(k, 0) + v
+                dim_counts[k] = dim_counts.get(k, 0) + r.dim_counts.get(k, 0)
 
     # Score trend (daily avg)
-    trend_map = {}
-    for s in sessions:
-        if s.overall_score is not None and s.created_at:
-            day = s.created_at.strftime("%Y-%m-%d")
-            trend_map.setdefault(day, []).append(s.overall_score)
     trend = sorted([
-        {"date": d, "avg_score": round(sum(v)/len(v), 1), "count": len(v)}
-        for d, v in trend_map.items()
+        {"date": d, "avg_score": round(total / count, 1), "count": count}
+        for d, (total, count) in trend_map.items()
     ], key=lambda x: x["date"])
+    dim_avgs = {k: round(v / dim_counts[k], 1) for k, v in dim_sums.items() if dim_counts.get(k)}
 
-    # Per-dimension averages (voice sessions only)
-    voice_sessions = [s for s in sessions if s.session_type == "voice" and s.dim_scores]
-    dim_avgs = {}
-    if voice_sessions:
-        all_dims = {}
-        for s in voice_sessions:
-            for k, v in (s.dim_scores or {}).items():
-                all_dims.setdefault(k, []).append(v)
-        dim_avgs = {k: round(sum(v)/len(v), 1) for k, v in all_dims.items()}
-
-    # Latest session per type
+    # Latest session per type (one indexed row each)
     latest = {}
-    for t, ss in by_type.items():
-        ss_sorted = sorted(ss, key=lambda x: x.created_at or datetime.datetime.min, reverse=True)
-        latest[t] = _summary(ss_sorted[0])
-
-    # Scores
-    all_scores = [s.overall_score for s in sessions if s.overall_score is not None]
-    avg_score = round(sum(all_scores)/len(all_scores), 1) if all_scores else 0
-    best_score = round(max(all_scores), 1) if all_scores else 0
-
-    # Streak
-    streak = _compute_streak(user_id, db)
+    for t in by_type:
+        s = repo.latest_session(user_id, t)
+        if s:
+            latest[t] = _summary(s)
 
     return {
-        "total_sessions": len(sessions),
-        "avg_score": avg_score,
-        "best_score": best_score,
-        "by_type": {t: len(ss) for t, ss in by_type.items()},
+        "total_sessions": sum(by_type.values()),
+        "avg_score": round(score_sum / scored, 1) if scored else 0,
+        "best_score": round(best, 1) if best is not None else 0,
+        "by_type": by_type,
         "trend": trend,
         "dim_avgs": dim_avgs,
         "latest": latest,
-        "streak_days": streak,
-        "total_filler_words": sum(s.filler_count or 0 for s in sessions),
-        "total_vocal_fillers": sum(s.vocal_filler_count or 0 for s in sessions),
+        "streak_days": _compute_streak(user_id, db),
+        "total_filler_words": sum(r.filler_total or 0 for r in rows),
+        "total_vocal_fillers": sum(r.vocal_filler_total or 0 for r in rows),
     }
 
 
+@router.post("/analytics/rebuild")
+def rebuild_analytics(
+    current_user: User = Depends(require_role(["admin"])),
+    db: Session = Depends(get_db),
+):
+    """Recompute every daily rollup from interview_sessions (backfill / repair)."""
+    return {"rollup_rows": AnalyticsRepository(db).rebuild()}
+
+
 @router.get("/streak")
 def get_streak(user_id: str = Query("guest"), db: Session = Depends(get_db)):
     return {"streak_days": _compute_streak(user_id, db), "user_id": user_id}
@@ -114,7 +114,7 @@ def get_streak(user_id: str = Query("guest"), db: Session = Depends(get_db)):
 
 @router.get("/{session_id}")
 def get_session(session_id: str, db: Session = Depends(get_db)):
-    s = db.query(InterviewSession).filter_by(id=session_id).first()
+    s = SessionRepository(db).get_detail(session_id)
     if not s:
         return {"error": "Not found"}
     return {
@@ -126,7 +126,8 @@ def get_session(session_id: str, db: Session = Depends(get_db)):
     }
 
 
-def _summary(s: InterviewSession) -> dict:
+def _summary(s) -> dict:
+    """Summary dict from a SUMMARY_COLUMNS row or a full InterviewSession."""
     return {
         "id":               s.id,
         "session_type":     s.session_type,
@@ -146,16 +147,7 @@ def _summary(s: InterviewSession) -> dict:
 
 
 def _compute_streak(user_id: str, db: Session) -> int:
-    today = datetime.date.today()
-    streak = 0
-    for i in range(365):
-        day = (today - datetime.timedelta(days=i)).isoformat()
-        row = db.query(PracticeStreak).filter_by(user_id=user_id, date=day).first()
-        if row and row.sessions > 0:
-            streak += 1
-        elif i > 0:  # allow today to be missing (just started)
-            break
-    return streak
+    return StreakRepository(db).get_current_streak(user_id)
 
 
 def _empty_analytics() -> dict:
@@ -1,11 +1,24 @@
-from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, Header, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from app.core.database import get_db
-from app.models.session_model import InterviewSession, PracticeStreak
-from app.services.nlp_service import evaluate_answer, evaluate_minute_segment
+from sqlalchemy import func
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
+from app.models.interview_session import InterviewSession
+from app.services.nlp_service import evaluate_answer, evaluate_minute_segment, evaluate_answers
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.repositories.readiness_repository import ReadinessRepository
+from app.repositories.streak_repository import StreakRepository
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.services.data_version import dashboard_versions
+from app.services.file_service import save_upload_stream
+from app.services.job_service import job, job_queue
+from app.repositories.session_repository import SessionRepository
 from pathlib import Path
-import uuid, datetime, os
+import json, uuid
 
 router = APIRouter(prefix="/voice", tags=["voice"])
 
@@ -14,18 +27,11 @@ RECORDINGS_DIR.mkdir(exist_ok=True)
 
 
 def _update_streak(db: Session, user_id: str, score: float):
-    today = datetime.date.today().isoformat()
-    row = db.query(PracticeStreak).filter_by(user_id=user_id, date=today).first()
-    if row:
-        row.sessions    += 1
-        row.total_score  = (row.total_score + score) / 2
-    else:
-        db.add(PracticeStreak(user_id=user_id, date=today, sessions=1, total_score=score))
-    db.commit()
+    StreakRepository(db).record_activity(user_id, commit=False)
 
 
 # ── Save recording ────────────────────────────────────────────
-@router.post("/save")
+@router.post("/save", status_code=202)
 async def save_recording(
     audio:          UploadFile = File(...),
     question_id:    str  = Form(""),
@@ -35,63 +41,116 @@ async def save_recording(
     duration_secs:  int  = Form(0),
     minute_logs:    str  = Form("[]"),   # JSON string
     user_id:        str  = Form("guest"),
-    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
-    import json
+    """
+    Store the audio, then queue evaluation and persistence.
+    Poll GET /jobs/{job_id} (guests send poll_token as X-Job-Token) for the score;
+    the session row is written as session_id.
+    """
+    # Stream audio to disk (chunked, size-capped, randomly named)
+    filename, size_bytes, sha256 = await save_upload_stream(
+        audio, RECORDINGS_DIR, ".webm", max_bytes=settings.MAX_RECORDING_MB * 1024 * 1024,
+    )
+
+    record = job_queue.enqueue(
+        "voice.process_recording",
+        {
+            "session_id": uuid.uuid4().hex,
+            "user_id": user_id,
+            "question_id": question_id,
+            "question_text": question_text,
+            "question_type": question_type,
+            "transcript": transcript,
+            "duration_secs": duration_secs,
+            "minute_logs": minute_logs,
+            "filename": filename,
+            "audio_sha256": sha256,
+        },
+        # A retried upload of the same audio for the same question maps to the same job
+        idempotency_key=idempotency_key or f"{user_id}:{question_id}:{sha256}",
+        user_id=user_id,
+    )
+    if record["payload"]["filename"] != filename:
+        # Duplicate of a queued upload: its job already has the audio
+        (RECORDINGS_DIR / filename).unlink(missing_ok=True)
+        filename = record["payload"]["filename"]
 
-    # Save audio file
-    filename = f"{uuid.uuid4().hex}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.webm"
-    content  = await audio.read()
-    with open(RECORDINGS_DIR / filename, "wb") as f:
-        f.write(content)
+    return {
+        "session_id": record["payload"]["session_id"],
+        "job_id":     record["id"],
+        "poll_token": record.get("poll_token"),
+        "status":     record["status"],
+        "filename":   filename,
+        "size_bytes": size_bytes,
+        "sha256":     sha256,
+    }
 
-    # Full evaluation
-    eval_result = evaluate_answer(transcript, question_type) if transcript.strip() else {}
 
-    # Parse minute logs
+@job("voice.process_recording")
+def process_recording(session_id: str, user_id: str, question_id: str, question_text: str,
+                      question_type: str, transcript: str, duration_secs: int, minute_logs: str,
+                      filename: str, audio_sha256: Optional[str] = None) -> dict:
+    db = SessionLocal()
     try:
-        m_logs = json.loads(minute_logs)
-    except Exception:
-        m_logs = []
-
-    # Persist to DB
-    session = InterviewSession(
-        user_id            = user_id,
-        session_type       = "voice",
-        question_id        = question_id,
-        question_text      = question_text,
-        question_type      = question_type,
-        answer_text        = transcript,
-        audio_filename     = filename,
-        duration_secs      = duration_secs,
-        word_count         = len(transcript.split()),
-        overall_score      = eval_result.get("overall_score"),
-        grade              = eval_result.get("grade"),
-        evaluation_json    = eval_result,
-        minute_logs        = m_logs,
-        dim_scores         = {k: round(v*10) for k,v in eval_result.get("scores_10", {}).items()},
-        filler_count       = sum(f["count"] for f in eval_result.get("fillers", [])),
-        vocal_filler_count = eval_result.get("vocal_filler_count", 0),
-        power_word_count   = sum(len(v) for v in eval_result.get("power_words", {}).values()),
-        star_fulfilled     = eval_result.get("star_breakdown", {}) and
-                              sum(1 for v in eval_result["star_breakdown"].values() if v),
-        has_quantified     = eval_result.get("has_quantified_result", False),
-    )
-    db.add(session)
+        # Full evaluation
+        eval_result = evaluate_answer(transcript, question_type) if transcript.strip() else {}
 
-    if user_id != "guest":
-        _update_streak(db, user_id, eval_result.get("overall_score", 0))
+        # Parse minute logs
+        try:
+            m_logs = json.loads(minute_logs)
+        except Exception:
+            m_logs = []
 
-    db.commit()
-    db.refresh(session)
+        # A retry after a successful commit must not write the session twice
+        if not db.query(InterviewSession.id).filter_by(id=session_id).first():
+            session = InterviewSession(
+                id                 = session_id,
+                user_id            = user_id,
+                session_type       = "voice",
+                question_id        = question_id,
+                question_text      = question_text,
+                question_type      = question_type,
+                answer_text        = transcript,
+                audio_filename     = filename,
+                audio_sha256       = audio_sha256,
+                duration_secs      = duration_secs,
+                word_count         = len(transcript.split()),
+                overall_score      = eval_result.get("overall_score"),
+                grade              = eval_result.get("grade"),
+                evaluation_json    = eval_result,
+                minute_logs        = m_logs,
+                dim_scores         = {k: round(v*10) for k,v in eval_result.get("scores_10", {}).items()},
+                filler_count       = sum(f["count"] for f in eval_result.get("fillers", [])),
+                vocal_filler_count = eval_result.get("vocal_filler_count", 0),
+                power_word_count   = sum(len(v) for v in eval_result.get("power_words", {}).values()),
+                star_fulfilled     = sum(1 for v in eval_result.get("star_breakdown", {}).values() if v),
+                has_quantified     = eval_result.get("has_quantified_result", False),
+            )
+            db.add(session)
 
-    return {
-        "session_id": session.id,
-        "filename":   filename,
-        "overall_score": eval_result.get("overall_score"),
-        "grade":         eval_result.get("grade"),
-        "vocal_fillers": eval_result.get("vocal_filler_count", 0),
-    }
+            # Everything the session feeds commits with it, so a retry finds all or nothing
+            if user_id != "guest":
+                _update_streak(db, user_id, eval_result.get("overall_score", 0))
+            db.flush()
+            AnalyticsRepository(db).record_session(session, commit=False)
+
+            if user_id != "guest":
+                LeaderboardRepository(db).refresh_user(user_id, commit=False)
+                BadgeRepository(db).evaluate(user_id, ["session", "streak"], commit=False)
+                ReadinessRepository(db).mark_dirty(user_id, commit=False)
+            db.commit()
+            if user_id != "guest":
+                dashboard_versions.bump(user_id)
+
+        return {
+            "session_id":    session_id,
+            "overall_score": eval_result.get("overall_score"),
+            "grade":         eval_result.get("grade"),
+            "vocal_fillers": eval_result.get("vocal_filler_count", 0),
+        }
+    finally:
+        db.close()
 
 
 # ── Per-minute segment eval (called live every 60s) ──────────
@@ -112,24 +171,50 @@ def evaluate(
     return evaluate_answer(transcript, question_type)
 
 
+# ── Batch text-only evaluation (NDJSON stream) ────────────────
+class BatchEvalItem(BaseModel):
+    transcript: str
+    question_type: str = "Behavioral"
+
+
+class BatchEvalRequest(BaseModel):
+    items: List[BatchEvalItem] = Field(..., min_length=1, max_length=1000)
+
+
+@router.post("/evaluate/batch")
+def evaluate_batch(body: BatchEvalRequest):
+    """
+    Evaluate many answers at once on the NLP process pool.
+    Streams one JSON line per answer as soon as it completes:
+    {"index": <position in items>, "result": {...}}
+    """
+    def ndjson():
+        results = evaluate_answers(
+            (item.transcript for item in body.items),
+            (item.question_type for item in body.items),
+        )
+        for index, result in results:
+            yield json.dumps({"index": index, "result": result}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 # ── List sessions (history) ───────────────────────────────────
 @router.get("/history")
 def get_history(
-    user_id: str = "guest",
-    page: int    = 1,
-    limit: int   = 20,
-    db: Session  = Depends(get_db),
+    user_id: str  = "guest",
+    cursor: str   = None,
+    limit: int    = Query(20, ge=1, le=50),
+    include_total: bool = False,
+    db: Session   = Depends(get_db),
 ):
-    q = db.query(InterviewSession).filter_by(
-        user_id=user_id, session_type="voice"
-    ).order_by(desc(InterviewSession.created_at))
-
-    total  = q.count()
-    items  = q.offset((page-1)*limit).limit(limit).all()
+    repo = SessionRepository(db)
+    items, next_cursor = repo.list_summaries(user_id, "voice", cursor, limit)
 
     return {
-        "total": total,
-        "page": page,
+        "total": repo.count(user_id, "voice") if include_total else None,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
         "sessions": [
             {
                 "id":            s.id,
@@ -151,7 +236,7 @@ def get_history(
 # ── Single session detail ─────────────────────────────────────
 @router.get("/history/{session_id}")
 def get_session(session_id: str, db: Session = Depends(get_db)):
-    s = db.query(InterviewSession).filter_by(id=session_id).first()
+    s = SessionRepository(db).get_detail(session_id)
     if not s:
         raise HTTPException(404, "Session not found")
     return s
@@ -164,9 +249,19 @@ def delete_session(session_id: str, db: Session = Depends(get_db)):
     if not s:
         raise HTTPException(404, "Not found")
     if s.audio_filename:
+        # Uploads stored before per-session names were content-addressed and may share a file
+        shared = db.query(func.count(InterviewSession.id)).filter(
+            InterviewSession.audio_filename == s.audio_filename,
+            InterviewSession.id != s.id,
+        ).scalar()
         fp = RECORDINGS_DIR / s.audio_filename
-        if fp.exists():
+        if not shared and fp.exists():
             fp.unlink()
+    user_id = s.user_id
     db.delete(s)
-    db.commit()
+    db.flush()
+    AnalyticsRepository(db).remove_session(s)
+    if user_id != "guest":
+        LeaderboardRepository(db).refresh_user(user_id)
+        ReadinessRepository(db).mark_dirty(user_id)
     return {"deleted": session_id}
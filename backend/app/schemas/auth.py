@@ -1,6 +1,6 @@
 # app/schemas/auth.py
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Literal, Optional
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -31,3 +31,6 @@ class ForgotPasswordRequest(BaseModel):
 class ResetPasswordRequest(BaseModel):
     token: str
     new_password: str
+
+class RoleUpdateRequest(BaseModel):
+    role: Literal["user", "moderator", "admin"]
@@ -1,80 +1,297 @@
 import os
 import json
+import asyncio
 import logging
 import hashlib
+import uuid
+import weakref
 from typing import Optional, Dict, Any
-from anthropic import Anthropic
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient, APIConnectionError, RateLimitError, InternalServerError
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .nlp_service import evaluate_answer as local_nlp_eval
+from .cache_service import CachePolicy, LayeredCache
+from .prompt_budget import PromptBudget, compact_nlp_features, estimate_tokens
 from app.utils import prompt_templates
+from app.core.config import settings
 from app.core.database import get_redis
 
 logger = logging.getLogger(__name__)
 
+# Transient upstream failures worth retrying; anything else fails fast
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+# Per-method cache policies. Reference data (company prep, generated question
+# sets, plans) is shared and long-lived; evaluations of a user's own answer are
+# effectively unique, so they skip the in-process tier.
+CACHE_POLICIES = {
+    "default":           CachePolicy(ttl=3600),
+    "interview_eval":    CachePolicy(ttl=3600, local=False),
+    "behavioral_eval":   CachePolicy(ttl=3600, local=False),
+    "system_design":     CachePolicy(ttl=3600, local=False),
+    "code_review":       CachePolicy(ttl=6 * 3600, local=False),
+    "resume_ats":        CachePolicy(ttl=24 * 3600, local=False),
+    "cover_letter":      CachePolicy(ttl=24 * 3600, local=False),
+    "linkedin":          CachePolicy(ttl=24 * 3600, local=False),
+    "study_plan":        CachePolicy(ttl=24 * 3600),
+    "question_gen":      CachePolicy(ttl=24 * 3600),
+    "company_prep":      CachePolicy(ttl=7 * 24 * 3600, negative_ttl=60),
+}
+
+# Per-template input-token caps on user-supplied fields (estimated locally, see
+# prompt_budget). Resumes and code are cut by structure, free text head + tail.
+PROMPT_BUDGETS = {
+    "interview_eval":  PromptBudget(question=300, answer=1500, context=400),
+    "behavioral_eval": PromptBudget(question=300, answer=1500),
+    "system_design":   PromptBudget(prompt=500, user_answer=2500),
+    "code_review":     PromptBudget(problem=800, code=(3000, "code")),
+    "resume_ats":      PromptBudget(resume_text=(3000, "resume"), job_description=1200),
+    "cover_letter":    PromptBudget(resume_text=(2000, "resume"), job_description=1200),
+}
+
+class _LoopState:
+    """HTTP pool, concurrency limit and in-flight calls owned by one event loop."""
+    def __init__(self, client: Optional[AsyncAnthropic], max_concurrency: int):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.inflight: Dict[str, asyncio.Task] = {}
+
 class AIService:
     def __init__(self):
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
-        self.client = Anthropic(api_key=self.api_key) if self.api_key else None
         self.model = "claude-3-5-sonnet-20240620"
         self.redis = get_redis()
+        self.cache = LayeredCache(
+            self.redis,
+            max_entries=settings.AI_CACHE_MAX_ENTRIES,
+            max_bytes=settings.AI_CACHE_MAX_BYTES,
+            compress_min_bytes=settings.AI_CACHE_COMPRESS_MIN_BYTES,
+        )
+        self.max_concurrency = settings.AI_MAX_CONCURRENCY
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        # upstream: real Claude calls; coalesced_*: callers served by another caller's call
+        self.metrics = {"cache_hits": 0, "upstream": 0, "coalesced_local": 0, "coalesced_remote": 0}
+        # Per template: calls, estimated input tokens sent, tokens saved by budgeting, calls truncated
+        self.prompt_tokens: Dict[str, Dict[str, int]] = {}
+
+    def _bind_loop(self) -> _LoopState:
+        """
+        The HTTP pool and semaphore belong to one event loop. Build them on
+        first use per loop — the API loop and the job worker loop each get their own.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is not None:
+            return state
+        client = None
+        if self.api_key:
+            # The SDK's client subclass matches whichever httpx package it is built on
+            http_client = DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.AI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.AI_MAX_CONNECTIONS,
+                ),
+                timeout=settings.AI_REQUEST_TIMEOUT,
+            )
+            client = AsyncAnthropic(
+                api_key=self.api_key,
+                base_url=settings.ANTHROPIC_BASE_URL,
+                http_client=http_client,
+                max_retries=0,  # retries are handled by _call_upstream
+            )
+        state = self._loops[loop] = _LoopState(client, self.max_concurrency)
+        return state
+
+    @property
+    def client(self) -> Optional[AsyncAnthropic]:
+        return self._bind_loop().client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        return self._bind_loop().semaphore
+
+    @property
+    def _inflight(self) -> Dict[str, asyncio.Task]:
+        return self._bind_loop().inflight
+
+    def _fit_prompt(self, template: str, language: Optional[str] = None, **fields) -> Dict[str, str]:
+        """Apply the template's PromptBudget to its user-supplied fields and record the savings."""
+        fitted, before, after = PROMPT_BUDGETS[template].fit(fields, language)
+        self._record_prompt_tokens(template, before, after)
+        return fitted
+
+    def _record_prompt_tokens(self, template: str, before: int, after: int):
+        stats = self.prompt_tokens.setdefault(template, {"calls": 0, "tokens": 0, "saved": 0, "truncated": 0})
+        stats["calls"] += 1
+        stats["tokens"] += after
+        stats["saved"] += before - after
+        if after < before:
+            stats["truncated"] += 1
+            logger.info(f"Prompt budget: {template} input {before} -> {after} est. tokens")
+
+    def prompt_token_stats(self) -> Dict[str, Dict[str, float]]:
+        """prompt_tokens plus the average input tokens saved per call, for /health/ai."""
+        return {
+            template: {**stats, "saved_per_call": round(stats["saved"] / stats["calls"], 1)}
+            for template, stats in self.prompt_tokens.items()
+        }
 
     def _get_cache_key(self, system: str, prompt: str) -> str:
         """Generates a stable cache key for a given input."""
         combined = f"{system}:{prompt}".encode('utf-8')
         return f"ai_cache:{hashlib.md5(combined).hexdigest()}"
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _safe_claude_call(self, system: str, prompt: str, cache_ttl: int = 3600) -> str:
-        """Centralized Claude call with retry logic, caching, and safety."""
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        reraise=True,
+    )
+    async def _call_upstream(self, system: str, prompt: str) -> str:
+        """One Claude request; tenacity backs off with asyncio.sleep between attempts."""
+        async with self.semaphore:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=2000,
+                temperature=0,
+                system=system,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        return response.content[0].text
+
+    def _cache_lookup(self, cache_key: str, policy: CachePolicy) -> Optional[str]:
+        """Cached response text, None on a miss; raises if a recent failure is cached."""
+        hit, value = self.cache.get(cache_key, policy)
+        if hit and value is None:
+            raise Exception("AI call failed recently for this input; not retrying yet")
+        return value
+
+    def _acquire_lock(self, cache_key: str) -> Optional[str]:
+        """Cross-worker lock on the cache key. Returns the owner token, or None if held elsewhere."""
+        token = uuid.uuid4().hex
+        try:
+            if self.redis.set(f"lock:{cache_key}", token, nx=True, ex=settings.AI_LOCK_TTL):
+                return token
+            return None
+        except Exception as e:
+            # Without Redis, in-process single-flight still applies
+            logger.warning(f"AI lock unavailable: {e}")
+            return token
+
+    def _release_lock(self, cache_key: str, token: str):
+        try:
+            lock_key = f"lock:{cache_key}"
+            if self.redis.get(lock_key) == token:
+                self.redis.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"AI lock release failed: {e}")
+
+    def _lock_held(self, cache_key: str) -> bool:
+        try:
+            return bool(self.redis.exists(f"lock:{cache_key}"))
+        except Exception:
+            return False
+
+    async def _call_and_store(self, cache_key: str, system: str, prompt: str, policy: CachePolicy) -> str:
+        logger.info(f"AI Call: Calling {self.model}")
+        self.metrics["upstream"] += 1
+        try:
+            text = await self._call_upstream(system, prompt)
+        except Exception:
+            # Remember the failure briefly so a burst of retries doesn't hit upstream again
+            self.cache.set_negative(cache_key, policy)
+            raise
+        self.cache.set(cache_key, text, policy)
+        return text
+
+    async def _fetch_once(self, cache_key: str, system: str, prompt: str, policy: CachePolicy) -> str:
+        """
+        Cross-worker single-flight: the lock holder calls Claude and fills the
+        cache; other workers poll the cache until it appears or the lock lapses.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.AI_LOCK_TTL
+        while True:
+            token = self._acquire_lock(cache_key)
+            if token:
+                try:
+                    # Another worker may have filled the cache between our miss and the lock
+                    cached = self._cache_lookup(cache_key, policy)
+                    if cached:
+                        self.metrics["coalesced_remote"] += 1
+                        return cached
+                    return await self._call_and_store(cache_key, system, prompt, policy)
+                finally:
+                    self._release_lock(cache_key, token)
+
+            while self._lock_held(cache_key) and loop.time() < deadline:
+                await asyncio.sleep(settings.AI_LOCK_POLL_INTERVAL)
+                cached = self._cache_lookup(cache_key, policy)
+                if cached:
+                    self.metrics["coalesced_remote"] += 1
+                    return cached
+            if loop.time() >= deadline:
+                # The holder is stuck or gone; stop waiting and call upstream ourselves
+                logger.warning("AI lock wait timed out; calling upstream directly")
+                return await self._call_and_store(cache_key, system, prompt, policy)
+            # Lock released without a cached result (holder failed) — retry for the lock
+
+    async def _safe_claude_call(self, system: str, prompt: str, policy: Optional[CachePolicy] = None) -> str:
+        """Centralized Claude call with retry logic, layered caching, single-flight and safety."""
+        policy = policy or CACHE_POLICIES["default"]
         # Token optimization: trim whitespace
         prompt = prompt.strip()
         system = system.strip()
         
-        # Check Cache
+        # Check Cache (in-process LRU, then Redis)
         cache_key = self._get_cache_key(system, prompt)
-        try:
-            cached = self.redis.get(cache_key)
-            if cached:
-                logger.info("AI Cache Hit!")
-                return cached
-        except Exception as e:
-            logger.warning(f"AI Cache read failed: {e}")
+        cached = self._cache_lookup(cache_key, policy)
+        if cached:
+            logger.info("AI Cache Hit!")
+            self.metrics["cache_hits"] += 1
+            return cached
 
         if not self.client:
             raise Exception("Anthropic Client not initialized")
-        
-        logger.info(f"AI Call: Calling {self.model}")
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2000,
-            temperature=0,
-            system=system,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        text = response.content[0].text
 
-        # Store in Cache
-        try:
-            self.redis.set(cache_key, text, ex=cache_ttl)
-        except Exception as e:
-            logger.warning(f"AI Cache write failed: {e}")
+        # In-process single-flight: identical concurrent requests share one task.
+        # The task is shielded so one caller disconnecting doesn't cancel it for the rest.
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            self.metrics["coalesced_local"] += 1
+        else:
+            task = asyncio.ensure_future(self._fetch_once(cache_key, system, prompt, policy))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda t: self._on_fetch_done(cache_key, t))
+        return await asyncio.shield(task)
 
-        return text
+    def _on_fetch_done(self, cache_key: str, task: asyncio.Task):
+        inflight = self._loops[task.get_loop()].inflight
+        if inflight.get(cache_key) is task:
+            del inflight[cache_key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; waiters (if any) re-raise it themselves
 
     async def evaluate_interview_response(self, question: str, answer: str, context: Optional[str] = None) -> Dict[str, Any]:
         """Deep 12-parameter evaluation using prompt templates and Pydantic validation."""
         local_stats = local_nlp_eval(answer)
+        fields, before, after = PROMPT_BUDGETS["interview_eval"].fit(
+            {"question": question, "answer": answer, "context": context})
+        # The NLP signals used to be inlined as raw dict reprs; count what the compact form saves
+        nlp_features = compact_nlp_features(local_stats)
+        legacy = f"Fillers={local_stats.get('fillers', [])}, Readability={local_stats.get('readability', {})}"
+        self._record_prompt_tokens("interview_eval", before + estimate_tokens(legacy),
+                                   after + estimate_tokens(nlp_features))
         prompt = prompt_templates.EVAL_PROMPT.format(
-            question=question,
-            answer=answer,
-            context_msg=f"CONTEXT: {context}" if context else "",
-            fillers=local_stats.get('fillers', []),
-            readability=local_stats.get('readability', {})
+            question=fields["question"],
+            answer=fields["answer"],
+            context_msg=f"CONTEXT: {fields['context']}" if context else "",
+            nlp_features=nlp_features,
         )
         
         try:
-            raw = await self._safe_claude_call(prompt_templates.EVAL_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.EVAL_SYSTEM, prompt, policy=CACHE_POLICIES["interview_eval"])
             data = self._extract_json(raw)
             # Validation
             from app.schemas.ai_schemas import InterviewEvalResponse
@@ -88,12 +305,13 @@ class AIService:
 
     async def rate_resume_ats(self, resume_text: str, job_description: str = "") -> Dict[str, Any]:
         """Analyzes resume against ATS standards."""
+        fields = self._fit_prompt("resume_ats", resume_text=resume_text, job_description=job_description)
         prompt = prompt_templates.RESUME_ATS_PROMPT.format(
-            resume_text=resume_text,
-            job_description=job_description or "General Software Engineering Role"
+            resume_text=fields["resume_text"],
+            job_description=fields["job_description"] or "General Software Engineering Role"
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.RESUME_ATS_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.RESUME_ATS_SYSTEM, prompt, policy=CACHE_POLICIES["resume_ats"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import ResumeATSResponse
             return ResumeATSResponse(**data).dict()
@@ -109,7 +327,7 @@ class AIService:
             weak_areas=weak_areas
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.STUDY_PLAN_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.STUDY_PLAN_SYSTEM, prompt, policy=CACHE_POLICIES["study_plan"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import StudyPlanResponse
             return StudyPlanResponse(**data).dict()
@@ -119,13 +337,14 @@ class AIService:
 
     async def review_code(self, problem: str, code: str, language: str) -> Dict[str, Any]:
         """Provides expert technical code review."""
+        fields = self._fit_prompt("code_review", language=language, problem=problem, code=code)
         prompt = prompt_templates.CODE_REVIEW_PROMPT.format(
-            problem=problem,
-            code=code,
+            problem=fields["problem"],
+            code=fields["code"],
             language=language
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.CODE_REVIEW_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.CODE_REVIEW_SYSTEM, prompt, policy=CACHE_POLICIES["code_review"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import CodeReviewResponse
             return CodeReviewResponse(**data).dict()
@@ -135,12 +354,13 @@ class AIService:
 
     async def evaluate_system_design(self, prompt_text: str, user_answer: str) -> Dict[str, Any]:
         """Evaluates system design architecture and trade-offs."""
+        fields = self._fit_prompt("system_design", prompt=prompt_text, user_answer=user_answer)
         prompt = prompt_templates.SYSTEM_DESIGN_PROMPT.format(
-            prompt=prompt_text,
-            user_answer=user_answer
+            prompt=fields["prompt"],
+            user_answer=fields["user_answer"]
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.SYSTEM_DESIGN_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.SYSTEM_DESIGN_SYSTEM, prompt, policy=CACHE_POLICIES["system_design"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import SystemDesignResponse
             return SystemDesignResponse(**data).dict()
@@ -150,12 +370,13 @@ class AIService:
 
     async def evaluate_behavioral(self, question: str, answer: str) -> Dict[str, Any]:
         """Scores behavioral answers based on STAR logic."""
+        fields = self._fit_prompt("behavioral_eval", question=question, answer=answer)
         prompt = prompt_templates.BEHAVIORAL_PROMPT.format(
-            question=question,
-            answer=answer
+            question=fields["question"],
+            answer=fields["answer"]
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.BEHAVIORAL_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.BEHAVIORAL_SYSTEM, prompt, policy=CACHE_POLICIES["behavioral_eval"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import BehavioralResponse
             return BehavioralResponse(**data).dict()
@@ -165,12 +386,13 @@ class AIService:
 
     async def generate_cover_letter(self, resume_text: str, job_description: str) -> Dict[str, Any]:
         """Generates a tailored cover letter."""
+        fields = self._fit_prompt("cover_letter", resume_text=resume_text, job_description=job_description)
         prompt = prompt_templates.COVER_LETTER_PROMPT.format(
-            resume_text=resume_text,
-            job_description=job_description
+            resume_text=fields["resume_text"],
+            job_description=fields["job_description"]
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.COVER_LETTER_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.COVER_LETTER_SYSTEM, prompt, policy=CACHE_POLICIES["cover_letter"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import CoverLetterResponse
             return CoverLetterResponse(**data).dict()
@@ -186,7 +408,7 @@ class AIService:
             role=role
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.LINKEDIN_OPTIMIZE_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.LINKEDIN_OPTIMIZE_SYSTEM, prompt, policy=CACHE_POLICIES["linkedin"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import LinkedInOptimizeResponse
             return LinkedInOptimizeResponse(**data).dict()
@@ -201,7 +423,7 @@ class AIService:
             role=role
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.COMPANY_PREP_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.COMPANY_PREP_SYSTEM, prompt, policy=CACHE_POLICIES["company_prep"])
             data = self._extract_json(raw)
             # Reusing a simple dict here or define a schema if needed
             return data
@@ -215,7 +437,7 @@ class AIService:
             role=role, type=type, level=level, count=count, company=company, topics=topics
         )
         try:
-            raw = await self._safe_claude_call(prompt_templates.QUESTION_GEN_SYSTEM, prompt)
+            raw = await self._safe_claude_call(prompt_templates.QUESTION_GEN_SYSTEM, prompt, policy=CACHE_POLICIES["question_gen"])
             data = self._extract_json(raw)
             from app.schemas.ai_schemas import QuestionGenResponse
             return QuestionGenResponse(**data).dict()
@@ -279,17 +501,18 @@ evaluate_answer = evaluate_interview_response # Alias
 async def rate_resume_ats(resume_text: str, job_description: str = ""):
     return await ai_service.rate_resume_ats(resume_text, job_description)
 
-def mock_interview_stream(history: list, user_message: str):
+async def mock_interview_stream(history: list, user_message: str):
     messages = history + [{"role": "user", "content": user_message}]
     if not ai_service.client:
         yield "AI Simulator unavailable."
         return
 
-    with ai_service.client.messages.stream(
-        model=ai_service.model,
-        max_tokens=600,
-        system=prompt_templates.MOCK_INTERVIEW_SYSTEM,
-        messages=messages
-    ) as stream:
-        for text in stream.text_stream:
-            yield text
+    async with ai_service.semaphore:
+        async with ai_service.client.messages.stream(
+            model=ai_service.model,
+            max_tokens=600,
+            system=prompt_templates.MOCK_INTERVIEW_SYSTEM,
+            messages=messages
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
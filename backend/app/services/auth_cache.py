@@ -0,0 +1,109 @@
+# app/services/auth_cache.py
+"""
+Caches that let authenticated requests skip JWT verification and the users
+table on the hot path.
+
+- Verified tokens: in-process LRU from raw token to decoded payload, kept
+  until the token expires or AUTH_TOKEN_CACHE_TTL passes, whichever is first.
+  Only successful verifications are cached.
+- Principals: the slim (id, role, is_active) view of a user that request
+  handlers need, in a LayeredCache (Redis shared across workers, short-lived
+  local copies). AuthController invalidates it on logout, password reset and
+  role change.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.core.database import get_redis
+from app.core.security import decode_token
+from app.services.cache_service import CachePolicy, LayeredCache
+
+PRINCIPAL_POLICY = CachePolicy(
+    ttl=settings.AUTH_PRINCIPAL_TTL,
+    negative_ttl=0,
+    local=True,
+    local_ttl=settings.AUTH_PRINCIPAL_LOCAL_TTL,
+)
+
+
+class Principal:
+    """The authenticated caller as most routes need it — no profile columns."""
+    __slots__ = ("id", "role", "is_active")
+
+    def __init__(self, id: str, role: str, is_active: bool):
+        self.id = id
+        self.role = role or "user"
+        self.is_active = bool(is_active)
+
+    def to_json(self) -> str:
+        return json.dumps({"id": self.id, "role": self.role, "is_active": self.is_active})
+
+    @classmethod
+    def from_json(cls, raw: str) -> "Principal":
+        return cls(**json.loads(raw))
+
+
+class AuthCache:
+    def __init__(self, redis, token_ttl: int = 60, max_tokens: int = 10_000):
+        self.token_ttl = token_ttl
+        self.max_tokens = max_tokens
+        self._tokens: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.principals = LayeredCache(redis, max_entries=max_tokens, max_bytes=8 * 1024 * 1024,
+                                       compress_min_bytes=1 << 30)
+        self.counters = {"token_hits": 0, "token_misses": 0, "principal_loads": 0}
+
+    # ── Tokens ───────────────────────────────────────────────────
+    def decode(self, token: str) -> Optional[dict]:
+        """decode_token() with a cache in front of the signature check."""
+        now = time.time()
+        with self._lock:
+            item = self._tokens.get(token)
+            if item is not None:
+                if item[0] > now:
+                    self._tokens.move_to_end(token)
+                    self.counters["token_hits"] += 1
+                    return item[1]
+                del self._tokens[token]
+
+        self.counters["token_misses"] += 1
+        payload = decode_token(token)
+        if payload:
+            expires_at = min(now + self.token_ttl, payload.get("exp", now))
+            if expires_at > now:
+                with self._lock:
+                    self._tokens[token] = (expires_at, payload)
+                    if len(self._tokens) > self.max_tokens:
+                        self._tokens.popitem(last=False)
+        return payload
+
+    # ── Principals ───────────────────────────────────────────────
+    def get_principal(self, user_id: str, loader: Callable[[str], Optional[Principal]]) -> Optional[Principal]:
+        """Cached principal for user_id; `loader` reads it from the database on a miss."""
+        key = f"principal:{user_id}"
+        hit, raw = self.principals.get(key, PRINCIPAL_POLICY)
+        if hit and raw:
+            return Principal.from_json(raw)
+
+        self.counters["principal_loads"] += 1
+        principal = loader(user_id)
+        if principal is not None:
+            self.principals.set(key, principal.to_json(), PRINCIPAL_POLICY)
+        return principal
+
+    def invalidate_user(self, user_id: str):
+        self.principals.delete(f"principal:{user_id}")
+
+    def stats(self) -> dict:
+        return {**self.counters, "cached_tokens": len(self._tokens), "principals": self.principals.stats()}
+
+
+auth_cache = AuthCache(
+    get_redis(),
+    token_ttl=settings.AUTH_TOKEN_CACHE_TTL,
+    max_tokens=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+)
@@ -0,0 +1,169 @@
+# app/services/cache_service.py
+import base64
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Redis values are decoded as text, so markers are control characters that
+# never start a model response. Unmarked values are plain text (legacy entries).
+_COMPRESSED = "\x1fz"
+_NEGATIVE = "\x1fn"
+
+
+class CachePolicy:
+    """
+    How one kind of AI result is cached.
+    ttl          — seconds a result lives in Redis (and at most that long locally)
+    negative_ttl — seconds a failure is remembered so retries don't hammer upstream (0 = off)
+    local        — keep a copy in the in-process LRU; off for one-off results like evaluations
+    local_ttl    — cap on the local copy's lifetime, for values other workers may invalidate
+    """
+    def __init__(self, ttl: int = 3600, negative_ttl: int = 30, local: bool = True,
+                 local_ttl: Optional[int] = None):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.local = local
+        self.local_ttl = local_ttl or ttl
+
+
+class LayeredCache:
+    """
+    Bounded in-process LRU in front of Redis.
+    Payloads above `compress_min_bytes` are stored zlib-compressed in Redis.
+    get() returns (hit, value); a hit with value None is a cached failure.
+    """
+    def __init__(self, redis, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024,
+                 compress_min_bytes: int = 1024):
+        self.redis = redis
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.compress_min_bytes = compress_min_bytes
+        self._local: "OrderedDict[str, Tuple[float, Optional[str], int]]" = OrderedDict()
+        self._local_bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {
+            "local_hits": 0, "redis_hits": 0, "misses": 0, "negative_hits": 0,
+            "sets": 0, "evictions": 0, "redis_bytes_written": 0, "compressed_bytes_saved": 0,
+        }
+
+    # ── Local tier ───────────────────────────────────────────────
+    def _local_get(self, key: str):
+        with self._lock:
+            item = self._local.get(key)
+            if item is None:
+                return False, None
+            expires_at, value, size = item
+            if expires_at <= time.monotonic():
+                del self._local[key]
+                self._local_bytes -= size
+                return False, None
+            self._local.move_to_end(key)
+            return True, value
+
+    def _local_put(self, key: str, value: Optional[str], ttl: int):
+        size = len(key) + (len(value) if value else 0)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._local.pop(key, None)
+            if old:
+                self._local_bytes -= old[2]
+            self._local[key] = (time.monotonic() + ttl, value, size)
+            self._local_bytes += size
+            while len(self._local) > self.max_entries or self._local_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._local.popitem(last=False)
+                self._local_bytes -= evicted_size
+                self.counters["evictions"] += 1
+
+    # ── Redis tier ───────────────────────────────────────────────
+    def _encode(self, value: str) -> str:
+        raw = value.encode("utf-8")
+        if len(raw) < self.compress_min_bytes:
+            return value
+        packed = _COMPRESSED + base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+        if len(packed) >= len(value):
+            return value
+        self.counters["compressed_bytes_saved"] += len(value) - len(packed)
+        return packed
+
+    @staticmethod
+    def _decode(stored: str) -> str:
+        if stored.startswith(_COMPRESSED):
+            return zlib.decompress(base64.b64decode(stored[len(_COMPRESSED):])).decode("utf-8")
+        return stored
+
+    def _redis_get(self, key: str) -> Optional[str]:
+        try:
+            return self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Cache read failed: {e}")
+            return None
+
+    def _redis_set(self, key: str, stored: str, ttl: int):
+        try:
+            self.redis.set(key, stored, ex=ttl)
+            self.counters["redis_bytes_written"] += len(stored)
+        except Exception as e:
+            logger.warning(f"Cache write failed: {e}")
+
+    # ── Public API ───────────────────────────────────────────────
+    def get(self, key: str, policy: CachePolicy) -> Tuple[bool, Optional[str]]:
+        if policy.local:
+            hit, value = self._local_get(key)
+            if hit:
+                self.counters["local_hits" if value is not None else "negative_hits"] += 1
+                return True, value
+
+        stored = self._redis_get(key)
+        if not stored:
+            self.counters["misses"] += 1
+            return False, None
+        if stored == _NEGATIVE:
+            self.counters["negative_hits"] += 1
+            return True, None
+
+        value = self._decode(stored)
+        self.counters["redis_hits"] += 1
+        if policy.local:
+            # Keys are content hashes, so a local copy outliving the Redis TTL is never stale
+            self._local_put(key, value, policy.local_ttl)
+        return True, value
+
+    def set(self, key: str, value: str, policy: CachePolicy):
+        self.counters["sets"] += 1
+        self._redis_set(key, self._encode(value), policy.ttl)
+        if policy.local:
+            self._local_put(key, value, policy.local_ttl)
+
+    def set_negative(self, key: str, policy: CachePolicy):
+        if not policy.negative_ttl:
+            return
+        self._redis_set(key, _NEGATIVE, policy.negative_ttl)
+        if policy.local:
+            self._local_put(key, None, min(policy.negative_ttl, policy.local_ttl))
+
+    def delete(self, key: str):
+        """Drop a key from Redis and this worker's LRU; other workers' copies expire after local_ttl."""
+        with self._lock:
+            item = self._local.pop(key, None)
+            if item:
+                self._local_bytes -= item[2]
+        try:
+            self.redis.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache delete failed: {e}")
+
+    def stats(self) -> dict:
+        hits = self.counters["local_hits"] + self.counters["redis_hits"]
+        lookups = hits + self.counters["misses"] + self.counters["negative_hits"]
+        return {
+            **self.counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "local_entries": len(self._local),
+            "local_bytes": self._local_bytes,
+        }
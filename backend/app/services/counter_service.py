@@ -0,0 +1,176 @@
+# app/services/counter_service.py
+"""
+Write-behind buffer for hot row counters (post views and votes).
+
+Request handlers call post_counters.incr(); deltas accumulate in one Redis
+hash (HINCRBY, so concurrent workers never lose an update), or in process
+memory when Redis is unavailable. A flusher thread in each API process drains
+the buffer every COUNTER_FLUSH_INTERVAL seconds and applies it as one batch
+of atomic `col = col + :delta` UPDATEs — a post viewed 10,000 times a minute
+costs the database one row write per interval, not 10,000 row locks.
+
+Draining renames the live hash to a processing key first, so increments that
+arrive mid-flush land in a fresh hash. The processing key is deleted only
+after the batch commits; if the apply fails it is retried on the next flush.
+Each batch carries an id that apply() records in the same transaction
+(AppliedCounterBatch), so a batch that committed just before a crash is
+skipped, not applied twice, when the next flush retries it.
+"""
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+from app.core.database import SessionLocal, get_redis, redis_available
+from app.repositories.post_repository import PostRepository
+
+logger = logging.getLogger(__name__)
+
+Deltas = Dict[str, Dict[str, int]]  # row id -> {field: delta}
+
+BATCH_FIELD = "batch"  # in the processing hash; counter fields are always "<row id>:<field>"
+
+# Delete the flush lock only if this flusher still holds it
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCounterStore:
+    def __init__(self, redis, prefix: str):
+        self.redis = redis
+        self.live = f"{prefix}:live"
+        self.processing = f"{prefix}:processing"
+        self.lock = f"{prefix}:flush_lock"
+
+    def incr(self, row_id: str, field: str, amount: int):
+        self.redis.hincrby(self.live, f"{row_id}:{field}", amount)
+
+    def pending(self, row_id: str, fields) -> Dict[str, int]:
+        values = self.redis.hmget(self.live, [f"{row_id}:{f}" for f in fields])
+        return {f: int(v) for f, v in zip(fields, values) if v}
+
+    def flush(self, apply: Callable[[Deltas, Optional[str]], None]) -> int:
+        # One flusher across all processes at a time; the token keeps a slow
+        # flusher whose lock expired from releasing its successor's
+        token = uuid.uuid4().hex
+        if not self.redis.set(self.lock, token, nx=True, ex=60):
+            return 0
+        try:
+            if not self.redis.exists(self.processing):
+                try:
+                    self.redis.rename(self.live, self.processing)
+                except Exception:
+                    return 0  # nothing buffered
+            # A batch keeps its id across retries (HSETNX), which is what makes replays detectable
+            self.redis.hsetnx(self.processing, BATCH_FIELD, uuid.uuid4().hex)
+            raw = self.redis.hgetall(self.processing)
+            batch_id = f"{self.processing}:{raw.pop(BATCH_FIELD)}"
+            deltas: Deltas = defaultdict(dict)
+            for key, value in raw.items():
+                row_id, field = key.rsplit(":", 1)
+                if int(value):
+                    deltas[row_id][field] = int(value)
+            if deltas:
+                apply(dict(deltas), batch_id)
+            self.redis.delete(self.processing)
+            return len(deltas)
+        finally:
+            self.redis.eval(RELEASE_LOCK_SCRIPT, 1, self.lock, token)
+
+
+class MemoryCounterStore:
+    def __init__(self):
+        self._deltas: Deltas = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def incr(self, row_id: str, field: str, amount: int):
+        with self._lock:
+            self._deltas[row_id][field] += amount
+
+    def pending(self, row_id: str, fields) -> Dict[str, int]:
+        with self._lock:
+            row = self._deltas.get(row_id, {})
+            return {f: row[f] for f in fields if row.get(f)}
+
+    def flush(self, apply: Callable[[Deltas], None]) -> int:
+        with self._lock:
+            drained, self._deltas = self._deltas, defaultdict(lambda: defaultdict(int))
+        deltas = {row_id: {f: v for f, v in row.items() if v} for row_id, row in drained.items()}
+        deltas = {row_id: row for row_id, row in deltas.items() if row}
+        if not deltas:
+            return 0
+        try:
+            apply(deltas)
+        except Exception:
+            # Put the batch back so the next flush retries it
+            with self._lock:
+                for row_id, row in deltas.items():
+                    for field, value in row.items():
+                        self._deltas[row_id][field] += value
+            raise
+        return len(deltas)
+
+
+class CounterBuffer:
+    def __init__(self, store, apply: Callable[[Deltas], None] = None):
+        self.store = store
+        self.apply = apply
+        self._stop = threading.Event()
+        self._thread = None
+
+    def incr(self, row_id: str, field: str, amount: int = 1):
+        if amount:
+            self.store.incr(row_id, field, amount)
+
+    def pending(self, row_id: str, fields) -> Dict[str, int]:
+        """Buffered, not-yet-flushed deltas for one row (to show read-your-writes counts)."""
+        try:
+            return self.store.pending(row_id, list(fields))
+        except Exception as e:
+            logger.warning(f"Counter read failed: {e}")
+            return {}
+
+    def flush(self) -> int:
+        """Apply everything buffered so far; returns the number of rows written."""
+        return self.store.flush(self.apply)
+
+    def _run(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Counter flush failed: {e}")
+
+    def start_flusher(self, interval: float):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="counter-flusher", daemon=True)
+        self._thread.start()
+
+    def stop_flusher(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        try:
+            self.flush()  # don't drop what this process buffered
+        except Exception as e:
+            logger.error(f"Counter flush failed: {e}")
+
+
+def _apply_post_deltas(deltas: Deltas, batch_id: Optional[str] = None):
+    db = SessionLocal()
+    try:
+        PostRepository(db).apply_counter_deltas(deltas, batch_id)
+    finally:
+        db.close()
+
+
+post_counters = CounterBuffer(
+    RedisCounterStore(get_redis(), "post_counters") if redis_available else MemoryCounterStore(),
+    apply=_apply_post_deltas,
+)
@@ -0,0 +1,73 @@
+# app/services/data_version.py
+"""
+Per-user data versions for conditional GETs.
+
+Every write that changes what a user's dashboard shows replaces the user's
+version token once it has committed (ReadinessRepository does this for
+mark_dirty and recompute, which every dashboard input already goes through).
+The dashboard ETag is the token plus today's date, since the streak and the
+weekly window roll over at midnight without a write. A poll whose
+If-None-Match still matches costs one Redis GET and never opens a database
+connection.
+
+Tokens are random rather than counters, so a key that expires or is evicted
+comes back as a new token and can never make an old ETag match again.
+Without Redis the workers cannot share versions, so ETags are switched off
+and every request is served in full.
+"""
+import datetime
+import logging
+import secrets
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import get_redis, redis_available
+from app.utils.etag import weak_etag
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersions:
+    def __init__(self, redis, prefix: str, ttl: int, enabled: bool = True):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+        self.enabled = enabled
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.prefix}:{user_id}"
+
+    def bump(self, user_id: str):
+        """Call after the write has committed, so a reader can never pair the new token with old data."""
+        if not self.enabled:
+            return
+        try:
+            self.redis.set(self._key(user_id), secrets.token_hex(8), ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Data version bump failed for {user_id}: {e}")
+
+    def current(self, user_id: str) -> Optional[str]:
+        """The user's token, minting one on first use; None when versions are unavailable."""
+        if not self.enabled:
+            return None
+        key = self._key(user_id)
+        try:
+            token = self.redis.get(key)
+            if token is None:
+                fresh = secrets.token_hex(8)
+                token = fresh if self.redis.set(key, fresh, ex=self.ttl, nx=True) else self.redis.get(key)
+            return token
+        except Exception as e:
+            logger.warning(f"Data version read failed for {user_id}: {e}")
+            return None
+
+    def etag(self, user_id: str, today: Optional[datetime.date] = None) -> Optional[str]:
+        """Read before building the response: a write landing meanwhile then only costs one extra 200."""
+        token = self.current(user_id)
+        if token is None:
+            return None
+        return weak_etag(token, (today or datetime.date.today()).strftime("%Y%m%d"))
+
+
+dashboard_versions = DataVersions(get_redis(), prefix="dataver:dashboard",
+                                  ttl=settings.DATA_VERSION_TTL, enabled=redis_available)
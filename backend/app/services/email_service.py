@@ -1,10 +1,15 @@
 # app/services/email_service.py
 import logging
 import smtplib
+import hashlib
+import json
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
 from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.services.job_service import job, job_queue
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +41,33 @@ class EmailService:
             return False
 
     @staticmethod
-    async def send_weekly_report(user_email: str, stats: Dict[str, Any]):
+    def _deliver(template: str, user_id: str, fingerprint: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Queue the SMTP send off the request path. The job record holds only the
+        template name and user id (plus non-secret context); the worker renders
+        the message, so tokens never sit in Redis. Identical messages are sent once.
+        """
+        key = hashlib.sha256(f"{template}|{user_id}|{fingerprint}".encode()).hexdigest()
+        payload = {"template": template, "user_id": user_id}
+        if context:
+            payload["context"] = context
+        record = job_queue.enqueue("email.send", payload, idempotency_key=key)
+        return record["id"]
+
+    # ── Templates (rendered in the worker) ───────────────────────
+    @staticmethod
+    def render(template: str, user, context: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """(subject, body_html) for `user`, or None if the token it links has since been used or replaced."""
+        if template == "weekly_report":
+            return EmailService._render_weekly_report(context)
+        if template == "verification":
+            return EmailService._render_verification(user.verification_token) if user.verification_token else None
+        if template == "password_reset":
+            return EmailService._render_password_reset(user.reset_token) if user.reset_token else None
+        raise ValueError(f"Unknown email template: {template}")
+
+    @staticmethod
+    def _render_weekly_report(stats: Dict[str, Any]) -> Tuple[str, str]:
         subject = "Your Weekly InterviewAce Performance Report"
         body = f"""
         <html>
@@ -53,10 +84,10 @@ class EmailService:
             </body>
         </html>
         """
-        return EmailService._send_email(user_email, subject, body)
+        return subject, body
 
     @staticmethod
-    async def send_verification_email(user_email: str, token: str):
+    def _render_verification(token: str) -> Tuple[str, str]:
         verify_url = f"{settings.FRONTEND_URL}/verify-email?token={token}"
         subject = "Verify your InterviewAce Account"
         body = f"""
@@ -69,10 +100,10 @@ class EmailService:
             </body>
         </html>
         """
-        return EmailService._send_email(user_email, subject, body)
+        return subject, body
 
     @staticmethod
-    async def send_password_reset(user_email: str, token: str):
+    def _render_password_reset(token: str) -> Tuple[str, str]:
         reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token}"
         subject = "Reset your InterviewAce Password"
         body = f"""
@@ -86,7 +117,36 @@ class EmailService:
             </body>
         </html>
         """
-        return EmailService._send_email(user_email, subject, body)
+        return subject, body
 
-email_service = EmailService()
+    # ── Senders ──────────────────────────────────────────────────
+    @staticmethod
+    async def send_weekly_report(user_id: str, stats: Dict[str, Any]):
+        return EmailService._deliver("weekly_report", user_id, json.dumps(stats, sort_keys=True), stats)
+
+    @staticmethod
+    async def send_verification_email(user_id: str, token: str):
+        """`token` is the one stored on the user; it only keys deduplication and is not queued."""
+        return EmailService._deliver("verification", user_id, hashlib.sha256(token.encode()).hexdigest())
 
+    @staticmethod
+    async def send_password_reset(user_id: str, token: str):
+        """`token` is the one stored on the user; it only keys deduplication and is not queued."""
+        return EmailService._deliver("password_reset", user_id, hashlib.sha256(token.encode()).hexdigest())
+
+@job("email.send", max_retries=5, backoff=30.0)
+def send_email_job(template: str, user_id: str, context: Optional[Dict[str, Any]] = None) -> dict:
+    db = SessionLocal()
+    try:
+        user = db.query(User.email, User.verification_token, User.reset_token).filter(User.id == user_id).first()
+    finally:
+        db.close()
+    rendered = EmailService.render(template, user, context or {}) if user else None
+    if rendered is None:
+        return {"sent": False}  # user deleted, or the link was used or replaced before we got here
+    subject, body_html = rendered
+    if not EmailService._send_email(user.email, subject, body_html):
+        raise RuntimeError(f"SMTP delivery for user {user_id} failed")
+    return {"sent": True}
+
+email_service = EmailService()
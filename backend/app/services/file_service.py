@@ -0,0 +1,68 @@
+# app/services/file_service.py
+import asyncio
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Tuple
+from fastapi import UploadFile, HTTPException
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class _HashingWriter:
+    """Writes chunks to a file and updates a SHA-256 digest; runs in a worker thread."""
+    def __init__(self, fp):
+        self.fp = fp
+        self.digest = hashlib.sha256()
+
+    def write(self, chunk: bytes):
+        self.fp.write(chunk)
+        self.digest.update(chunk)
+
+
+async def save_upload_stream(
+    upload: UploadFile,
+    dest_dir: Path,
+    suffix: str,
+    max_bytes: int,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[str, int, str]:
+    """
+    Stream an upload to `dest_dir` in fixed-size chunks, so memory stays constant
+    whatever the file size. Disk writes and hashing run off the event loop.
+
+    The file gets a random name, so its URL can't be derived from its content,
+    and is written to a temp file and renamed into place, so readers never see
+    a partial file. The SHA-256 is returned for callers to store and dedupe on.
+    Raises 413 as soon as `max_bytes` is exceeded.
+    Returns (filename, size_bytes, sha256_hex).
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest_dir / f".{uuid.uuid4().hex}.part"
+    size = 0
+    try:
+        fp = await asyncio.to_thread(open, tmp_path, "wb")
+        try:
+            writer = _HashingWriter(fp)
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Recording exceeds the {max_bytes // (1024 * 1024)}MB limit",
+                    )
+                await asyncio.to_thread(writer.write, chunk)
+        finally:
+            await asyncio.to_thread(fp.close)
+
+        filename = f"{uuid.uuid4().hex}{suffix}"
+        await asyncio.to_thread(os.replace, tmp_path, dest_dir / filename)
+        return filename, size, writer.digest.hexdigest()
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
@@ -0,0 +1,324 @@
+# app/services/job_service.py
+"""
+Background job queue for work that shouldn't run on the request path.
+
+Handlers register with @job("name"). Endpoints call job_queue.enqueue() and
+return the job id and its poll token; clients poll GET /api/jobs/{id} as the
+job's owner or, for guests, with the token in X-Job-Token. Jobs live in Redis
+(queue list + delayed-retry zset + per-job JSON record) so any worker process
+can run them, or in process memory when Redis is unavailable.
+
+A popped job moves atomically into its process's processing list and leaves
+it only when the attempt is recorded. Each process heartbeats; jobs held by
+a process that stopped heartbeating (crashed, killed) are requeued by the
+reaper in any surviving process, so a worker crash never loses a job.
+
+Workers are threads: JOB_WORKERS of them start inside each API process, and
+`python -m app.worker` runs dedicated worker processes against Redis.
+"""
+import asyncio
+import heapq
+import importlib
+import json
+import logging
+import queue
+import secrets
+import threading
+import time
+import uuid
+import datetime
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.database import get_redis, redis_available
+
+logger = logging.getLogger(__name__)
+
+# Modules that define @job handlers; imported before workers start
+JOB_MODULES = [
+    "app.services.email_service",
+    "app.controllers.evaluation_controller",
+    "app.routes.voice",
+    "app.routes.behavioral",
+]
+
+
+class JobSpec:
+    def __init__(self, name: str, func: Callable, max_retries: int, backoff: float):
+        self.name = name
+        self.func = func
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+
+JOB_HANDLERS: Dict[str, JobSpec] = {}
+
+
+def job(name: str, max_retries: int = 3, backoff: float = 2.0):
+    """Register a sync or async function as a job handler. Payload is passed as kwargs."""
+    def decorator(func: Callable) -> Callable:
+        JOB_HANDLERS[name] = JobSpec(name, func, max_retries, backoff)
+        return func
+    return decorator
+
+
+def _now() -> str:
+    return datetime.datetime.utcnow().isoformat()
+
+
+# ── Stores ───────────────────────────────────────────────────────
+class RedisJobStore:
+    def __init__(self, redis, prefix: str = "jobs", consumer: Optional[str] = None):
+        self.redis = redis
+        self.prefix = prefix
+        self.queue_key = f"{prefix}:queue"
+        self.delayed_key = f"{prefix}:delayed"
+        self.consumers_key = f"{prefix}:consumers"  # zset: consumer -> last heartbeat
+        self.consumer = consumer or uuid.uuid4().hex
+        self.processing_key = self._processing_key(self.consumer)
+
+    def _processing_key(self, consumer: str) -> str:
+        return f"{self.prefix}:processing:{consumer}"
+
+    def save(self, record: dict):
+        self.redis.set(f"{self.prefix}:{record['id']}", json.dumps(record, default=str), ex=settings.JOB_RESULT_TTL)
+
+    def load(self, job_id: str) -> Optional[dict]:
+        raw = self.redis.get(f"{self.prefix}:{job_id}")
+        return json.loads(raw) if raw else None
+
+    def claim_idempotency_key(self, key: str, job_id: str) -> Optional[str]:
+        """Bind key to job_id; returns the job id already bound to it, if any."""
+        idem_key = f"{self.prefix}:idem:{key}"
+        if self.redis.set(idem_key, job_id, nx=True, ex=settings.JOB_RESULT_TTL):
+            return None
+        return self.redis.get(idem_key)
+
+    def push(self, job_id: str):
+        self.redis.lpush(self.queue_key, job_id)
+
+    def push_delayed(self, job_id: str, run_at: float):
+        self.redis.zadd(self.delayed_key, {job_id: run_at})
+
+    def pop(self, timeout: float) -> Optional[str]:
+        # Promote due retries; ZREM decides which worker gets each one
+        for job_id in self.redis.zrangebyscore(self.delayed_key, 0, time.time()):
+            if self.redis.zrem(self.delayed_key, job_id):
+                self.redis.lpush(self.queue_key, job_id)
+        return self.redis.blmove(self.queue_key, self.processing_key, max(1, int(timeout)), "RIGHT", "LEFT")
+
+    def ack(self, job_id: str):
+        """The attempt is recorded (done, failed or scheduled for retry): drop it from processing."""
+        self.redis.lrem(self.processing_key, 1, job_id)
+
+    def heartbeat(self):
+        self.redis.zadd(self.consumers_key, {self.consumer: time.time()})
+
+    def reap(self, stale_after: float) -> int:
+        """Requeue jobs held by consumers silent for `stale_after` seconds; returns how many."""
+        requeued = 0
+        for consumer in self.redis.zrangebyscore(self.consumers_key, 0, time.time() - stale_after):
+            if consumer == self.consumer:
+                continue
+            # LMOVE hands each job to exactly one reaper
+            while self.redis.lmove(self._processing_key(consumer), self.queue_key, "RIGHT", "LEFT"):
+                requeued += 1
+            self.redis.zrem(self.consumers_key, consumer)
+        return requeued
+
+
+class MemoryJobStore:
+    def __init__(self):
+        self.records: Dict[str, dict] = {}
+        self.idempotency: Dict[str, str] = {}
+        self.queue: "queue.Queue[str]" = queue.Queue()
+        self.delayed: list = []
+        self.lock = threading.Lock()
+
+    def save(self, record: dict):
+        with self.lock:
+            self.records[record["id"]] = json.loads(json.dumps(record, default=str))
+
+    def load(self, job_id: str) -> Optional[dict]:
+        with self.lock:
+            record = self.records.get(job_id)
+            return dict(record) if record else None
+
+    def claim_idempotency_key(self, key: str, job_id: str) -> Optional[str]:
+        with self.lock:
+            existing = self.idempotency.get(key)
+            if existing is None:
+                self.idempotency[key] = job_id
+            return existing
+
+    def push(self, job_id: str):
+        self.queue.put(job_id)
+
+    def push_delayed(self, job_id: str, run_at: float):
+        with self.lock:
+            heapq.heappush(self.delayed, (run_at, job_id))
+
+    def pop(self, timeout: float) -> Optional[str]:
+        with self.lock:
+            while self.delayed and self.delayed[0][0] <= time.time():
+                self.queue.put(heapq.heappop(self.delayed)[1])
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    # In-process: a crash takes the queue with it, so there is nothing to track or reap
+    def ack(self, job_id: str):
+        pass
+
+    def heartbeat(self):
+        pass
+
+    def reap(self, stale_after: float) -> int:
+        return 0
+
+
+# ── Queue ────────────────────────────────────────────────────────
+class JobQueue:
+    def __init__(self, store):
+        self.store = store
+        self._workers: list = []
+        self._reaper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    def enqueue(self, name: str, payload: Dict[str, Any], idempotency_key: Optional[str] = None,
+                user_id: Optional[str] = None) -> dict:
+        """Queue a job and return its record. A repeated idempotency key returns the original job."""
+        if name not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job: {name}")
+        job_id = uuid.uuid4().hex
+        if idempotency_key:
+            existing = self.store.claim_idempotency_key(f"{name}:{idempotency_key}", job_id)
+            if existing:
+                record = self.store.load(existing)
+                if record:
+                    return record
+
+        record = {
+            "id": job_id, "name": name, "payload": payload, "status": "queued",
+            "attempts": 0, "max_retries": JOB_HANDLERS[name].max_retries,
+            "result": None, "error": None, "user_id": user_id, "poll_token": secrets.token_urlsafe(16),
+            "idempotency_key": idempotency_key, "created_at": _now(), "updated_at": _now(),
+        }
+        self.store.save(record)
+        self.store.push(job_id)
+        return record
+
+    def get(self, job_id: str) -> Optional[dict]:
+        return self.store.load(job_id)
+
+    # ── Execution ────────────────────────────────────────────────
+    def _async_loop(self) -> asyncio.AbstractEventLoop:
+        """One shared event loop thread runs every async handler for this process."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="jobs-loop", daemon=True).start()
+            return self._loop
+
+    def _call(self, spec: JobSpec, payload: dict):
+        result = spec.func(**payload)
+        if asyncio.iscoroutine(result):
+            result = asyncio.run_coroutine_threadsafe(result, self._async_loop()).result()
+        return result
+
+    def run_one(self, timeout: float = 1.0) -> bool:
+        """Take one job off the queue and run it. Returns False if none was available."""
+        job_id = self.store.pop(timeout)
+        if not job_id:
+            return False
+        try:
+            self._run(job_id)
+        finally:
+            self.store.ack(job_id)
+        return True
+
+    def _run(self, job_id: str):
+        record = self.store.load(job_id)
+        if not record:
+            return  # expired
+        spec = JOB_HANDLERS.get(record["name"])
+        if spec is None:
+            record.update(status="failed", error=f"No handler registered for {record['name']}", updated_at=_now())
+            self.store.save(record)
+            return
+        if record["status"] == "running" and record["attempts"] > record["max_retries"]:
+            # Requeued by the reaper after its last attempt took a worker down with it
+            record.update(status="failed", error="Worker lost during final attempt", updated_at=_now())
+            self.store.save(record)
+            return
+
+        record.update(status="running", attempts=record["attempts"] + 1, updated_at=_now())
+        self.store.save(record)
+        try:
+            result = self._call(spec, record["payload"])
+            record.update(status="succeeded", result=result, error=None, updated_at=_now())
+        except Exception as e:
+            logger.warning(f"Job {record['name']} ({job_id}) attempt {record['attempts']} failed: {e}")
+            record.update(error=str(e), updated_at=_now())
+            if record["attempts"] <= record["max_retries"]:
+                record["status"] = "retrying"
+                self.store.push_delayed(job_id, time.time() + spec.backoff * 2 ** (record["attempts"] - 1))
+            else:
+                record["status"] = "failed"
+        self.store.save(record)
+
+    def _work(self):
+        while not self._stop.is_set():
+            try:
+                self.run_one(timeout=1.0)
+            except Exception as e:
+                logger.error(f"Job worker error: {e}")
+                time.sleep(1)
+
+    def _reap(self, interval: float, stale_after: float):
+        while not self._stop.wait(interval):
+            try:
+                self.store.heartbeat()
+                requeued = self.store.reap(stale_after)
+                if requeued:
+                    logger.warning(f"Requeued {requeued} job(s) from lost workers")
+            except Exception as e:
+                logger.error(f"Job reaper error: {e}")
+
+    def start_workers(self, count: int):
+        load_job_modules()
+        self._stop.clear()
+        for i in range(count):
+            worker = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        if count:
+            self.store.heartbeat()
+            self._reaper = threading.Thread(
+                target=self._reap, args=(settings.JOB_HEARTBEAT_INTERVAL, settings.JOB_WORKER_TIMEOUT),
+                name="job-reaper", daemon=True,
+            )
+            self._reaper.start()
+
+    def stop_workers(self):
+        self._stop.set()
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers = []
+        if self._reaper:
+            self._reaper.join(timeout=5)
+            self._reaper = None
+
+
+def load_job_modules():
+    for module in JOB_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Job handlers in {module} unavailable: {e}")
+
+
+job_queue = JobQueue(RedisJobStore(get_redis()) if redis_available else MemoryJobStore())
@@ -5,7 +5,11 @@ No GPU needed. All pretrained model calls via HuggingFace Inference API.
 """
 
 import re, os, math
-from typing import Optional
+import multiprocessing
+from typing import Optional, Iterable, Iterator, Union
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 import requests
 
 # ── Filler word taxonomy ──────────────────────────────────────
@@ -32,11 +36,102 @@ STAR_ACTION     = ["action", "i decided", "i implemented", "i built", "i led", "
 STAR_RESULT     = ["result", "outcome", "achieved", "reduced by", "increased by", "improved by", "learned", "% ", "percent"]
 
 
-def detect_fillers(text: str) -> list:
+# ── Sentiment proxies (used when HF sentiment is unavailable) ──
+POSITIVE_WORDS  = ["happy", "proud", "excited", "passionate", "enjoy", "love", "great", "excellent",
+                   "succeeded", "thrilled", "grateful", "motivated", "achieved", "delivered"]
+NEGATIVE_WORDS  = ["failed", "bad", "terrible", "worst", "hate", "difficult", "impossible", "struggle"]
+
+
+# ── Single-pass lexicon matcher ───────────────────────────────
+# Every filler, power word, STAR keyword and sentiment word is compiled into
+# one lookahead alternation at import time, so a transcript is scanned once
+# instead of once per term. Fillers and power words keep their \bword\b
+# semantics; STAR and sentiment terms keep plain substring semantics.
+def _trie_pattern(terms: list) -> str:
+    """Prefix-factored alternation; greedy optional tails yield the longest term."""
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _build_lexicon():
+    entries = {}  # term -> [(group, label, word_bounded)]
+    for filler in ALL_FILLERS:
+        entries.setdefault(filler, []).append(("filler", filler, True))
+    for category, words in POWER_WORDS.items():
+        for word in words:
+            entries.setdefault(word, []).append(("power", word, True))
+    for part, keywords in (("situation", STAR_SITUATION), ("task", STAR_TASK),
+                           ("action", STAR_ACTION), ("result", STAR_RESULT)):
+        for kw in keywords:
+            entries.setdefault(kw, []).append(("star", part, False))
+    for word in POSITIVE_WORDS:
+        entries.setdefault(word, []).append(("positive", word, False))
+    for word in NEGATIVE_WORDS:
+        entries.setdefault(word, []).append(("negative", word, False))
+
+    # The lookahead reports the longest term at each position, so every
+    # shorter term that is a prefix of the reported one is checked as well.
+    terms = sorted(entries, key=len, reverse=True)
+    pattern = re.compile("(?=(" + _trie_pattern(terms) + "))")
+    prefixes = {m: [t for t in terms if m.startswith(t)] for m in terms}
+    return pattern, entries, prefixes
+
+_LEXICON_RE, _LEXICON_ENTRIES, _LEXICON_PREFIXES = _build_lexicon()
+_WORD_CHAR = re.compile(r"\w")
+_QUANTIFIED_RE = re.compile(r'\d+\s*(%|percent|x\b|times|users|hours|days|weeks|months)')
+_SPECIFICS_RE = re.compile(r'(for example|specifically|in particular|such as|including)', re.IGNORECASE)
+
+
+def _is_word_bounded(lower: str, start: int, end: int) -> bool:
+    return (start == 0 or not _WORD_CHAR.match(lower, start - 1)) and \
+           (end == len(lower) or not _WORD_CHAR.match(lower, end))
+
+
+def scan_lexicon(text: str) -> dict:
+    """
+    One pass over the lowercased transcript.
+    Returns filler counts plus the sets of power words, STAR parts and
+    sentiment words present.
+    """
     lower = text.lower()
+    hits = {"filler": {}, "power": set(), "star": set(), "positive": set(), "negative": set()}
+    filler_end = {}
+
+    for m in _LEXICON_RE.finditer(lower):
+        start = m.start()
+        for term in _LEXICON_PREFIXES[m.group(1)]:
+            end = start + len(term)
+            for group, label, word_bounded in _LEXICON_ENTRIES[term]:
+                if word_bounded and not _is_word_bounded(lower, start, end):
+                    continue
+                if group == "filler":
+                    # Non-overlapping occurrences, same as re.findall
+                    if start < filler_end.get(label, 0):
+                        continue
+                    filler_end[label] = end
+                    hits["filler"][label] = hits["filler"].get(label, 0) + 1
+                else:
+                    hits[group].add(label)
+    return hits
+
+
+def _fillers_from(hits: dict) -> list:
     found = []
     for filler in ALL_FILLERS:
-        count = len(re.findall(rf"\b{re.escape(filler)}\b", lower))
+        count = hits["filler"].get(filler, 0)
         if count:
             found.append({
                 "word": filler,
@@ -47,24 +142,29 @@ def detect_fillers(text: str) -> list:
     return sorted(found, key=lambda x: -x["severity"] * x["count"])
 
 
-def detect_power_words(text: str) -> dict:
-    lower = text.lower()
+def _power_words_from(hits: dict) -> dict:
     found = {}
     for category, words in POWER_WORDS.items():
-        matched = [w for w in words if re.search(rf"\b{w}\b", lower)]
+        matched = [w for w in words if w in hits["power"]]
         if matched:
             found[category] = matched
     return found
 
 
+def _star_from(hits: dict) -> dict:
+    return {part: part in hits["star"] for part in ("situation", "task", "action", "result")}
+
+
+def detect_fillers(text: str) -> list:
+    return _fillers_from(scan_lexicon(text))
+
+
+def detect_power_words(text: str) -> dict:
+    return _power_words_from(scan_lexicon(text))
+
+
 def detect_star(text: str) -> dict:
-    lower = text.lower()
-    return {
-        "situation": any(kw in lower for kw in STAR_SITUATION),
-        "task":      any(kw in lower for kw in STAR_TASK),
-        "action":    any(kw in lower for kw in STAR_ACTION),
-        "result":    any(kw in lower for kw in STAR_RESULT),
-    }
+    return _star_from(scan_lexicon(text))
 
 
 def compute_readability(text: str) -> dict:
@@ -168,10 +268,12 @@ def evaluate_answer(text: str, question_type: str = "Behavioral") -> dict:
     if not text or len(text.strip()) < 10:
         return {"error": "Answer too short to evaluate"}
 
+    lower       = text.lower()
+    hits        = scan_lexicon(text)
     readability = compute_readability(text)
-    fillers     = detect_fillers(text)
-    power_words = detect_power_words(text)
-    star        = detect_star(text)
+    fillers     = _fillers_from(hits)
+    power_words = _power_words_from(hits)
+    star        = _star_from(hits)
     wc          = readability["word_count"]
     sc          = readability["sentence_count"]
 
@@ -191,22 +293,19 @@ def evaluate_answer(text: str, question_type: str = "Behavioral") -> dict:
     clarity = max(0, min(10, clarity_base - filler_penalty))
 
     # 4. Tone — sentiment (HF) or positive language proxy
-    positive_words = ["happy", "proud", "excited", "passionate", "enjoy", "love", "great", "excellent",
-                      "succeeded", "thrilled", "grateful", "motivated", "achieved", "delivered"]
-    neg_words = ["failed", "bad", "terrible", "worst", "hate", "difficult", "impossible", "struggle"]
-    pos_count = sum(1 for w in positive_words if w in text.lower())
-    neg_count = sum(1 for w in neg_words if w in text.lower())
+    pos_count = len(hits["positive"])
+    neg_count = len(hits["negative"])
     tone = min(10, 5 + pos_count - neg_count * 0.5 + len(power_words) * 0.5)
     tone = max(0, tone)
 
     # 5. Depth — quantified results, specific examples
-    has_numbers = bool(re.search(r'\d+\s*(%|percent|x\b|times|users|hours|days|weeks|months)', text.lower()))
-    has_specifics = bool(re.search(r'(for example|specifically|in particular|such as|including)', text.lower(), re.IGNORECASE))
+    has_numbers = bool(_QUANTIFIED_RE.search(lower))
+    has_specifics = bool(_SPECIFICS_RE.search(lower))
     depth = min(10, 3 + (wc / 25) + (3 if has_numbers else 0) + (2 if has_specifics else 0))
     depth = min(10, depth)
 
     # 6. Vocabulary — power words diversity + unique word ratio
-    words_lower = [w.lower() for w in text.split()]
+    words_lower = lower.split()
     unique_ratio = len(set(words_lower)) / max(len(words_lower), 1)
     power_diversity = len(power_words)  # number of categories
     vocab = min(10, 4 + unique_ratio * 6 + power_diversity * 0.5)
@@ -288,6 +387,91 @@ def evaluate_answer(text: str, question_type: str = "Behavioral") -> dict:
     }
 
 
+# ── Batch evaluation (process-pool fan-out) ──────────────────
+_BATCH_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _batch_pool() -> ProcessPoolExecutor:
+    """
+    Lazily created, shared across requests; one worker per core.
+    Workers are spawned, not forked: forking a threaded server can copy a lock
+    some other thread holds and deadlock the child.
+    """
+    global _BATCH_POOL
+    if _BATCH_POOL is None:
+        _BATCH_POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                          mp_context=multiprocessing.get_context("spawn"))
+    return _BATCH_POOL
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next batch starts a fresh one."""
+    global _BATCH_POOL
+    if _BATCH_POOL is pool:
+        _BATCH_POOL = None
+
+
+def _evaluate_item(index: int, text: str, question_type: str) -> tuple:
+    try:
+        return index, evaluate_answer(text, question_type)
+    except Exception as e:
+        return index, {"error": f"Evaluation failed: {e}"}
+
+
+def evaluate_answers(
+    texts: Iterable[str],
+    question_types: Union[Iterable[str], str, None] = None,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[tuple]:
+    """
+    Evaluate many answers on the shared process pool.
+    Yields (index, result) pairs in completion order. Input is consumed
+    lazily and at most `max_in_flight` items are queued at once, so memory
+    stays bounded regardless of batch size. If a worker process dies, the
+    items it takes down get an error result; closing the generator (client
+    disconnect) cancels whatever has not started.
+    """
+    if question_types is None or isinstance(question_types, str):
+        question_types = repeat(question_types or "Behavioral")
+
+    pool = _batch_pool()
+    limit = max_in_flight or 2 * (os.cpu_count() or 1)
+    items = enumerate(zip(texts, question_types))
+    pending = {}  # future -> item index
+
+    def submit_next() -> bool:
+        item = next(items, None)
+        if item is None:
+            return False
+        index, (text, question_type) = item
+        try:
+            future = pool.submit(_evaluate_item, index, text, question_type)
+        except BrokenProcessPool as e:
+            future = Future()
+            future.set_exception(e)
+        pending[future] = index
+        return True
+
+    try:
+        while len(pending) < limit and submit_next():
+            pass
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    _discard_pool(pool)
+                    result = index, {"error": "Evaluation failed: worker process died"}
+                yield result
+                submit_next()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 def evaluate_minute_segment(text: str, minute: int) -> dict:
     """
     Evaluate a per-minute transcript segment.
@@ -0,0 +1,98 @@
+# app/services/platform_service.py
+"""
+Platform-wide counters for /analytics/platform.
+
+- Users and sessions: PlatformCounterRepository bumps them in the same
+  transaction as the row. Registration and session deletes stage the bump
+  before their commit; session writers flush the row, call
+  AnalyticsRepository.record_session(commit=False) and commit once. So the
+  counts are exact.
+- Events: POST /analytics/event is the hottest write in the app, so its count
+  goes through the same write-behind buffer as post views (counter_service).
+  The stored total trails by at most one flush interval and counts buffered
+  in a lost Redis are dropped. It is approximate by design.
+- PlatformReconciler recounts everything from the tables every
+  PLATFORM_RECONCILE_INTERVAL seconds, at most once per interval across all
+  workers, and corrects any drift. With PLATFORM_EVENTS_APPROXIMATE on
+  Postgres the event total is taken from the planner's row estimate, not a
+  scan of analytics_events.
+"""
+import logging
+import threading
+from typing import Dict
+
+from app.core.config import settings
+from app.core.database import SessionLocal, get_redis, redis_available
+from app.repositories.platform_repository import PlatformCounterRepository
+from app.services.counter_service import CounterBuffer, MemoryCounterStore, RedisCounterStore
+
+logger = logging.getLogger(__name__)
+
+
+def _apply_event_deltas(deltas, batch_id=None):
+    db = SessionLocal()
+    try:
+        PlatformCounterRepository(db).apply_buffered(deltas, batch_id)
+    finally:
+        db.close()
+
+
+platform_events = CounterBuffer(
+    RedisCounterStore(get_redis(), "platform_counters") if redis_available else MemoryCounterStore(),
+    apply=_apply_event_deltas,
+)
+
+
+class PlatformReconciler:
+    def __init__(self, session_factory=SessionLocal, redis=None, approximate_events: bool = False,
+                 buffer: CounterBuffer = platform_events):
+        self.session_factory = session_factory
+        self.redis = redis
+        self.approximate_events = approximate_events
+        self.buffer = buffer
+        self._stop = threading.Event()
+        self._thread = None
+
+    def reconcile(self, interval: float = 0) -> Dict[str, int]:
+        """
+        Recount all counters; returns the drift corrected. With `interval`,
+        skips the pass if another worker reconciled in the last `interval` seconds.
+        """
+        if interval and self.redis is not None:
+            if not self.redis.set("platform_counters:reconciled", "1", nx=True, ex=max(1, int(interval * 0.9))):
+                return {}
+        # Buffered events are already rows: land them first so the recount doesn't double them
+        self.buffer.flush()
+        db = self.session_factory()
+        try:
+            drift = PlatformCounterRepository(db).reconcile(self.approximate_events)
+        finally:
+            db.close()
+        if drift:
+            logger.info(f"Platform counters reconciled, drift corrected: {drift}")
+        return drift
+
+    def _run(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.reconcile(interval)
+            except Exception as e:
+                logger.error(f"Platform counter reconcile failed: {e}")
+
+    def start(self, interval: float):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,),
+                                        name="platform-reconciler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+platform_reconciler = PlatformReconciler(
+    redis=get_redis() if redis_available else None,
+    approximate_events=settings.PLATFORM_EVENTS_APPROXIMATE,
+)
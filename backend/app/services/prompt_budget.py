@@ -0,0 +1,279 @@
+# app/services/prompt_budget.py
+"""
+Input-token budgeting for AI prompts.
+
+User text (resumes, pasted code, long answers) is the bulk of every prompt and
+is otherwise unbounded. Each template gets a PromptBudget: a token cap per
+user-supplied field, enforced with a local token estimate before the prompt
+is formatted, cached or sent. Shortening is structure-aware — resumes lose
+their low-value sections first, code loses comments before any logic — so
+what the model sees stays representative of the whole input.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+# ~How BPE tokenizers split text: up to 6 letters, up to 3 digits, or one other symbol per token
+_TOKEN_RE = re.compile(r"[A-Za-z]{1,6}|\d{1,3}|[^\sA-Za-z\d]")
+_NEWLINE_RUNS = re.compile(r"\n\s*\n(\s*\n)+")
+_INLINE_SPACE = re.compile(r"[ \t]{2,}")
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """
+    Local token estimate, no tokenizer download or API round trip. Slightly
+    high for plain English (a 7+ letter word counts as two tokens) so a budget
+    met here is met upstream too.
+    """
+    if not text:
+        return 0
+    # Line breaks and indentation are tokens too, mostly one per line
+    return len(_TOKEN_RE.findall(text)) + text.count("\n")
+
+
+def _squeeze(text: str) -> str:
+    """Collapse runs of blank lines and inline spaces (PDF extraction leaves plenty)."""
+    lines = []
+    for line in text.strip().splitlines():
+        body = line.lstrip()
+        lines.append(line[:len(line) - len(body)] + _INLINE_SPACE.sub(" ", body).rstrip())
+    return _NEWLINE_RUNS.sub("\n\n", "\n".join(lines))
+
+
+def _split_long_lines(lines: List[str], max_tokens: int) -> List[str]:
+    """
+    Break over-long lines (a pasted paragraph) at sentence ends, and run-on
+    sentences at word boundaries, so they can be kept partially.
+    """
+    out = []
+    for line in lines:
+        if estimate_tokens(line) <= max_tokens:
+            out.append(line)
+            continue
+        for sentence in re.split(r"(?<=[.!?;])\s+", line):
+            chunk, used = [], 0
+            for word in sentence.split():
+                cost = estimate_tokens(word)
+                if chunk and used + cost > max_tokens:
+                    out.append(" ".join(chunk))
+                    chunk, used = [], 0
+                chunk.append(word)
+                used += cost
+            if chunk:
+                out.append(" ".join(chunk))
+    return out
+
+
+def _head(lines: List[str], budget: int) -> int:
+    """How many leading lines fit in `budget` tokens."""
+    used = 0
+    for i, line in enumerate(lines):
+        used += estimate_tokens(line) + 1
+        if used > budget:
+            return i
+    return len(lines)
+
+
+def truncate_text(text: str, budget: int, marker: str = "[... {n} lines omitted ...]", squeeze: bool = True) -> str:
+    """
+    Keep the head and tail of `text` within `budget` tokens, eliding the middle.
+    Answers and job descriptions state the point first and sum up last.
+    """
+    if squeeze:
+        text = _squeeze(text)
+    if estimate_tokens(text) <= budget:
+        return text
+    lines = _split_long_lines(text.splitlines(), max(1, budget // 8))
+    room = budget - estimate_tokens(marker) - 1
+    head = _head(lines, int(room * 0.7))
+    tail = _head(lines[head:][::-1], room - sum(estimate_tokens(l) + 1 for l in lines[:head]))
+    omitted = len(lines) - head - tail
+    if omitted <= 0:
+        return "\n".join(lines)
+    return "\n".join(lines[:head] + [marker.format(n=omitted)] + (lines[-tail:] if tail else []))
+
+
+# ── Resumes ─────────────────────────────────────────────────────────
+
+# Lower keeps more of its text when trimming; priority 4 sections go first, whole
+RESUME_SECTION_PRIORITY = {
+    "experience": 0, "work experience": 0, "professional experience": 0, "employment": 0,
+    "work history": 0, "internships": 0, "internship": 0,
+    "skills": 1, "technical skills": 1, "projects": 1, "key projects": 1, "personal projects": 1,
+    "summary": 2, "profile": 2, "objective": 2, "career objective": 2, "about me": 2,
+    "education": 2, "academic background": 2,
+    "certifications": 3, "certificates": 3, "achievements": 3, "awards": 3, "publications": 3,
+    "leadership": 3, "volunteering": 3, "volunteer experience": 3, "extracurricular activities": 3,
+    "hobbies": 4, "interests": 4, "languages": 4, "references": 4, "declaration": 4,
+    "personal details": 4, "personal information": 4,
+}
+_SECTION_WEIGHT = {0: 4, 1: 3, 2: 2, 3: 1}
+_UNKNOWN_SECTION = 3
+
+
+def _heading_priority(line: str) -> Optional[int]:
+    """Section priority if `line` is a resume heading, else None."""
+    label = line.strip().strip(":").strip().lower()
+    if not label or len(label) > 40:
+        return None
+    if label in RESUME_SECTION_PRIORITY:
+        return RESUME_SECTION_PRIORITY[label]
+    letters = [c for c in line if c.isalpha()]
+    # Unlisted ALL-CAPS short lines ("OPEN SOURCE") are headings too
+    if letters and all(c.isupper() for c in letters) and len(label.split()) <= 4:
+        return _UNKNOWN_SECTION
+    return None
+
+
+def _resume_sections(text: str) -> List[Tuple[Optional[str], int, List[str]]]:
+    """[(heading, priority, body lines)]; the header block before the first heading has no heading."""
+    sections = [(None, 2, [])]
+    for line in text.splitlines():
+        priority = _heading_priority(line)
+        if priority is not None:
+            sections.append((line.strip(), priority, []))
+        else:
+            sections[-1][2].append(line)
+    return [s for s in sections if s[0] or any(l.strip() for l in s[2])]
+
+
+def _allocate(needs: List[int], weights: List[int], budget: int) -> List[int]:
+    """Water-fill `budget` across sections by weight; no section gets more than it needs."""
+    alloc = [0] * len(needs)
+    open_ = [i for i, need in enumerate(needs) if need > 0]
+    while open_ and budget > 0:
+        total_weight = sum(weights[i] for i in open_)
+        share = {i: budget * weights[i] / total_weight for i in open_}
+        satisfied = [i for i in open_ if needs[i] <= share[i]]
+        if not satisfied:
+            for i in open_:
+                alloc[i] = int(share[i])
+            break
+        for i in satisfied:
+            alloc[i] = needs[i]
+            budget -= needs[i]
+        open_ = [i for i in open_ if i not in satisfied]
+    return alloc
+
+
+def truncate_resume(text: str, budget: int) -> str:
+    """
+    Fit a resume into `budget` tokens by section: whitespace first, then
+    hobbies/references-type sections, then every remaining section trimmed to a
+    share weighted toward experience, skills and projects. Each section keeps
+    its first lines — the most recent role, the headline skills.
+    """
+    text = _squeeze(text)
+    if estimate_tokens(text) <= budget:
+        return text
+
+    sections = _resume_sections(text)
+    dropped = [h for h, p, _ in sections if p == 4]
+    sections = [s for s in sections if s[1] != 4]
+    note = f"[omitted sections: {', '.join(dropped)}]" if dropped else ""
+    body = "\n".join("\n".join(([h] if h else []) + lines) for h, _, lines in sections)
+    if estimate_tokens(body) + estimate_tokens(note) <= budget:
+        return "\n".join(filter(None, [body, note]))
+
+    marker = "[...]"
+    fixed = estimate_tokens(note) + sum(estimate_tokens(h) + 1 for h, _, _ in sections if h)
+    bodies = [_split_long_lines(lines, max(1, budget // 16)) for _, _, lines in sections]
+    needs = [sum(estimate_tokens(l) + 1 for l in lines) for lines in bodies]
+    weights = [_SECTION_WEIGHT[p] for _, p, _ in sections]
+    alloc = _allocate(needs, weights, budget - fixed)
+
+    out = []
+    for (heading, _, _), lines, need, room in zip(sections, bodies, needs, alloc):
+        if heading:
+            out.append(heading)
+        if room >= need:
+            out.extend(lines)
+            continue
+        keep = _head(lines, room - estimate_tokens(marker) - 1)
+        out.extend(lines[:keep])
+        out.append(marker)
+    if note:
+        out.append(note)
+    return "\n".join(out)
+
+
+# ── Code ────────────────────────────────────────────────────────────
+
+_HASH_COMMENT_LANGUAGES = {"python", "python3", "ruby", "shell", "bash", "r", "perl"}
+
+
+def _comment_prefix(language: Optional[str]) -> str:
+    return "#" if (language or "").lower() in _HASH_COMMENT_LANGUAGES else "//"
+
+
+def truncate_code(code: str, budget: int, language: Optional[str] = None) -> str:
+    """
+    Fit source code into `budget` tokens: drop blank-line runs and comment-only
+    lines, then keep the top (imports, signatures) and bottom (return paths,
+    driver code) and elide the middle with a comment in the language's syntax.
+    """
+    lines = [line.rstrip() for line in code.splitlines()]
+    if estimate_tokens("\n".join(lines)) <= budget:
+        return "\n".join(lines)
+
+    prefix = _comment_prefix(language)
+    lines = [l for l in lines if not l.lstrip().startswith(prefix)]
+    lines = [l for i, l in enumerate(lines) if l or (i and lines[i - 1])]
+    compacted = "\n".join(lines)
+    if estimate_tokens(compacted) <= budget:
+        return compacted
+    return truncate_text(compacted, budget, marker=f"{prefix} ... {{n}} lines omitted ...", squeeze=False)
+
+
+# ── Local NLP features ──────────────────────────────────────────────
+
+def compact_nlp_features(local_stats: Dict) -> str:
+    """
+    One line of the local NLP signals the evaluation prompt uses, instead of
+    the repr of the fillers list and readability dict (severity, category and
+    syllable fields the model has no use for).
+    """
+    fillers = ", ".join(f"{f['word']} x{f['count']}" for f in local_stats.get("fillers", [])[:5]) or "none"
+    r = local_stats.get("readability", {})
+    if not r:
+        return f"fillers: {fillers}"
+    return (f"fillers: {fillers}; {r.get('word_count', 0)} words, {r.get('sentence_count', 0)} sentences, "
+            f"{r.get('avg_sentence_length', 0)} words/sentence, Flesch {r.get('flesch_ease', 0)} "
+            f"({r.get('reading_level', '')})")
+
+
+# ── Budgets ─────────────────────────────────────────────────────────
+
+_SHORTENERS = {
+    "text": lambda value, budget, language: truncate_text(value, budget),
+    "resume": lambda value, budget, language: truncate_resume(value, budget),
+    "code": truncate_code,
+}
+
+
+class PromptBudget:
+    """
+    Token caps for the user-supplied fields of one prompt template.
+    Each field maps to max_tokens, or (max_tokens, kind) where kind is how it
+    is shortened: "text" (head + tail), "resume" (by section) or "code".
+    Fields not listed pass through untouched.
+    """
+    def __init__(self, **fields):
+        self.fields = {
+            name: spec if isinstance(spec, tuple) else (spec, "text")
+            for name, spec in fields.items()
+        }
+
+    def fit(self, fields: Dict[str, str], language: Optional[str] = None) -> Tuple[Dict[str, str], int, int]:
+        """(fitted fields, estimated tokens before, after) — over-budget fields shortened."""
+        fitted, before, after = {}, 0, 0
+        for name, value in fields.items():
+            value = value or ""
+            tokens = estimate_tokens(value)
+            before += tokens
+            if name in self.fields and tokens > self.fields[name][0]:
+                max_tokens, kind = self.fields[name]
+                value = _SHORTENERS[kind](value, max_tokens, language)
+                tokens = estimate_tokens(value)
+            fitted[name] = value
+            after += tokens
+        return fitted, before, after
@@ -0,0 +1,59 @@
+# app/services/readiness_service.py
+import logging
+import threading
+
+from app.core.database import SessionLocal
+from app.repositories.readiness_repository import ReadinessRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessRefresher:
+    """
+    Background recompute of dirty readiness scores. A burst of writes (a mock
+    interview saves a session, a streak and an evaluation) marks the row once
+    and is folded into a single recompute after `debounce` seconds.
+    Recomputes are idempotent, so refreshers in several workers can overlap safely.
+    """
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._stop = threading.Event()
+        self._thread = None
+
+    def refresh_due(self, debounce: float) -> int:
+        """Recompute every score whose debounce window has passed; returns how many."""
+        db = self.session_factory()
+        try:
+            repo = ReadinessRepository(db)
+            user_ids = repo.due(debounce)
+            for user_id in user_ids:
+                try:
+                    repo.recompute(user_id)
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Readiness recompute failed for {user_id}: {e}")
+            return len(user_ids)
+        finally:
+            db.close()
+
+    def _run(self, interval: float, debounce: float):
+        while not self._stop.wait(interval):
+            try:
+                self.refresh_due(debounce)
+            except Exception as e:
+                logger.error(f"Readiness refresh failed: {e}")
+
+    def start(self, interval: float, debounce: float):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval, debounce),
+                                        name="readiness-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+readiness_refresher = ReadinessRefresher()
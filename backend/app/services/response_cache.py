@@ -0,0 +1,113 @@
+# app/services/response_cache.py
+"""
+Declarative whole-response caching for public GET routes.
+
+    @router.get("/colleges")
+    @cached_response(ttl=300)
+    async def get_colleges(db: AsyncSession = Depends(get_async_db)): ...
+
+    @router.get("/topics")
+    @cached_response(ttl=3600, vary={"type": QUESTION_BANK})
+    def get_topics(type: str = "DSA / Coding"): ...
+
+The first call renders the route's return value to JSON once and stores the
+text with its ETag in a LayeredCache: Redis, shared by every worker, with a
+short-lived copy in each worker's LRU. Later calls send the stored text as
+is, with no handler run, no encoder pass and no database session. Clients
+get `Cache-Control: public, max-age=<ttl>`, and a matching If-None-Match is
+answered 304.
+
+The cache key is the route plus the parameters named in `vary`, and only
+those: any other argument must not change the response. `vary` maps each
+name to the values worth caching (or None for any value), so a client
+cannot grow the cache one made-up query string at a time; a request with
+a value outside the set runs the handler uncached. Entries are never
+invalidated, only expired, so use this for data every user may see
+slightly stale for `ttl` seconds. Responses a handler builds itself, and
+errors it raises, are passed through uncached. The decorated route must
+not declare a response_model.
+"""
+import functools
+import hashlib
+import inspect
+import json
+from typing import Collection, Dict, Optional, Union
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import get_redis
+from app.services.cache_service import CachePolicy, LayeredCache
+from app.utils.etag import not_modified, weak_etag
+
+_REQUEST_PARAM = "response_cache_request"
+
+response_cache = LayeredCache(
+    get_redis(),
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
+
+
+def render_json(content) -> str:
+    """The bytes FastAPI's JSONResponse would send, as text."""
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":"))
+
+
+def cached_response(ttl: int, vary: Union[Collection[str], Dict[str, Optional[Collection]]] = (),
+                    cache_control: Optional[str] = None, cache: LayeredCache = None):
+    """
+    Cache a public JSON GET route for `ttl` seconds; place it under the @router
+    decorator. `vary` names the parameters in the key, optionally with their
+    allowed values ({"type": QUESTION_BANK}); a bare name allows any value.
+    """
+    allowed = dict(vary) if isinstance(vary, dict) else dict.fromkeys(vary)
+    policy = CachePolicy(ttl=ttl, negative_ttl=0, local=True,
+                         local_ttl=min(ttl, settings.RESPONSE_CACHE_LOCAL_TTL))
+    header = cache_control or f"public, max-age={ttl}"
+
+    def decorator(endpoint):
+        signature = inspect.signature(endpoint)
+        unknown = set(allowed) - set(signature.parameters)
+        if unknown:
+            raise ValueError(f"cached_response vary names unknown parameters: {sorted(unknown)}")
+        name = f"resp:{endpoint.__module__}.{endpoint.__qualname__}"
+        is_async = inspect.iscoroutinefunction(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(**kwargs):
+            request: Request = kwargs.pop(_REQUEST_PARAM)
+            store = cache or response_cache
+            if any(values is not None and kwargs[k] not in values for k, values in allowed.items()):
+                return await endpoint(**kwargs) if is_async else await run_in_threadpool(endpoint, **kwargs)
+            key = name + ":" + urlencode(sorted((k, str(kwargs[k])) for k in allowed))
+
+            hit, stored = store.get(key, policy)
+            if hit and stored:
+                etag, body = stored.split("\n", 1)
+            else:
+                result = await endpoint(**kwargs) if is_async else await run_in_threadpool(endpoint, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                body = render_json(result)
+                etag = weak_etag(hashlib.blake2b(body.encode("utf-8"), digest_size=8).hexdigest())
+                store.set(key, f"{etag}\n{body}", policy)
+
+            unchanged = not_modified(request, etag, header)
+            if unchanged:
+                return unchanged
+            return Response(content=body, media_type="application/json",
+                            headers={"ETag": etag, "Cache-Control": header})
+
+        # FastAPI resolves the route's own parameters, plus the Request the wrapper needs
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        ])
+        return wrapper
+
+    return decorator
@@ -0,0 +1,83 @@
+# app/services/scheduler_service.py
+import datetime
+import logging
+import threading
+from typing import Dict, Optional
+
+from app.core.database import SessionLocal, get_redis, redis_available
+from app.repositories.counter_batch_repository import CounterBatchRepository
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.repositories.readiness_repository import ReadinessRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+logger = logging.getLogger(__name__)
+
+
+class DailySweeper:
+    """
+    Once-a-day maintenance for state that goes stale with no write at all:
+    practice streaks lapse at midnight, so readiness scores and leaderboard
+    entries that still count one are expired here. Expired refresh tokens and
+    old counter-batch ledger rows are purged. Checks every `interval` seconds
+    (the first check runs at startup); with Redis, one worker runs each day's sweep.
+    """
+    def __init__(self, session_factory=SessionLocal, redis=None):
+        self.session_factory = session_factory
+        self.redis = redis
+        self._stop = threading.Event()
+        self._thread = None
+        self._swept_on: Optional[datetime.date] = None
+
+    def sweep(self, today: Optional[datetime.date] = None) -> Dict[str, int]:
+        """Run today's sweep if nobody has; returns rows expired or purged per table."""
+        today = today or datetime.date.today()
+        if self._swept_on == today:
+            return {}
+        key = f"daily_sweep:{today.isoformat()}"
+        if self.redis is not None and not self.redis.set(key, "1", nx=True, ex=2 * 24 * 3600):
+            self._swept_on = today
+            return {}
+        db = self.session_factory()
+        try:
+            swept = {
+                "readiness": ReadinessRepository(db).expire_streaks(today),
+                "leaderboard": LeaderboardRepository(db).expire_streaks(today),
+                "counter_batches": CounterBatchRepository(db).purge(
+                    datetime.datetime.combine(today - datetime.timedelta(days=1), datetime.time.min)
+                ),
+                "refresh_tokens": RefreshTokenRepository(db).purge_expired(),
+            }
+        except Exception:
+            # Every sweep is idempotent: release the day so the next check retries it
+            if self.redis is not None:
+                self.redis.delete(key)
+            raise
+        finally:
+            db.close()
+        self._swept_on = today
+        logger.info(f"Daily sweep for {today}: {swept}")
+        return swept
+
+    def _run(self, interval: float):
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Daily sweep failed: {e}")
+            if self._stop.wait(interval):
+                break
+
+    def start(self, interval: float):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,),
+                                        name="daily-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+daily_sweeper = DailySweeper(redis=get_redis() if redis_available else None)
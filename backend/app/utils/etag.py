@@ -0,0 +1,33 @@
+# app/utils/etag.py
+"""
+Conditional GET helpers.
+
+ETags here are weak (W/"..."): they name the data a response was built from,
+not its exact bytes, so compression or key order never breaks revalidation.
+If-None-Match is compared with the weak comparison function of RFC 9110.
+"""
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def weak_etag(*parts) -> str:
+    return 'W/"' + ".".join(str(p) for p in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def not_modified(request: Request, etag: Optional[str], cache_control: str) -> Optional[Response]:
+    """A bodyless 304 when the client already holds `etag`, else None."""
+    if etag and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return None
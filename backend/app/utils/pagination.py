@@ -0,0 +1,83 @@
+# app/utils/pagination.py
+"""
+Keyset (cursor) pagination on (created_at, id), newest first — or on
+(<score column>, id) for ranked feeds.
+
+Each page seeks straight to the cursor through a composite index ending in
+(created_at, id), so page 10,000 costs the same as page 1. Cursors are opaque
+URL-safe strings; clients pass back `next_cursor` until it is None.
+
+Works on both sync `Query` and 2.0 `select()` statements:
+
+    stmt = keyset(select(Post).where(...), Post, cursor, limit, dialect)
+    rows = (await db.scalars(stmt)).all()
+    items, next_cursor = page_of(rows, limit)
+
+Ranked feeds pass the sort column and the matching row attribute:
+
+    stmt = keyset(select(Post), Post, cursor, limit, dialect, column=Post.hot_score)
+    items, next_cursor = page_of(rows, limit, key="hot_score")
+"""
+import base64
+import datetime
+import json
+from typing import Any, List, Optional, Tuple, Union
+from fastapi import HTTPException
+from sqlalchemy import DateTime, desc, tuple_
+
+SortValue = Union[datetime.datetime, int, float]
+
+
+def encode_cursor(value: SortValue, row_id: str) -> str:
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[SortValue, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(value, str):
+            value = datetime.datetime.fromisoformat(value)
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(value)
+        return value, str(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _bind_created_at(value: datetime.datetime, dialect: str):
+    # SQLite stores timestamps as text: server_default rows are "YYYY-MM-DD HH:MM:SS",
+    # so a whole-second cursor must be bound in that form to compare equal.
+    if dialect == "sqlite" and value.microsecond == 0:
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value
+
+
+def keyset(query, model, cursor: Optional[str], limit: int, dialect: str = "postgresql", column=None):
+    """Restrict `query` to rows after `cursor` and order/limit it for one page (+1 probe row).
+
+    `column` is the descending sort column (default created_at); it must be NOT NULL
+    so the row-value comparison is total.
+    """
+    column = model.created_at if column is None else column
+    if cursor:
+        value, row_id = decode_cursor(cursor)
+        # A cursor from another sort order (e.g. a "new" cursor on the "hot" feed) is rejected
+        if isinstance(value, datetime.datetime) != isinstance(column.type, DateTime):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if isinstance(value, datetime.datetime):
+            value = _bind_created_at(value, dialect)
+        query = query.where(tuple_(column, model.id) < tuple_(value, row_id))
+    return query.order_by(desc(column), desc(model.id)).limit(limit + 1)
+
+
+def page_of(rows: List[Any], limit: int, key: str = "created_at") -> Tuple[List[Any], Optional[str]]:
+    """Split off the probe row; returns (items, next_cursor)."""
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(getattr(last, key), last.id)
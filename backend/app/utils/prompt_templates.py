@@ -17,7 +17,7 @@ Return a JSON object with:
 - scores: {{ relevance: 0-10, star: 0-10, clarity: 0-10, ... (all 12) }}
 - feedback: {{ strengths: [], improvements: [], ai_summary: "" }}
 - star_analysis: {{ situation: "", task: "", action: "", result: "" }}
-Integrate: Fillers={fillers}, Readability={readability}
+Integrate local NLP signals: {nlp_features}
 """
 
 # ── Resume ATS ─────────────────────────────────────────────────────
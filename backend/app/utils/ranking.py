@@ -0,0 +1,23 @@
+# app/utils/ranking.py
+"""
+Community feed ranking.
+
+hot_score is log10 of the net vote score plus post age in 12.5-hour units:
+every 10x more votes buys a post 12.5 hours of freshness. The age term
+depends only on created_at, so the score changes only when votes do — it is
+stored on the row and indexed, never recomputed at read time.
+"""
+import calendar
+import datetime
+import math
+
+HOT_EPOCH = 1704067200  # 2024-01-01T00:00:00Z
+HOT_DECAY_SECONDS = 45000
+
+
+def hot_score(score: int, created_at: datetime.datetime) -> float:
+    order = math.log10(max(abs(score), 1))
+    sign = (score > 0) - (score < 0)
+    # naive timestamps (SQLite) are UTC, like the server default that wrote them
+    seconds = calendar.timegm(created_at.utctimetuple()) - HOT_EPOCH
+    return round(sign * order + seconds / HOT_DECAY_SECONDS, 7)
@@ -0,0 +1,37 @@
+# app/worker.py
+"""
+Dedicated job worker process. Runs queued jobs from Redis until interrupted:
+
+    python -m app.worker --threads 4
+
+Start as many of these as needed; set JOB_WORKERS=0 on the API processes
+to keep all background work off the web workers.
+"""
+import argparse
+import signal
+import threading
+from app.core.database import redis_available
+from app.core.logging import logger
+from app.services.job_service import job_queue
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    if not redis_available:
+        logger.warning("Redis unavailable: this worker only sees its own in-memory queue")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    job_queue.start_workers(args.threads)
+    logger.info(f"Job worker started with {args.threads} threads")
+    stop.wait()
+    job_queue.stop_workers()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+AIService load test — runs _safe_claude_call against a local stub LLM
+server and reports throughput as the number of in-flight requests grows.
+
+With the async client, throughput should scale roughly linearly with
+in-flight requests until AI_MAX_CONCURRENCY / AI_MAX_CONNECTIONS is hit.
+
+Usage (from backend/):
+    python benchmarks/bench_ai_concurrency.py --latency 200 --requests 128
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import asyncio
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def start_stub_server(latency_ms: int) -> ThreadingHTTPServer:
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency_ms / 1000)
+            body = json.dumps({
+                "id": f"msg_{uuid.uuid4().hex}", "type": "message", "role": "assistant",
+                "model": "stub", "stop_reason": "end_turn", "stop_sequence": None,
+                "content": [{"type": "text", "text": '{"ok": true}'}],
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run_level(service, in_flight: int, total: int) -> float:
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(uuid.uuid4().hex)  # unique prompts: no cache hits
+
+    async def worker():
+        while not queue.empty():
+            prompt = queue.get_nowait()
+            await service._safe_claude_call("stub system", f"prompt {prompt}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(in_flight)))
+    return total / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=int, default=200, help="stub response latency (ms)")
+    parser.add_argument("--requests", type=int, default=128)
+    parser.add_argument("--levels", default="1,4,16,64")
+    args = parser.parse_args()
+    levels = [int(x) for x in args.levels.split(",")]
+
+    server = start_stub_server(args.latency)
+    os.environ["ANTHROPIC_API_KEY"] = "stub-key"
+    os.environ["ANTHROPIC_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("AI_MAX_CONCURRENCY", str(max(levels)))
+    os.environ.setdefault("AI_MAX_CONNECTIONS", str(max(levels)))
+
+    from app.services.ai_service import AIService
+    service = AIService()
+
+    async def run():
+        print(f"stub latency {args.latency}ms, {args.requests} requests per level, "
+              f"AI_MAX_CONCURRENCY={service.max_concurrency}")
+        for level in levels:
+            rps = await run_level(service, level, args.requests)
+            print(f"in-flight {level:>4}: {rps:>8.1f} req/s")
+
+    asyncio.run(run())
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
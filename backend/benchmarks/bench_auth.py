@@ -0,0 +1,151 @@
+"""
+Auth benchmark — login + refresh throughput with N concurrent clients, and
+how long a trivial /health request waits meanwhile (event-loop blocking).
+
+"legacy" reproduces the previous AuthController: bcrypt verify on the event
+loop and a bcrypt hash of every issued refresh token (two bcrypt calls per
+refresh). "current" is the shipped controller: bcrypt in a bounded thread
+pool and refresh tokens stored as an HMAC digest in token families.
+
+Usage (from backend/):
+    python benchmarks/bench_auth.py --clients 100 --rounds 1
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+import tempfile
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import get_db
+from app.core.logging import logger
+from app.core.security import (
+    get_password_hash, verify_password, create_access_token, create_refresh_token, decode_token,
+)
+from app.controllers.auth_controller import AuthController
+from app.models import Base, User
+from app.routes import auth
+
+PASSWORD = "correct horse battery staple"
+
+
+# ── Previous controller, as it was in app/controllers ───────────
+LEGACY_REFRESH_HASHES = {}  # stood in for users.hashed_refresh_token
+
+
+class LegacyAuthController(AuthController):
+    async def login(self, body, ip: str) -> dict:
+        user = self.user_repo.get_by_email(body.email)
+        if not user or not verify_password(body.password, user.password_hash):
+            raise HTTPException(status_code=401, detail="Invalid email or password")
+        access_token = create_access_token({"sub": user.id, "role": user.role})
+        refresh_token = create_refresh_token({"sub": user.id})
+        LEGACY_REFRESH_HASHES[user.id] = get_password_hash(refresh_token)
+        self.db.commit()
+        return {"access_token": access_token, "refresh_token": refresh_token, "user": user.to_dict()}
+
+    async def refresh(self, refresh_token: str) -> dict:
+        payload = decode_token(refresh_token)
+        user = self.user_repo.get_by_id(payload.get("sub"))
+        if not verify_password(refresh_token, LEGACY_REFRESH_HASHES[user.id]):
+            raise HTTPException(status_code=401, detail="Invalid session - potential token reuse detected")
+        new_access = create_access_token({"sub": user.id, "role": user.role})
+        new_refresh = create_refresh_token({"sub": user.id})
+        LEGACY_REFRESH_HASHES[user.id] = get_password_hash(new_refresh)
+        self.db.commit()
+        return {"access_token": new_access, "refresh_token": new_refresh, "user": user.to_dict()}
+
+
+def build_app(session_factory) -> FastAPI:
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/api")
+
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    app.dependency_overrides[get_db] = override_db
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    return app
+
+
+async def measure(app, clients: int, rounds: int):
+    transport = httpx.ASGITransport(app=app)
+    probe_latencies = []
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+        async def user_client(i):
+            for _ in range(rounds):
+                r = await client.post("/api/auth/login", json={"email": f"u{i}@bench.dev", "password": PASSWORD})
+                r.raise_for_status()
+                r = await client.post("/api/auth/refresh", json={"refresh_token": r.json()["refresh_token"]})
+                r.raise_for_status()
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                probe_latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.05)
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(user_client(i) for i in range(clients)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    flows = clients * rounds
+    return flows / elapsed, statistics.median(probe_latencies), max(probe_latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=1)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    engine = create_engine(f"sqlite:///{tmp.name}", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+    password_hash = get_password_hash(PASSWORD)  # one bcrypt hash shared by every bench user
+    db.add_all([
+        User(name=f"u{i}", email=f"u{i}@bench.dev", password_hash=password_hash, is_active=True)
+        for i in range(args.clients)
+    ])
+    db.commit()
+    db.close()
+
+    print(f"{args.clients} clients x {args.rounds} rounds of login + refresh")
+    for label, controller in (("legacy", LegacyAuthController), ("current", AuthController)):
+        auth.AuthController = controller
+        flows, probe_p50, probe_max = asyncio.run(measure(build_app(session_factory), args.clients, args.rounds))
+        print(f"{label:<8} {flows:>7.1f} login+refresh/s   /health p50 {probe_p50:>8.1f} ms   max {probe_max:>8.1f} ms")
+    auth.AuthController = AuthController
+
+    os.unlink(tmp.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Leaderboard benchmark — seeds a throwaway SQLite database and times the
+set-based rank table against the old per-user N+1 loop.
+
+Usage (from backend/):
+    python benchmarks/bench_leaderboard.py --users 50000 --sessions 2000000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import datetime
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, User, InterviewSession
+from app.models.interview_session import PracticeStreak
+from app.models.base import _uuid
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.repositories.streak_repository import StreakRepository
+
+
+def seed(db, n_users: int, n_sessions: int, batch: int = 20000):
+    user_ids = [_uuid() for _ in range(n_users)]
+    colleges = ["IIT Bombay", "IIT Delhi", "BITS Pilani", "NIT Trichy", "VIT", None]
+    for i in range(0, n_users, batch):
+        db.execute(insert(User), [
+            {"id": uid, "name": f"user{i + j}", "email": f"user{i + j}@bench.local",
+             "password_hash": "x", "college": random.choice(colleges),
+             "is_scores_public": random.random() > 0.1}
+            for j, uid in enumerate(user_ids[i:i + batch])
+        ])
+
+    for i in range(0, n_sessions, batch):
+        db.execute(insert(InterviewSession), [
+            {"user_id": random.choice(user_ids), "overall_score": random.uniform(20, 100)}
+            for _ in range(min(batch, n_sessions - i))
+        ])
+
+    today = datetime.date.today()
+    streak_rows = []
+    for uid in user_ids:
+        for d in range(random.randint(0, 20)):
+            streak_rows.append({"user_id": uid, "date": today - datetime.timedelta(days=d), "sessions": 1})
+    for i in range(0, len(streak_rows), batch):
+        db.execute(insert(PracticeStreak), streak_rows[i:i + batch])
+    db.commit()
+    return user_ids
+
+
+def timed(label: str, fn, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) * 1000 / repeat
+    print(f"{label:<40} {elapsed:>10.2f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--sessions", type=int, default=2000000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_leaderboard.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    print(f"Seeding {args.users} users / {args.sessions} sessions into {path}")
+    user_ids = timed("seed", lambda: seed(db, args.users, args.sessions))
+
+    repo = LeaderboardRepository(db)
+    timed("streak backfill (window query)", StreakRepository(db).backfill)
+    timed("rebuild (full recompute)", repo.rebuild)
+    timed("refresh_user (incremental)", lambda: repo.refresh_user(random.choice(user_ids)), repeat=50)
+    timed("GET /leaderboard (top 50)", lambda: repo.top(limit=50), repeat=50)
+    timed("GET /leaderboard?college=IIT", lambda: repo.top(limit=50, college="IIT"), repeat=50)
+    timed("GET /leaderboard/me (rank_of)",
+          lambda: repo.rank_of(repo.get_entry(random.choice(user_ids))), repeat=50)
+
+    # Old path: one aggregate + a day-by-day streak walk per user
+    sample = user_ids[:200]
+    def legacy():
+        today = datetime.date.today()
+        for uid in sample:
+            db.query(InterviewSession).filter(InterviewSession.user_id == uid).all()
+            for i in range(365):
+                row = db.query(PracticeStreak).filter_by(user_id=uid, date=today - datetime.timedelta(days=i)).first()
+                if not row and i > 0:
+                    break
+    timed(f"legacy N+1 ({len(sample)} users)", legacy)
+    print(f"(legacy cost scales linearly: ~{args.users // len(sample)}x the line above for a full page view)")
+
+
+if __name__ == "__main__":
+    main()
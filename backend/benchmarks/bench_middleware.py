@@ -0,0 +1,159 @@
+"""
+Middleware benchmark — requests/second through the old three-layer
+BaseHTTPMiddleware stack (Logging + Auth + RateLimit, reproduced below)
+versus the fused pure-ASGI RequestContextMiddleware, on /health and on an
+authenticated endpoint. Requests are driven in-process over ASGI, so the
+numbers isolate framework + middleware cost from the network.
+
+Usage (from backend/):
+    python benchmarks/bench_middleware.py --requests 5000 --concurrency 32
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+from fastapi import FastAPI, Depends, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import redis_client, get_db
+from app.core.dependencies import get_current_user
+from app.core.logging import logger
+from app.core.security import create_access_token, decode_token
+from app.middleware.request_middleware import RequestContextMiddleware
+from app.models import Base, User
+
+
+# ── Previous stack, as it was in app/middleware ─────────────────
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        user_id = getattr(request.state, "user_id", "anonymous")
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+        logger.info(
+            f"RID: {user_id} | {request.method} {request.url.path} | "
+            f"Status: {response.status_code} | Time: {process_time:.2f}ms"
+        )
+        return response
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request.state.user_id = None
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            payload = decode_token(auth_header.split(" ")[1])
+            if payload and payload.get("type") == "access":
+                request.state.user_id = payload.get("sub")
+        return await call_next(request)
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, limit: int = 100, window: int = 60):
+        super().__init__(app)
+        self.limit = limit
+        self.window = window
+
+    async def dispatch(self, request: Request, call_next):
+        key = f"rate_limit:{request.client.host}:{request.url.path}"
+        try:
+            current = redis_client.get(key)
+            p = redis_client.pipeline()
+            p.incr(key)
+            if not current:
+                p.expire(key, self.window)
+            p.execute()
+        except Exception:
+            pass
+        return await call_next(request)
+
+
+def build_app(fused: bool, session_factory) -> FastAPI:
+    app = FastAPI()
+    limit = 10 ** 9  # measure overhead, never actually reject
+    if fused:
+        app.add_middleware(RequestContextMiddleware, limit=limit, window=60)
+    else:
+        app.add_middleware(LegacyLoggingMiddleware)
+        app.add_middleware(LegacyAuthMiddleware)
+        app.add_middleware(LegacyRateLimitMiddleware, limit=limit, window=60)
+
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    app.dependency_overrides[get_db] = override_db
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/me")
+    def me(current_user: User = Depends(get_current_user)):
+        return {"id": current_user.id}
+
+    return app
+
+
+async def measure(app: FastAPI, path: str, headers: dict, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        remaining = iter(range(total))
+
+        async def worker():
+            for _ in remaining:
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200, response.text
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, 50))))  # warm up
+        remaining = iter(range(total))
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)  # keep console I/O out of the measurement
+
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    # Same pool setup the app uses for SQLite
+    engine = create_engine(f"sqlite:///{tmp.name}", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+    user = User(name="bench", email="bench@bench.local", password_hash="x")
+    db.add(user)
+    db.commit()
+    auth = {"Authorization": f"Bearer {create_access_token({'sub': user.id, 'role': 'user'})}"}
+    db.close()
+
+    print(f"{args.requests} requests per case, concurrency {args.concurrency}")
+    for path, headers in [("/health", {}), ("/me", auth)]:
+        for fused in (False, True):
+            rps = asyncio.run(measure(build_app(fused, session_factory), path, headers,
+                                      args.requests, args.concurrency))
+            label = "fused ASGI" if fused else "BaseHTTPMiddleware x3"
+            print(f"{path:<8} {label:<22} {rps:>8.0f} req/s")
+
+    os.unlink(tmp.name)
+
+
+if __name__ == "__main__":
+    main()
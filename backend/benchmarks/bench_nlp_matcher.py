@@ -0,0 +1,69 @@
+"""
+NLP matcher microbenchmark — per-term regex scans vs the single-pass
+lexicon matcher on a 10k-word transcript.
+
+Usage (from backend/):
+    python benchmarks/bench_nlp_matcher.py --words 10000 --repeat 20
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import nlp_service as nlp
+
+
+# ── Previous implementation (one scan per term) ───────────────
+def legacy_scan(text: str):
+    lower = text.lower()
+    fillers = {f: len(re.findall(rf"\b{re.escape(f)}\b", lower)) for f in nlp.ALL_FILLERS}
+    power = {c: [w for w in ws if re.search(rf"\b{w}\b", lower)] for c, ws in nlp.POWER_WORDS.items()}
+    star = {
+        "situation": any(kw in lower for kw in nlp.STAR_SITUATION),
+        "task":      any(kw in lower for kw in nlp.STAR_TASK),
+        "action":    any(kw in lower for kw in nlp.STAR_ACTION),
+        "result":    any(kw in lower for kw in nlp.STAR_RESULT),
+    }
+    pos = sum(1 for w in nlp.POSITIVE_WORDS if w in text.lower())
+    neg = sum(1 for w in nlp.NEGATIVE_WORDS if w in text.lower())
+    return fillers, power, star, pos, neg
+
+
+def make_transcript(n_words: int, rng: random.Random) -> str:
+    filler_vocab = nlp.ALL_FILLERS + nlp.ALL_POWER + nlp.POSITIVE_WORDS + nlp.NEGATIVE_WORDS
+    plain = ["the", "team", "project", "we", "shipped", "a", "service", "and", "then", "i",
+             "worked", "on", "latency", "with", "users", "in", "production", "situation", "result"]
+    words = [rng.choice(filler_vocab) if rng.random() < 0.15 else rng.choice(plain) for _ in range(n_words)]
+    return " ".join(words)
+
+
+def timed(label: str, fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) * 1000 / repeat
+    print(f"{label:<40} {elapsed:>10.2f} ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text = make_transcript(args.words, random.Random(42))
+    print(f"Transcript: {args.words} words, {len(text)} chars")
+
+    before = timed("per-term regex scans", lambda: legacy_scan(text), args.repeat)
+    after = timed("single-pass scan_lexicon", lambda: nlp.scan_lexicon(text), args.repeat)
+    timed("evaluate_answer (end to end)", lambda: nlp.evaluate_answer(text), args.repeat)
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Rate limiter benchmark — per-request overhead (µs) of the limiter alone.
+
+Always measures the in-process token bucket. When Redis is reachable at
+REDIS_URL it also measures the previous check (sync GET, then a pipelined
+INCR/EXPIRE: two round trips, blocking the event loop) against the async
+GCRA Lua script (one EVALSHA), both sequentially and with N concurrent callers.
+
+Usage (from backend/):
+    python benchmarks/bench_rate_limiter.py --requests 20000 --concurrency 64
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+import redis.asyncio
+
+from app.core.config import settings
+from app.core.database import redis_client, redis_available
+from app.middleware.rate_limit import RateLimiter
+
+LIMIT = 10 ** 9  # never reject, so every call does the full amount of work
+
+
+# ── Previous check, as it was in RateLimitMiddleware.dispatch ───
+def legacy_allow(client_ip: str, path: str, limit: int = LIMIT, window: int = 60) -> bool:
+    key = f"bench_legacy:{client_ip}:{path}"
+    current = redis_client.get(key)
+    if current and int(current) >= limit:
+        return False
+    p = redis_client.pipeline()
+    p.incr(key)
+    if not current:
+        p.expire(key, window)
+    p.execute()
+    return True
+
+
+async def measure_async(hit, requests: int, concurrency: int) -> float:
+    """Mean wall-clock µs per request with `concurrency` callers sharing the loop."""
+    per_worker = requests // concurrency
+
+    async def worker(i):
+        for n in range(per_worker):
+            await hit(f"10.0.{i}.{n % 50}", "/api/dashboard")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return (time.perf_counter() - start) / (per_worker * concurrency) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    local = RateLimiter(limit=LIMIT, rules=[])
+    local.redis = None
+    print(f"{args.requests} checks per case")
+    for c in (1, args.concurrency):
+        us = asyncio.run(measure_async(local.hit, args.requests, c))
+        print(f"token bucket (in-process)   concurrency {c:<3} {us:>8.1f} µs/request")
+
+    if not redis_available:
+        print("Redis not reachable at REDIS_URL — skipping Redis cases")
+        return
+
+    async def legacy_hit(client_ip, path):
+        # The old middleware called the sync client straight from async code
+        legacy_allow(client_ip, path)
+
+    async def gcra_case(concurrency):
+        # Async connections belong to one event loop, so each run gets its own client
+        client = redis.asyncio.from_url(settings.REDIS_URL, decode_responses=True)
+        gcra = RateLimiter(limit=LIMIT, rules=[], redis=client)
+        try:
+            return await measure_async(gcra.hit, args.requests, concurrency)
+        finally:
+            await client.aclose()
+
+    for c in (1, args.concurrency):
+        us = asyncio.run(measure_async(legacy_hit, args.requests, c))
+        print(f"sync GET + INCR/EXPIRE       concurrency {c:<3} {us:>8.1f} µs/request")
+        us = asyncio.run(gcra_case(c))
+        print(f"async GCRA script            concurrency {c:<3} {us:>8.1f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Search benchmark — seeds a throwaway SQLite database with N community posts,
+indexes them, and times AsyncSearchRepository.search() (ranked page + total +
+company/round facets) against the LIKE '%term%' scan that is the only
+alternative without an index. The create_post p50 is the write path with its
+index row (FTS5 trigger) in the same transaction.
+
+Usage (from backend/):
+    python benchmarks/bench_search.py --posts 1000000
+"""
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import itertools
+import statistics
+import tempfile
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.models import Base, User, Post
+from app.models.base import _uuid
+from app.repositories.post_repository import PostRepository
+from app.repositories.search_repository import AsyncSearchRepository, SearchIndexer
+
+COMPANIES = ["Google", "Amazon", "Microsoft", "Meta", "Flipkart", "Uber", "Adobe", "Swiggy", "Atlassian", "Netflix"]
+ROUNDS = ["Online Assessment", "Technical Round 1", "System Design", "Manager Round", "HR Round"]
+WORDS = ("array graph tree heap trie dynamic programming sliding window binary search recursion backtracking "
+         "cache sharding replication consistency latency throughput queue kafka redis postgres index "
+         "leadership conflict deadline ownership feedback mentor offer rejected onsite recruiter salary "
+         "behavioral story impact metrics scope tradeoff design api rate limiter url shortener").split()
+QUERIES = ["system design", "rate limit", "dynamic programming", "kafka", "recruiter offer", "shard"]
+
+# Posts are mostly Zipf-distributed filler words with a few topic words mixed in, so
+# topic terms match a few percent of posts, as in a real community feed
+FILLER = [f"w{i}" for i in range(20000)]
+FILLER_CUM = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(FILLER))))
+
+
+def _text(filler: int, topics: int) -> str:
+    words = random.choices(FILLER, cum_weights=FILLER_CUM, k=filler) + random.sample(WORDS, topics)
+    random.shuffle(words)
+    return " ".join(words)
+
+
+def seed(db, n_posts: int, batch: int = 20000):
+    user_id = _uuid()
+    db.execute(insert(User), [{"id": user_id, "name": "bench", "email": "bench@bench.dev", "password_hash": "x"}])
+    for i in range(0, n_posts, batch):
+        db.execute(insert(Post), [
+            {"user_id": user_id,
+             "title": f"{random.choice(COMPANIES)} {random.choice(ROUNDS)} {_text(3, 1)}",
+             "body": _text(50, 3),
+             "company": random.choice(COMPANIES), "round_type": random.choice(ROUNDS)}
+            for _ in range(min(batch, n_posts - i))
+        ])
+    db.commit()
+
+
+def percentile(samples, p):
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * p))]
+
+
+async def run_queries(path: str, repeat: int):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    results = {}
+    async with async_sessionmaker(engine)() as db:
+        repo = AsyncSearchRepository(db)
+        for q in QUERIES:
+            for label, kwargs in (("page", {"facets": False}), ("page+facets", {}),
+                                  ("filtered", {"company": "Google", "facets": False})):
+                samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    result = await repo.search(q, doc_types=["post"], **kwargs)
+                    samples.append((time.perf_counter() - start) * 1000)
+                results[(q, label)] = (statistics.median(samples), percentile(samples, 0.95), result["total"])
+
+        # Baseline without an index: a substring scan to count the same matches
+        for q in QUERIES[:2]:
+            start = time.perf_counter()
+            total = await db.scalar(text(
+                "SELECT count(*) FROM posts WHERE title LIKE :p OR body LIKE :p"
+            ), {"p": f"%{q}%"})
+            results[(q, "LIKE scan")] = ((time.perf_counter() - start) * 1000, None, total)
+    await engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    start = time.perf_counter()
+    seed(db, args.posts)
+    print(f"seeded {args.posts:,} posts in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    documents = SearchIndexer(db).rebuild()
+    elapsed = time.perf_counter() - start
+    print(f"rebuild: {documents:,} documents in {elapsed:.1f}s ({documents / elapsed:,.0f} docs/s)")
+    db.close()
+
+    results = asyncio.run(run_queries(path, args.repeat))
+    print(f"{'query':<22}{'mode':<14}{'p50 ms':>9}{'p95 ms':>9}{'matches':>10}")
+    for (q, label), (p50, p95, total) in results.items():
+        print(f"{q:<22}{label:<14}{p50:>9.1f}{(p95 if p95 is not None else float('nan')):>9.1f}"
+              f"{(total if total is not None else ''):>10}")
+
+    # Incremental indexing: one post + its document per transaction, as create_post does
+    db = sessionmaker(bind=engine)()
+    user_id = db.execute(text("SELECT id FROM users LIMIT 1")).scalar()
+    repo = PostRepository(db)
+    samples = []
+    for _ in range(200):
+        start = time.perf_counter()
+        repo.create_post({"user_id": user_id, "title": f"Google onsite {_text(3, 1)}",
+                          "body": _text(50, 3), "company": "Google"})
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"create_post incl. index write: p50 {statistics.median(samples):.2f} ms  p95 {percentile(samples, 0.95):.2f} ms")
+    db.close()
+    engine.dispose()
+    os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# backend/tests/conftest.py
+import asyncio
+import os
+import tempfile
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.models import Base
+
+
+@pytest.fixture
+def db():
+    """
+    Sync session on a throwaway SQLite file (not :memory:), so async readers
+    opened by run_async see the same data, as in the app. Also carries
+    db_path, engine and factory (a sessionmaker for extra sessions).
+    """
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    session.db_path = path
+    session.engine = engine
+    session.factory = factory
+    yield session
+    session.close()
+    engine.dispose()
+    os.unlink(path)
+
+
+@pytest.fixture
+def run_async(db):
+    """run_async(fn): await fn(adb) on an aiosqlite AsyncSession over the db file; returns its result."""
+    def run(fn):
+        async def main():
+            engine = create_async_engine(f"sqlite+aiosqlite:///{db.db_path}")
+            try:
+                async with async_sessionmaker(engine, expire_on_commit=False)() as adb:
+                    return await fn(adb)
+            finally:
+                await engine.dispose()
+        return asyncio.run(main())
+    return run
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the Redis calls the app makes: strings, hashes,
+    lists and sorted sets. Blocking pops never block, and eval only runs the
+    compare-and-delete lock release.
+    """
+    def __init__(self):
+        self.data, self.lists, self.zsets = {}, {}, {}
+
+    def get(self, key): return self.data.get(key)
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+    def delete(self, key): self.data.pop(key, None)
+    def exists(self, key): return key in self.data
+    def rename(self, src, dest):
+        if src not in self.data:
+            raise KeyError("ERR no such key")
+        self.data[dest] = self.data.pop(src)
+    def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            self.delete(key)
+
+    def hincrby(self, key, field, amount):
+        row = self.data.setdefault(key, {})
+        row[field] = str(int(row.get(field, 0)) + amount)
+    def hmget(self, key, fields): return [self.data.get(key, {}).get(f) for f in fields]
+    def hsetnx(self, key, field, value): self.data.setdefault(key, {}).setdefault(field, value)
+    def hgetall(self, key): return dict(self.data.get(key, {}))
+
+    def lpush(self, key, value): self.lists.setdefault(key, []).insert(0, value)
+    def lmove(self, src, dest, wherefrom, whereto):
+        items = self.lists.get(src)
+        if not items:
+            return None
+        value = items.pop() if wherefrom == "RIGHT" else items.pop(0)
+        target = self.lists.setdefault(dest, [])
+        target.insert(0 if whereto == "LEFT" else len(target), value)
+        return value
+    def blmove(self, src, dest, timeout, wherefrom, whereto): return self.lmove(src, dest, wherefrom, whereto)
+    def lrem(self, key, count, value):
+        if value in self.lists.get(key, []):
+            self.lists[key].remove(value)
+
+    def zadd(self, key, mapping): self.zsets.setdefault(key, {}).update(mapping)
+    def zrem(self, key, member): return self.zsets.get(key, {}).pop(member, None) is not None
+    def zrangebyscore(self, key, low, high):
+        return sorted(m for m, score in self.zsets.get(key, {}).items() if low <= score <= high)
+
+
+@pytest.fixture
+def fake_redis():
+    """A fresh FakeRedis; pass it to every component that should share one server."""
+    return FakeRedis()
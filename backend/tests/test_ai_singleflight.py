@@ -0,0 +1,84 @@
+# backend/tests/test_ai_singleflight.py
+import asyncio
+from app.core.config import settings
+from app.services.ai_service import AIService
+from app.services.cache_service import LayeredCache
+
+
+def _service(redis):
+    service = AIService()
+    service.api_key = "test-key"
+    service.redis = redis
+    service.cache = LayeredCache(service.redis)
+    return service
+
+
+def test_concurrent_identical_calls_share_one_upstream_call(fake_redis):
+    service = _service(fake_redis)
+    calls = []
+
+    async def upstream(system, prompt):
+        calls.append(prompt)
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    service._call_upstream = upstream
+
+    async def run():
+        return await asyncio.gather(*(service._safe_claude_call("sys", "Google prep") for _ in range(50)))
+
+    assert asyncio.run(run()) == ["answer"] * 50
+    assert len(calls) == 1
+    assert service.metrics["upstream"] == 1
+    assert service.metrics["coalesced_local"] == 49
+
+
+def test_waits_for_result_from_lock_holder_in_another_worker(monkeypatch, fake_redis):
+    monkeypatch.setattr(settings, "AI_LOCK_POLL_INTERVAL", 0.01)
+    service = _service(fake_redis)
+    cache_key = service._get_cache_key("sys", "Google prep")
+    service.redis.set(f"lock:{cache_key}", "other-worker")
+
+    async def upstream(system, prompt):
+        raise AssertionError("lock holder should serve this request")
+
+    service._call_upstream = upstream
+
+    async def other_worker_finishes():
+        await asyncio.sleep(0.05)
+        service.redis.set(cache_key, "answer")
+        service.redis.delete(f"lock:{cache_key}")
+
+    async def run():
+        result, _ = await asyncio.gather(service._safe_claude_call("sys", "Google prep"), other_worker_finishes())
+        return result
+
+    assert asyncio.run(run()) == "answer"
+    assert service.metrics["coalesced_remote"] == 1
+    assert service.metrics["upstream"] == 0
+
+
+def test_failed_upstream_call_is_raised_to_every_waiter(fake_redis):
+    service = _service(fake_redis)
+
+    async def upstream(system, prompt):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    service._call_upstream = upstream
+
+    async def run():
+        results = await asyncio.gather(
+            *(service._safe_claude_call("sys", "prompt") for _ in range(3)), return_exceptions=True
+        )
+        assert service._inflight == {}
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert service.metrics["upstream"] == 1
+
+    # The failure is negative-cached: an immediate retry fails without calling upstream
+    again = asyncio.run(run())
+    assert all(isinstance(r, Exception) for r in again)
+    assert service.metrics["upstream"] == 1
@@ -0,0 +1,68 @@
+# backend/tests/test_async_db.py
+import datetime
+from app.core.database import async_database_url
+from app.controllers.dashboard_controller import DashboardController
+from app.models import User, InterviewSession, Post
+from app.models.study_plan import ReadinessScore
+from app.repositories.leaderboard_repository import LeaderboardRepository, AsyncLeaderboardRepository
+from app.repositories.post_repository import AsyncPostRepository
+from app.repositories.readiness_repository import EMPTY_READINESS
+from app.repositories.streak_repository import StreakRepository
+from app.routes.sessions import get_all_history
+
+
+def test_async_database_url():
+    assert async_database_url("sqlite:///./interviewace.db") == "sqlite+aiosqlite:///./interviewace.db"
+    assert async_database_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert async_database_url("postgres://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert async_database_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+
+
+def test_async_reads_match_sync_writes(db, run_async):
+    # Seed through the sync engine, read through aiosqlite: same file, as in the app
+    alice = User(name="alice", email="alice@test.dev", password_hash="x", college="MIT")
+    bob = User(name="bob", email="bob@test.dev", password_hash="x", college="IIT")
+    db.add_all([alice, bob])
+    db.commit()
+    now = datetime.datetime.now()
+    for i, (user, score) in enumerate([(alice, 90.0), (alice, 70.0), (bob, 50.0)]):
+        db.add(InterviewSession(user_id=user.id, session_type="voice", overall_score=score,
+                                created_at=now - datetime.timedelta(minutes=i)))
+    db.add_all([
+        Post(user_id=alice.id, title="Got it", body="...", company="Google", created_at=now),
+        Post(user_id=bob.id, title="Nope", body="...", company="Meta", created_at=now),
+    ])
+    db.commit()
+    StreakRepository(db).record_activity(alice.id)
+    for user in (alice, bob):
+        LeaderboardRepository(db).refresh_user(user.id)
+    alice_id, bob_id = alice.id, bob.id
+
+    async def read(adb):
+        board = AsyncLeaderboardRepository(adb)
+        top = await board.top()
+        entry = await board.get_entry(bob_id)
+        history = await get_all_history(user_id=alice_id, session_type=None, cursor=None, limit=1,
+                                        include_total=True, db=adb)
+        feed = (await AsyncPostRepository(adb).list_posts(company="Google"))["posts"]
+        dashboard = await DashboardController(adb).get_dashboard_data(alice_id)
+        return (
+            [row[0].user_id for row in top], await board.rank_of(entry), await board.count_ranked(),
+            await board.colleges(), history, [p.title for p in feed], dashboard,
+        )
+
+    top, bob_rank, ranked, colleges, history, feed, dashboard = run_async(read)
+
+    assert top == [alice_id, bob_id]
+    assert (bob_rank, ranked) == (2, 2)
+    assert colleges == ["IIT", "MIT"]
+    assert (history["total"], history["has_more"]) == (2, True)
+    assert history["sessions"][0]["overall_score"] == 90.0
+    assert feed == ["Got it"]
+    assert dashboard["stats"]["mock_count"] == 2 and dashboard["stats"]["streak"] == 1
+    assert dashboard["weekly_progress"] == {datetime.date.today().isoformat(): 1}
+
+    # The dashboard is read-only: readiness is materialized by the refresher, not by views
+    db.expire_all()
+    assert db.query(ReadinessScore).filter_by(user_id=alice_id).first() is None
+    assert dashboard["readiness_score"]["score"] == EMPTY_READINESS["score"]
@@ -0,0 +1,76 @@
+# backend/tests/test_auth_cache.py
+import asyncio
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+from app.core import dependencies
+from app.core.security import create_access_token
+from app.controllers.auth_controller import AuthController
+from app.models import Base, User
+from app.services import auth_cache as auth_cache_module
+from app.services.auth_cache import AuthCache
+
+
+class NoDB:
+    """Fails the test if authentication reaches the database."""
+    def query(self, *args, **kwargs):
+        raise AssertionError("database was queried")
+
+
+@pytest.fixture
+def cache(monkeypatch, fake_redis):
+    cache = AuthCache(fake_redis)
+    monkeypatch.setattr(auth_cache_module, "auth_cache", cache)
+    monkeypatch.setattr(dependencies, "auth_cache", cache)
+    monkeypatch.setattr("app.controllers.auth_controller.auth_cache", cache)
+    return cache
+
+
+def _db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    user = User(name="a", email="a@test.dev", password_hash="x", role="user")
+    db.add(user)
+    db.commit()
+    return db, user
+
+
+def _auth(token, db):
+    request = Request({"type": "http", "headers": [], "state": {}})
+    return asyncio.run(dependencies.get_current_user(request, token, db))
+
+
+def test_verified_tokens_are_cached(cache, monkeypatch):
+    token = create_access_token({"sub": "u1", "role": "user"})
+    assert cache.decode(token)["sub"] == "u1"
+    monkeypatch.setattr(auth_cache_module, "decode_token", lambda t: pytest.fail("re-verified"))
+    assert cache.decode(token)["sub"] == "u1"
+    assert cache.counters["token_hits"] == 1
+
+
+def test_warm_requests_skip_the_database(cache):
+    db, user = _db()
+    token = create_access_token({"sub": user.id, "role": "user"})
+    principal = _auth(token, db)
+    assert (principal.id, principal.role, principal.is_active) == (user.id, "user", True)
+    assert _auth(token, NoDB()).id == user.id
+    assert cache.counters["principal_loads"] == 1
+
+
+def test_role_change_and_deactivation_invalidate_the_principal(cache):
+    db, user = _db()
+    token = create_access_token({"sub": user.id, "role": "user"})
+    _auth(token, db)
+
+    asyncio.run(AuthController(db).set_role(user.id, "admin"))
+    assert _auth(token, db).role == "admin"
+
+    user.is_active = False
+    db.commit()
+    asyncio.run(AuthController(db).logout(user.id))
+    with pytest.raises(HTTPException) as exc:
+        _auth(token, db)
+    assert exc.value.status_code == 403
@@ -0,0 +1,90 @@
+# backend/tests/test_badges.py
+import datetime
+from types import SimpleNamespace
+from app.models import User, InterviewSession, UserBadge, BadgeStat
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.repositories.badge_repository import BadgeRepository
+from app.repositories.streak_repository import StreakRepository
+from app.routes.badges import my_badges, user_badges
+
+
+def _read(run_async, route, **kwargs):
+    return run_async(lambda adb: route(db=adb, **kwargs))
+
+
+def _session(db, user_id, session_type, score):
+    session = InterviewSession(user_id=user_id, session_type=session_type, overall_score=score)
+    db.add(session)
+    db.commit()
+    AnalyticsRepository(db).record_session(session)
+
+
+def _earned(result):
+    return {b["id"] for b in result["badges"] if b["earned"]}
+
+
+def test_writes_award_badges_once_and_only_for_their_events(db, run_async):
+    users = [User(name=f"u{i}", email=f"u{i}@test.dev", password_hash="x") for i in range(4)]
+    db.add_all(users)
+    db.commit()
+    repo = BadgeRepository(db)
+    for _ in users:
+        repo.record_user()
+    alice = users[0]
+
+    for session_type in ("behavioral", "voice", "mock"):
+        _session(db, alice.id, session_type, 85)
+    assert set(repo.evaluate(alice.id, ["session"])) == {"first_session", "score_70", "score_80", "variety_3"}
+    assert repo.evaluate(alice.id, ["session"]) == []  # already held: nothing re-checked or re-counted
+
+    # Profile and streak rules wait for their own events
+    alice.college, alice.cgpa, alice.linkedin_url = "IIT", "9.1", "https://linkedin.com/in/alice"
+    db.commit()
+    today = datetime.date.today()
+    for days_ago in (2, 1, 0):
+        StreakRepository(db).record_activity(alice.id, today - datetime.timedelta(days=days_ago))
+    assert repo.evaluate(alice.id, ["session"]) == []
+    assert set(repo.evaluate(alice.id, ["streak", "profile"])) == {"streak_3", "profile_complete"}
+
+    # A concurrent evaluation that already inserted the award doesn't count it twice
+    assert repo.award(alice.id, ["first_session"]) == []
+    db.commit()
+
+    _session(db, users[1].id, "mock", 40)
+    repo.evaluate(users[1].id)
+    stats = {s.badge_id: s.earned_count for s in db.query(BadgeStat)}
+    assert (stats["_users"], stats["first_session"], stats["score_80"]) == (4, 2, 1)
+
+    mine = _read(run_async, my_badges, current_user=SimpleNamespace(id=alice.id))
+    assert _earned(mine) == {"first_session", "score_70", "score_80", "variety_3", "streak_3", "profile_complete"}
+    first = next(b for b in mine["badges"] if b["id"] == "first_session")
+    assert first["rarity_pct"] == 50.0 and first["awarded_at"]
+    assert mine["earned_count"] == 6 and mine["total_count"] == 15
+
+
+def test_public_badges_respect_privacy_and_rebuild_restores_awards(db, run_async):
+    user = User(name="bob", email="bob@test.dev", password_hash="x", is_scores_public=False)
+    db.add(user)
+    db.commit()
+    BadgeRepository(db).record_user()
+    for _ in range(5):
+        _session(db, user.id, "behavioral", 95)
+    BadgeRepository(db).evaluate(user.id, ["session"])
+
+    public = _read(run_async, user_badges, user_id=user.id)
+    assert public["user_name"] == "bob"
+    assert _earned(public) == {"first_session", "sessions_5"}
+    assert not any(b["category"] == "score" for b in public["badges"])
+    assert _read(run_async, user_badges, user_id="missing")["badges"] == []
+
+    before = {(b.user_id, b.badge_id, b.awarded_at) for b in db.query(UserBadge)}
+    db.query(BadgeStat).delete()
+    db.query(UserBadge).filter(UserBadge.badge_id == "sessions_5").delete()
+    db.commit()
+    BadgeRepository(db).rebuild()
+    after = {(b.user_id, b.badge_id) for b in db.query(UserBadge)}
+    assert after == {(u, b) for u, b, _ in before}
+    # Awards that survived keep their original timestamp
+    assert {(b.badge_id, b.awarded_at) for b in db.query(UserBadge)} >= {(b, t) for _, b, t in before if b != "sessions_5"}
+    stats = {s.badge_id: s.earned_count for s in db.query(BadgeStat)}
+    assert stats == {"_users": 1, "first_session": 1, "sessions_5": 1, "score_70": 1, "score_80": 1, "score_90": 1}
@@ -0,0 +1,52 @@
+# backend/tests/test_cache_service.py
+import json
+from app.services.cache_service import CachePolicy, LayeredCache
+
+shared = CachePolicy(ttl=60)
+unique = CachePolicy(ttl=60, local=False)
+
+
+def test_local_tier_serves_repeat_reads_without_redis(fake_redis):
+    redis = fake_redis
+    cache = LayeredCache(redis)
+    cache.set("k", "value", shared)
+    redis.data.clear()
+
+    assert cache.get("k", shared) == (True, "value")
+    assert cache.get("k", unique) == (False, None)  # policy skips the local tier
+    stats = cache.stats()
+    assert stats["local_hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_large_payloads_are_compressed_in_redis(fake_redis):
+    redis = fake_redis
+    cache = LayeredCache(redis, compress_min_bytes=256)
+    payload = json.dumps({"questions": [{"q": "Tell me about a conflict", "topic": "behavioral"}] * 200})
+    cache.set("k", payload, unique)
+
+    assert len(redis.data["k"]) < len(payload) / 4
+    assert cache.get("k", unique) == (True, payload)
+    assert cache.stats()["compressed_bytes_saved"] > 0
+
+
+def test_lru_evicts_least_recently_used(fake_redis):
+    cache = LayeredCache(fake_redis, max_entries=2)
+    cache.set("a", "1", shared)
+    cache.set("b", "2", shared)
+    cache.get("a", shared)
+    cache.set("c", "3", shared)
+
+    cache.redis.data.clear()
+    assert cache.get("a", shared) == (True, "1")
+    assert cache.get("b", shared) == (False, None)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_negative_entries_report_a_cached_failure(fake_redis):
+    cache = LayeredCache(fake_redis)
+    cache.set_negative("k", CachePolicy(ttl=60, negative_ttl=30))
+    assert cache.get("k", shared) == (True, None)
+    cache.set_negative("off", CachePolicy(ttl=60, negative_ttl=0))
+    assert cache.get("off", shared) == (False, None)
+    assert cache.stats()["negative_hits"] == 1
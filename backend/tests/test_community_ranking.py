@@ -0,0 +1,102 @@
+# backend/tests/test_community_ranking.py
+import datetime
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from app.controllers import community_controller
+from app.controllers.community_controller import CommunityController
+from app.models import User, Post, Vote
+from app.repositories.post_repository import AsyncPostRepository, PostRepository
+from app.services.counter_service import CounterBuffer, MemoryCounterStore
+from app.utils.ranking import hot_score
+
+
+@pytest.fixture(autouse=True)
+def post_counters(db, monkeypatch):
+    counters = CounterBuffer(MemoryCounterStore(), apply=lambda d: PostRepository(db).apply_counter_deltas(d))
+    monkeypatch.setattr(community_controller, "post_counters", counters)
+    return counters
+
+
+def _users(db, n):
+    users = [User(name=f"u{i}", email=f"u{i}@test.dev", password_hash="x") for i in range(n)]
+    db.add_all(users)
+    db.commit()
+    return users
+
+
+def test_votes_and_views_are_buffered_then_flushed_atomically(db):
+    users = _users(db, 3)
+    controller = CommunityController(db)
+    post = controller.create_post(users[0].id, {"title": "t", "body": "b"})
+
+    assert controller.vote(users[0].id, post.id, 1)["upvotes"] == 1
+    assert controller.vote(users[0].id, post.id, 1)["upvotes"] == 1  # repeat is a no-op
+    controller.vote(users[1].id, post.id, 1)
+    view = controller.vote(users[2].id, post.id, -1)
+    view = controller.vote(users[2].id, post.id, 1)  # switch down -> up
+    assert (view["upvotes"], view["downvotes"], view["score"]) == (3, 0, 3)
+    for _ in range(5):
+        controller.get_post_detail(post.id)
+
+    # Nothing reached the row yet
+    db.refresh(post)
+    assert (post.upvotes, post.downvotes, post.view_count) == (0, 0, 0)
+
+    assert community_controller.post_counters.flush() == 1
+    db.refresh(post)
+    assert (post.upvotes, post.downvotes, post.score, post.view_count) == (3, 0, 3, 5)
+    assert post.hot_score == hot_score(3, post.created_at)
+    assert community_controller.post_counters.flush() == 0
+
+    with pytest.raises(HTTPException) as exc:
+        controller.vote(users[0].id, post.id, 5)
+    assert exc.value.status_code == 400
+
+
+def test_a_user_has_one_vote_row_per_post(db):
+    users = _users(db, 1)
+    post = PostRepository(db).create_post({"user_id": users[0].id, "title": "t", "body": "b"})
+
+    # Two requests racing the first vote: only the one whose insert lands produces a delta
+    first, second = PostRepository(db.factory()), PostRepository(db.factory())
+    assert first.vote(users[0].id, post.id, 1) == {"up": 1}
+    assert second.vote(users[0].id, post.id, 1) == {}
+    assert second.vote(users[0].id, post.id, -1) == {"up": -1, "down": 1}
+    assert db.query(Vote).filter_by(post_id=post.id).count() == 1
+
+    db.add(Vote(user_id=users[0].id, post_id=post.id, vote_type=1))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+
+def test_hot_and_top_feeds_page_by_stored_score(db, run_async):
+    users = _users(db, 1)
+    now = datetime.datetime(2026, 6, 1, 12, 0, 0)
+    db.add_all([
+        Post(id=f"{i:032x}", user_id=users[0].id, title=f"p{i}", body="b", score=score,
+             hot_score=hot_score(score, now - datetime.timedelta(hours=hours)),
+             created_at=now - datetime.timedelta(hours=hours))
+        for i, (score, hours) in enumerate([(1, 0), (100, 30), (10, 2), (10, 2), (0, 1), (-5, 0)])
+    ])
+    db.commit()
+
+    def walk(sort):
+        async def pages(adb):
+            titles, cursor = [], None
+            for _ in range(6):
+                page = await AsyncPostRepository(adb).list_posts(limit=2, cursor=cursor, sort=sort)
+                titles += [p.title for p in page["posts"]]
+                cursor = page["next_cursor"]
+                if not page["has_more"]:
+                    break
+            with pytest.raises(HTTPException):
+                new_cursor = (await AsyncPostRepository(adb).list_posts(limit=1, sort="new"))["next_cursor"]
+                await AsyncPostRepository(adb).list_posts(limit=1, cursor=new_cursor, sort="hot")
+            return titles
+        return run_async(pages)
+
+    assert walk("top") == ["p1", "p3", "p2", "p0", "p4", "p5"]
+    # 100 votes from 30h ago lose to 10 votes from 2h ago; ties break on id
+    assert walk("hot") == ["p3", "p2", "p0", "p4", "p1", "p5"]
@@ -0,0 +1,54 @@
+# backend/tests/test_counter_service.py
+import pytest
+from app.models import User, AppliedCounterBatch
+from app.repositories.post_repository import PostRepository
+from app.services.counter_service import CounterBuffer, RedisCounterStore
+
+
+
+def _post(db):
+    user = User(name="u", email="u@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+    return PostRepository(db).create_post({"user_id": user.id, "title": "t", "body": "b"})
+
+
+def test_a_batch_replayed_after_a_crash_is_applied_once(db, fake_redis):
+    post = _post(db)
+    redis = fake_redis
+    crash = {"after_commit": True}
+
+    def apply(deltas, batch_id=None):
+        PostRepository(db).apply_counter_deltas(deltas, batch_id)
+        if crash.pop("after_commit", False):
+            raise ConnectionError("worker died before clearing the batch")
+
+    counters = CounterBuffer(RedisCounterStore(redis, "post_counters"), apply=apply)
+    counters.incr(post.id, "views", 3)
+    with pytest.raises(ConnectionError):
+        counters.flush()
+    counters.incr(post.id, "views", 1)  # arrives in a fresh live hash meanwhile
+
+    assert counters.flush() == 1  # the replayed batch is skipped and cleared
+    db.refresh(post)
+    assert post.view_count == 3
+    assert counters.flush() == 1
+    db.refresh(post)
+    assert post.view_count == 4
+    assert db.query(AppliedCounterBatch).count() == 2
+
+
+def test_flush_only_releases_its_own_lock(db, fake_redis):
+    post = _post(db)
+    redis = fake_redis
+
+    def slow_apply(deltas, batch_id=None):
+        # The lock expired mid-apply and another flusher took it
+        redis.data["post_counters:flush_lock"] = "someone-else"
+        PostRepository(db).apply_counter_deltas(deltas, batch_id)
+
+    counters = CounterBuffer(RedisCounterStore(redis, "post_counters"), apply=slow_apply)
+    counters.incr(post.id, "up", 1)
+    assert counters.flush() == 1
+    assert redis.data["post_counters:flush_lock"] == "someone-else"
+    assert counters.flush() == 0  # still held by the other flusher
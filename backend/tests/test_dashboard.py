@@ -0,0 +1,69 @@
+# backend/tests/test_dashboard.py
+import datetime
+from types import SimpleNamespace
+from sqlalchemy import event
+from starlette.requests import Request
+from fastapi import Response
+from app.models import User, InterviewSession, EvaluationSession, ResumeScan
+from app.models.interview_session import PracticeStreak
+from app.repositories.readiness_repository import ReadinessRepository
+from app.repositories.streak_repository import StreakRepository
+from app.routes.dashboard import get_dashboard
+from app.services.data_version import dashboard_versions
+
+
+def _get(run_async, user_id, if_none_match=None):
+    """Call the route on a fresh async engine; returns (response or body, headers, statements run)."""
+    async def call(adb):
+        statements = []
+        event.listen(adb.bind.sync_engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        response = Response()
+        result = await get_dashboard(Request({"type": "http", "headers": headers}), response,
+                                     user=SimpleNamespace(id=user_id), db=adb)
+        return result, response.headers, statements
+    return run_async(call)
+
+
+def test_dashboard_is_one_statement_and_revalidates_with_304(db, run_async, monkeypatch, fake_redis):
+    monkeypatch.setattr(dashboard_versions, "redis", fake_redis)
+    monkeypatch.setattr(dashboard_versions, "enabled", True)
+    user = User(name="u", email="u@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+    today = datetime.date.today()
+    db.add_all([
+        EvaluationSession(user_id=user.id, question="q", answer="a", overall_score=score) for score in (60, 80)
+    ] + [
+        InterviewSession(user_id=user.id, session_type="mock") for _ in range(3)
+    ] + [
+        ResumeScan(user_id=user.id, file_url="cv.pdf", ats_score=72.0),
+        PracticeStreak(user_id=user.id, date=today - datetime.timedelta(days=30), sessions=2),
+    ])
+    db.commit()
+    StreakRepository(db).record_activity(user.id)
+
+    body, headers, statements = _get(run_async, user.id)
+    assert len(statements) == 1
+    assert body["stats"] == {"avg_score": 70.0, "mock_count": 3, "ats_score": 72.0, "streak": 1}
+    assert body["weekly_progress"] == {today.isoformat(): 1}
+    assert len(body["streak_calendar"]) == 2
+    assert body["readiness_score"]["computed_at"] is None
+    etag = headers["etag"]
+    assert etag.startswith('W/"') and headers["cache-control"] == "private, no-cache"
+
+    # Unchanged: 304 from the version store, no SQL at all
+    response, _, statements = _get(run_async, user.id, if_none_match=etag)
+    assert response.status_code == 304 and response.headers["etag"] == etag
+    assert statements == []
+
+    # A committed write replaces the version, so the stale copy is served in full again
+    ReadinessRepository(db).mark_dirty(user.id)
+    body, headers, statements = _get(run_async, user.id, if_none_match=etag)
+    assert isinstance(body, dict) and headers["etag"] != etag
+    assert body["readiness_score"]["stale"] is True
+
+    # Without a shared version store there is no ETag, and every poll is a full response
+    monkeypatch.setattr(dashboard_versions, "enabled", False)
+    body, headers, _ = _get(run_async, user.id, if_none_match=etag)
+    assert isinstance(body, dict) and "etag" not in headers
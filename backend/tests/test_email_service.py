@@ -0,0 +1,35 @@
+# backend/tests/test_email_service.py
+import asyncio
+import json
+from app.models import User
+from app.services import email_service as email_module
+from app.services.email_service import EmailService
+from app.services.job_service import JobQueue, MemoryJobStore
+
+
+def test_queued_emails_carry_no_token_and_render_in_the_worker(db, monkeypatch):
+    queue = JobQueue(MemoryJobStore())
+    sent = []
+    monkeypatch.setattr(email_module, "job_queue", queue)
+    monkeypatch.setattr(email_module, "SessionLocal", db.factory)
+    monkeypatch.setattr(EmailService, "_send_email", staticmethod(lambda to, subject, body: sent.append((to, body)) or True))
+    user = User(name="u", email="u@test.dev", password_hash="x", reset_token="secret-reset-token")
+    db.add(user)
+    db.commit()
+
+    job_id = asyncio.run(EmailService.send_password_reset(user.id, user.reset_token))
+    assert asyncio.run(EmailService.send_password_reset(user.id, user.reset_token)) == job_id
+    record = queue.get(job_id)
+    assert record["payload"] == {"template": "password_reset", "user_id": user.id}
+    assert "secret-reset-token" not in json.dumps(record)
+
+    assert queue.run_one(timeout=0.01)
+    assert queue.get(job_id)["result"] == {"sent": True}
+    assert sent[0][0] == "u@test.dev" and "reset-password?token=secret-reset-token" in sent[0][1]
+
+    # A link used before the worker ran is not sent
+    user.reset_token = None
+    db.commit()
+    job_id = asyncio.run(EmailService.send_password_reset(user.id, "secret-reset-token-2"))
+    assert queue.run_one(timeout=0.01)
+    assert queue.get(job_id)["result"] == {"sent": False} and len(sent) == 1
@@ -0,0 +1,32 @@
+# backend/tests/test_file_service.py
+import asyncio
+import hashlib
+import io
+import pytest
+from fastapi import UploadFile, HTTPException
+from app.services.file_service import save_upload_stream
+
+
+def _upload(data: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename="answer.webm")
+
+
+def test_streams_to_randomly_named_file(tmp_path):
+    data = b"\x1aE\xdf\xa3" * 300_000
+    filename, size, sha = asyncio.run(save_upload_stream(_upload(data), tmp_path, ".webm", 10**7, chunk_size=64 * 1024))
+
+    assert sha == hashlib.sha256(data).hexdigest()
+    assert filename.endswith(".webm") and sha not in filename and size == len(data)
+    assert (tmp_path / filename).read_bytes() == data
+
+    # The same content gets its own unguessable name and leaves no temp files behind
+    again = asyncio.run(save_upload_stream(_upload(data), tmp_path, ".webm", 10**7))
+    assert again[0] != filename and again[2] == sha
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([filename, again[0]])
+
+
+def test_oversized_upload_is_rejected_mid_stream(tmp_path):
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(save_upload_stream(_upload(b"x" * 5000), tmp_path, ".webm", 4096, chunk_size=1024))
+    assert exc.value.status_code == 413
+    assert list(tmp_path.iterdir()) == []
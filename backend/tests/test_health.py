@@ -14,3 +14,10 @@ def test_root_endpoint():
     response = client.get("/")
     assert response.status_code == 200
     assert "Welcome" in response.json()["message"]
+
+def test_feature_routers_are_mounted():
+    paths = app.openapi()["paths"]
+    for path in ("/api/analytics/platform", "/api/badges/me", "/api/behavioral/questions",
+                 "/api/leaderboard/colleges", "/api/questions/topics", "/api/sessions/history",
+                 "/api/voice/history"):
+        assert path in paths
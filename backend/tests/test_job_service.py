@@ -0,0 +1,161 @@
+# backend/tests/test_job_service.py
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.controllers import evaluation_controller
+from app.models import User, InterviewSession, EvaluationSession, LeaderboardEntry, SessionDailyRollup
+from app.core.dependencies import get_optional_user
+from app.routes import behavioral, jobs
+from app.services.auth_cache import Principal
+from app.services.job_service import JobQueue, MemoryJobStore, RedisJobStore, job
+
+calls = {"flaky": 0}
+
+@job("test.add")
+def add_job(a: int, b: int):
+    return {"sum": a + b}
+
+@job("test.async_double")
+async def async_double_job(x: int):
+    await asyncio.sleep(0)
+    return {"value": x * 2}
+
+@job("test.flaky", max_retries=2, backoff=0)
+def flaky_job():
+    calls["flaky"] += 1
+    if calls["flaky"] < 3:
+        raise RuntimeError("transient")
+    return {"ok": True}
+
+@job("test.broken", max_retries=1, backoff=0)
+def broken_job():
+    raise RuntimeError("always fails")
+
+
+def _drain(queue: JobQueue):
+    while queue.run_one(timeout=0.01):
+        pass
+
+
+def test_sync_and_async_jobs_complete():
+    queue = JobQueue(MemoryJobStore())
+    first = queue.enqueue("test.add", {"a": 2, "b": 3})
+    second = queue.enqueue("test.async_double", {"x": 21})
+    assert first["status"] == "queued"
+    _drain(queue)
+    assert queue.get(first["id"])["result"] == {"sum": 5}
+    assert queue.get(second["id"])["status"] == "succeeded"
+    assert queue.get(second["id"])["result"] == {"value": 42}
+
+
+def test_retries_until_success_then_gives_up_when_exhausted():
+    queue = JobQueue(MemoryJobStore())
+    flaky = queue.enqueue("test.flaky", {})
+    broken = queue.enqueue("test.broken", {})
+    _drain(queue)
+
+    record = queue.get(flaky["id"])
+    assert record["status"] == "succeeded" and record["attempts"] == 3
+    record = queue.get(broken["id"])
+    assert record["status"] == "failed" and record["attempts"] == 2
+    assert record["error"] == "always fails"
+
+
+def test_jobs_held_by_a_lost_worker_are_requeued(fake_redis):
+    redis = fake_redis
+    crashed, survivor = RedisJobStore(redis, consumer="a"), RedisJobStore(redis, consumer="b")
+    queue = JobQueue(survivor)
+    lost = queue.enqueue("test.add", {"a": 1, "b": 2})
+    done = queue.enqueue("test.add", {"a": 3, "b": 4})
+
+    # Worker "a" takes a job and dies before recording the attempt
+    crashed.heartbeat()
+    assert crashed.pop(timeout=1) == lost["id"]
+    assert redis.lists["jobs:processing:a"] == [lost["id"]]
+
+    # Completed jobs leave the processing list
+    assert queue.run_one() and queue.get(done["id"])["status"] == "succeeded"
+    assert redis.lists["jobs:processing:b"] == []
+    assert not queue.run_one()
+
+    survivor.heartbeat()
+    assert survivor.reap(stale_after=60) == 0  # "a" is not stale yet
+    assert survivor.reap(stale_after=0) == 1
+    assert redis.lists["jobs:processing:a"] == [] and "a" not in redis.zsets["jobs:consumers"]
+    _drain(queue)
+    assert queue.get(lost["id"])["result"] == {"sum": 3}
+
+
+def test_idempotency_key_returns_the_original_job():
+    queue = JobQueue(MemoryJobStore())
+    first = queue.enqueue("test.add", {"a": 1, "b": 1}, idempotency_key="req-1")
+    again = queue.enqueue("test.add", {"a": 1, "b": 1}, idempotency_key="req-1")
+    other = queue.enqueue("test.add", {"a": 1, "b": 1}, idempotency_key="req-2")
+    assert again["id"] == first["id"]
+    assert other["id"] != first["id"]
+    _drain(queue)
+    assert queue.get(first["id"])["attempts"] == 1
+
+
+def test_evaluation_jobs_insert_once_when_retried(db, monkeypatch):
+    async def fake_behavioral(question, answer, round_type):
+        return {"overall_score": 80, "parameters": {}}
+
+    async def fake_report(question, answer, context):
+        return {"overall_score": 75, "scores": {}}
+
+    monkeypatch.setattr(behavioral, "SessionLocal", db.factory)
+    monkeypatch.setattr(behavioral, "evaluate_answer", fake_behavioral)
+    monkeypatch.setattr(evaluation_controller, "SessionLocal", db.factory)
+    monkeypatch.setattr(evaluation_controller.ai_service, "evaluate_interview_response", fake_report)
+    user = User(name="u", email="u@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+
+    behavioral_payload = {"question": "q", "answer": "a b", "round_type": "HR", "user_id": user.id, "session_id": "b" * 32}
+    evaluation_payload = {"user_id": user.id, "data": {"question": "q", "answer": "a"}, "session_id": "e" * 32}
+
+    # A failure in a follow-up write rolls back the session row with it
+    def crash(*args, **kwargs):
+        raise ConnectionError("worker died mid-job")
+    with monkeypatch.context() as m:
+        m.setattr(behavioral.BadgeRepository, "evaluate", crash)
+        with pytest.raises(ConnectionError):
+            asyncio.run(behavioral.evaluate_job(**behavioral_payload))
+    assert db.query(InterviewSession).count() == 0
+
+    # A worker that dies after commit runs the same payload again
+    for _ in range(2):
+        assert asyncio.run(behavioral.evaluate_job(**behavioral_payload))["session_id"] == "b" * 32
+        assert asyncio.run(evaluation_controller.evaluate_answer_job(**evaluation_payload))["session_id"] == "e" * 32
+
+    db.expire_all()
+    assert [s.id for s in db.query(InterviewSession)] == ["b" * 32]
+    assert [s.id for s in db.query(EvaluationSession)] == ["e" * 32]
+    assert db.query(SessionDailyRollup.session_count).scalar() == 1
+    assert db.query(LeaderboardEntry.total_sessions).filter_by(user_id=user.id).scalar() == 1
+
+
+def test_job_status_is_only_visible_to_its_owner_or_token_holder(monkeypatch):
+    queue = JobQueue(MemoryJobStore())
+    monkeypatch.setattr(jobs, "job_queue", queue)
+    mine = queue.enqueue("test.add", {"a": 1, "b": 1}, user_id="alice")
+    theirs = queue.enqueue("test.add", {"a": 1, "b": 1}, user_id="bob")
+    guest = queue.enqueue("test.add", {"a": 1, "b": 1})
+
+    app = FastAPI()
+    app.include_router(jobs.router)
+    client = TestClient(app)
+    assert client.get(f"/jobs/{mine['id']}").status_code == 401
+
+    app.dependency_overrides[get_optional_user] = lambda: Principal("alice", "user", True)
+    assert client.get(f"/jobs/{mine['id']}").json()["status"] == "queued"
+    for job_id in (theirs["id"], guest["id"], "missing"):
+        assert client.get(f"/jobs/{job_id}").status_code == 404
+
+    # Guests poll with the job's token instead of a login
+    app.dependency_overrides.clear()
+    assert client.get(f"/jobs/{guest['id']}", headers={"X-Job-Token": guest["poll_token"]}).json()["status"] == "queued"
+    for job_id, token in ((guest["id"], "wrong"), (mine["id"], guest["poll_token"])):
+        assert client.get(f"/jobs/{job_id}", headers={"X-Job-Token": token}).status_code == 404
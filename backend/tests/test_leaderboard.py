@@ -0,0 +1,92 @@
+# backend/tests/test_leaderboard.py
+import datetime
+from app.models import User, InterviewSession, LeaderboardEntry
+from app.repositories.leaderboard_repository import (
+    AsyncLeaderboardRepository, LeaderboardRepository, compute_rank_score,
+)
+from app.repositories.streak_repository import StreakRepository
+from app.routes.voice import delete_session
+from app.services.scheduler_service import DailySweeper
+
+TODAY = datetime.date.today()
+
+
+def _seed(db):
+    alice = User(name="alice", email="alice@test.dev", password_hash="x", college="MIT")
+    bob = User(name="bob", email="bob@test.dev", password_hash="x", college="IIT")
+    carol = User(name="carol", email="carol@test.dev", password_hash="x", college="MIT", is_scores_public=False)
+    db.add_all([alice, bob, carol])
+    db.commit()
+    for user, score in [(alice, 90.0), (alice, 70.0), (bob, 60.0), (carol, 100.0)]:
+        db.add(InterviewSession(user_id=user.id, session_type="voice", overall_score=score))
+    db.commit()
+    streaks = StreakRepository(db)
+    for days_ago in (2, 1, 0):
+        streaks.record_activity(alice.id, TODAY - datetime.timedelta(days=days_ago))
+    for days_ago in (5, 4):  # stored streak of 2 that has since lapsed
+        streaks.record_activity(bob.id, TODAY - datetime.timedelta(days=days_ago))
+    return alice, bob, carol
+
+
+def _entries(db):
+    db.expire_all()
+    return {e.user_id: (e.total_sessions, e.avg_score, e.best_score, e.streak_days, e.rank_score, e.is_public)
+            for e in db.query(LeaderboardEntry)}
+
+
+def test_refresh_user_and_rebuild_agree(db):
+    alice, bob, carol = _seed(db)
+    repo = LeaderboardRepository(db)
+    for user in (alice, bob, carol):
+        repo.refresh_user(user.id)
+    refreshed = _entries(db)
+    assert refreshed == {
+        alice.id: (2, 80.0, 90.0, 3, compute_rank_score(80.0, 3, 2), True),
+        bob.id: (1, 60.0, 60.0, 0, compute_rank_score(60.0, 0, 1), True),  # lapsed streak is not counted
+        carol.id: (1, 100.0, 100.0, 0, compute_rank_score(100.0, 0, 1), False),
+    }
+
+    assert repo.rebuild(batch_size=2) == 3
+    assert _entries(db) == refreshed
+
+    # Deleting a user's last session takes them off the board
+    session = db.query(InterviewSession).filter_by(user_id=bob.id).one()
+    delete_session(session.id, db=db)
+    assert bob.id not in _entries(db)
+
+
+def test_top_and_rank_of_only_rank_public_entries(db, run_async):
+    alice, bob, carol = _seed(db)
+    LeaderboardRepository(db).rebuild()
+
+    async def read(adb):
+        board = AsyncLeaderboardRepository(adb)
+        top = [row[0].user_id for row in await board.top()]
+        by_total = [row[0].user_id for row in await board.top(sort_by="total_sessions")]
+        mit = [row[0].user_id for row in await board.top(college="mit")]
+        ranks = [await board.rank_of(await board.get_entry(u.id)) for u in (alice, bob, carol)]
+        return top, by_total, mit, ranks
+
+    top, by_total, mit, ranks = run_async(read)
+    assert top == by_total == [alice.id, bob.id]
+    assert mit == [alice.id]
+    assert ranks == [1, 2, None]
+
+
+def test_lapsed_streaks_decay_once_a_day(db, fake_redis):
+    alice, bob, _ = _seed(db)
+    LeaderboardRepository(db).rebuild()
+    assert _entries(db)[alice.id][3] == 3
+    assert DailySweeper(session_factory=db.factory).sweep(TODAY)["leaderboard"] == 0
+
+    # Two days later, with no writes at all, alice's streak has lapsed
+    later = TODAY + datetime.timedelta(days=2)
+    redis = fake_redis
+    sweeper = DailySweeper(session_factory=db.factory, redis=redis)
+    assert sweeper.sweep(later) == {"readiness": 0, "leaderboard": 1, "counter_batches": 0, "refresh_tokens": 0}
+    entry = _entries(db)[alice.id]
+    assert entry[3:5] == (0, compute_rank_score(80.0, 0, 2))
+
+    # Once per day, across workers
+    assert sweeper.sweep(later) == {}
+    assert DailySweeper(session_factory=db.factory, redis=redis).sweep(later) == {}
@@ -0,0 +1,154 @@
+# backend/tests/test_nlp_service.py
+import json
+import re
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routes import voice
+from app.services import nlp_service as nlp
+
+# Per-term reference implementation the single-pass matcher must agree with
+def _ref_fillers(text):
+    lower = text.lower()
+    found = []
+    for filler in nlp.ALL_FILLERS:
+        count = len(re.findall(rf"\b{re.escape(filler)}\b", lower))
+        if count:
+            found.append({"word": filler, "count": count, "severity": nlp.FILLER_SEVERITY[filler],
+                          "category": "vocal" if filler in nlp.FILLERS_HEAVY else "verbal"})
+    return sorted(found, key=lambda x: -x["severity"] * x["count"])
+
+def _ref_power(text):
+    lower = text.lower()
+    found = {}
+    for category, words in nlp.POWER_WORDS.items():
+        matched = [w for w in words if re.search(rf"\b{w}\b", lower)]
+        if matched:
+            found[category] = matched
+    return found
+
+def _ref_star(text):
+    lower = text.lower()
+    return {
+        "situation": any(kw in lower for kw in nlp.STAR_SITUATION),
+        "task":      any(kw in lower for kw in nlp.STAR_TASK),
+        "action":    any(kw in lower for kw in nlp.STAR_ACTION),
+        "result":    any(kw in lower for kw in nlp.STAR_RESULT),
+    }
+
+VOCAB = (nlp.ALL_FILLERS + nlp.ALL_POWER + nlp.STAR_SITUATION + nlp.STAR_TASK + nlp.STAR_ACTION
+         + nlp.STAR_RESULT + nlp.POSITIVE_WORDS + nlp.NEGATIVE_WORDS
+         + ["Um,", "UH.", "so-so", "likely", "multitask", "unhappy", "50%", "the", "team", "I", "we"])
+
+def test_matcher_agrees_with_per_term_regexes():
+    rng = random.Random(7)
+    for _ in range(300):
+        text = " ".join(rng.choice(VOCAB) for _ in range(rng.randint(1, 60)))
+        assert nlp.detect_fillers(text) == _ref_fillers(text)
+        assert nlp.detect_power_words(text) == _ref_power(text)
+        assert nlp.detect_star(text) == _ref_star(text)
+
+def test_sentiment_hits_use_substring_semantics():
+    hits = nlp.scan_lexicon("I was unhappy but it was not the worst; we succeeded.")
+    assert hits["positive"] == {"happy", "succeeded"}
+    assert hits["negative"] == {"worst"}
+
+def test_evaluate_answer_scores_star_answer():
+    answer = ("In my role at Acme the situation was a failing deploy pipeline. My task was to fix it. "
+              "I decided to rebuild it and I led the team. As a result we reduced build time by 40%.")
+    result = nlp.evaluate_answer(answer)
+    assert all(result["star_breakdown"].values())
+    assert result["has_quantified_result"] is True
+    assert "leadership" in result["power_words"]
+
+@pytest.fixture
+def batch(monkeypatch):
+    """Thread pool instead of processes so a fake evaluate_answer is seen; tracks concurrency."""
+    pool = ThreadPoolExecutor(max_workers=8)
+    stats = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_evaluate(text, question_type):
+        if text == "bad":
+            raise ValueError("unparseable")
+        with lock:
+            stats["running"] += 1
+            stats["peak"] = max(stats["peak"], stats["running"])
+        time.sleep(float(text))
+        with lock:
+            stats["running"] -= 1
+        return {"text": text, "type": question_type}
+
+    monkeypatch.setattr(nlp, "_batch_pool", lambda: pool)
+    monkeypatch.setattr(nlp, "evaluate_answer", fake_evaluate)
+    yield stats
+    pool.shutdown()
+
+def test_batch_results_keep_their_index_when_completing_out_of_order(batch):
+    texts = ["0.2", "0.1", "0"]
+    results = list(nlp.evaluate_answers(texts, ["A", "B", "C"], max_in_flight=3))
+    assert [index for index, _ in results] == [2, 1, 0]
+    assert {index: result for index, result in results} == {
+        0: {"text": "0.2", "type": "A"}, 1: {"text": "0.1", "type": "B"}, 2: {"text": "0", "type": "C"},
+    }
+
+def test_batch_keeps_in_flight_work_bounded(batch):
+    consumed = []
+    def texts():
+        for i in range(20):
+            consumed.append(i)
+            yield "0.01"
+    seen = 0
+    for _ in nlp.evaluate_answers(texts(), max_in_flight=3):
+        seen += 1
+        assert len(consumed) - seen <= 3  # input is pulled lazily, never more than the window ahead
+    assert seen == 20 and batch["peak"] <= 3
+
+def test_batch_endpoint_streams_per_item_errors(batch):
+    app = FastAPI()
+    app.include_router(voice.router)
+    response = TestClient(app).post("/voice/evaluate/batch", json={"items": [
+        {"transcript": "0.05"}, {"transcript": "bad"}, {"transcript": "0", "question_type": "HR"},
+    ]})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = {line["index"]: line["result"] for line in map(json.loads, response.text.splitlines())}
+    assert lines == {
+        0: {"text": "0.05", "type": "Behavioral"},
+        1: {"error": "Evaluation failed: unparseable"},
+        2: {"text": "0", "type": "HR"},
+    }
+
+def test_closing_a_batch_cancels_work_not_yet_started(monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=1)
+    release, ran = threading.Event(), []
+
+    def fake_evaluate(text, question_type):
+        ran.append(text)
+        if text != "a":
+            release.wait(5)
+        return {}
+
+    monkeypatch.setattr(nlp, "_batch_pool", lambda: pool)
+    monkeypatch.setattr(nlp, "evaluate_answer", fake_evaluate)
+    results = nlp.evaluate_answers(["a", "b", "c", "d"], max_in_flight=4)
+    assert next(results) == (0, {})
+    results.close()  # client went away; at most "b" has started
+    release.set()
+    pool.shutdown(wait=True)
+    assert ran in (["a"], ["a", "b"])
+
+def test_a_dead_worker_pool_becomes_per_item_errors(monkeypatch):
+    class DeadPool:
+        def submit(self, *args):
+            raise BrokenProcessPool("A child process terminated abruptly")
+
+    monkeypatch.setattr(nlp, "_batch_pool", lambda: DeadPool())
+    assert sorted(nlp.evaluate_answers(["x", "y"])) == [
+        (0, {"error": "Evaluation failed: worker process died"}),
+        (1, {"error": "Evaluation failed: worker process died"}),
+    ]
@@ -0,0 +1,58 @@
+# backend/tests/test_pagination.py
+import datetime
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+from app.models import Base, InterviewSession
+from app.routes.voice import get_history
+from app.utils.pagination import keyset
+
+
+def _db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_cursor_walk_is_complete_and_stable_across_timestamp_ties():
+    db = _db()
+    base = datetime.datetime(2026, 1, 1, 12, 0, 0)
+    # Python-written timestamps plus server-default ones (whole seconds, many ties)
+    for i in range(12):
+        db.add(InterviewSession(user_id="u1", session_type="voice", overall_score=i,
+                                created_at=base + datetime.timedelta(milliseconds=250 * i)))
+    db.commit()
+    db.execute(insert(InterviewSession), [
+        {"id": f"{i:032x}", "user_id": "u1", "session_type": "voice", "overall_score": 100 + i}
+        for i in range(9)
+    ])
+    db.add(InterviewSession(user_id="u1", session_type="behavioral"))
+    db.commit()
+
+    expected = [s.id for s in db.query(InterviewSession).filter_by(session_type="voice").order_by(
+        InterviewSession.created_at.desc(), InterviewSession.id.desc())]
+    seen, cursor = [], None
+    for _ in range(len(expected)):
+        page = get_history(user_id="u1", cursor=cursor, limit=5, include_total=False, db=db)
+        seen += [s["id"] for s in page["sessions"]]
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+    assert seen == expected and len(seen) == 21
+
+
+def test_invalid_cursor_is_a_400():
+    with pytest.raises(HTTPException) as exc:
+        get_history(user_id="u1", cursor="not-a-cursor", limit=5, include_total=False, db=_db())
+    assert exc.value.status_code == 400
+
+
+def test_deep_pages_seek_through_the_composite_index():
+    db = _db()
+    q = keyset(db.query(InterviewSession).filter_by(user_id="u1", session_type="voice"),
+               InterviewSession, "WyIyMDI2LTAxLTAxVDEyOjAwOjAwIiwiYWJjIl0", 20, "sqlite")
+    sql = str(q.statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True}))
+    plan = " ".join(str(r) for r in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+    assert "ix_interview_sessions_user_type_created_id" in plan
+    assert "TEMP B-TREE" not in plan  # no sort: rows come off the index in page order
@@ -0,0 +1,83 @@
+# backend/tests/test_platform_counters.py
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+import app.routes.analytics as analytics_routes
+import app.services.response_cache as response_cache_module
+from app.core.database import get_db
+from app.models import User, InterviewSession, PlatformCounter
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.repositories.platform_repository import PlatformCounterRepository
+from app.services.cache_service import LayeredCache
+from app.services.counter_service import CounterBuffer, MemoryCounterStore
+from app.services.platform_service import PlatformReconciler
+
+
+def _session(db, user_id, session_type, score):
+    session = InterviewSession(user_id=user_id, session_type=session_type, overall_score=score)
+    db.add(session)
+    db.flush()
+    AnalyticsRepository(db).record_session(session, commit=False)
+    db.commit()
+    return session
+
+
+def test_counters_follow_writes_and_serve_the_platform_endpoint(db, monkeypatch, fake_redis):
+    users = [User(name=f"u{i}", email=f"u{i}@test.dev", password_hash="x") for i in range(3)]
+    db.add_all(users)
+    db.commit()
+    repo = PlatformCounterRepository(db)
+    for _ in users:
+        repo.record_user()
+    _session(db, users[0].id, "behavioral", 90)
+    _session(db, users[0].id, "voice", 70)
+    _session(db, users[1].id, "voice", 50)
+    doomed = _session(db, users[1].id, "mock", 10)
+    db.delete(doomed)
+    db.flush()
+    AnalyticsRepository(db).remove_session(doomed)
+
+    # Events go through the write-behind buffer and land on flush
+    buffer = CounterBuffer(MemoryCounterStore(), apply=PlatformCounterRepository(db).apply_buffered)
+    monkeypatch.setattr(analytics_routes, "platform_events", buffer)
+    monkeypatch.setattr(response_cache_module, "response_cache", LayeredCache(fake_redis))
+    app = FastAPI()
+    app.include_router(analytics_routes.router)
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+    for page in ("home", "home", "dsa"):
+        assert client.post("/analytics/event", json={"event_type": "page_view", "page": page}).status_code == 200
+    buffer.flush()
+
+    statements = []
+    event.listen(db.engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    stats = client.get("/analytics/platform").json()
+    assert stats == {
+        "total_users": 3, "total_sessions": 3, "total_events": 3,
+        "sessions_by_type": {"behavioral": 1, "voice": 2}, "avg_score": 70.0,
+    }
+    assert len(statements) == 1 and "platform_counters" in statements[0]
+
+    # Maintained counters already agree with a full recount
+    reconciler = PlatformReconciler(session_factory=db.factory, buffer=buffer)
+    assert reconciler.reconcile() == {}
+
+
+def test_reconcile_corrects_drift_and_runs_once_per_interval(db, fake_redis):
+    user = User(name="u", email="u@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+    db.add(InterviewSession(user_id=user.id, session_type="mock", overall_score=50))  # written without counters
+    db.add(PlatformCounter(name="sessions:legacy", value=4))
+    db.commit()
+
+    buffer = CounterBuffer(MemoryCounterStore(), apply=PlatformCounterRepository(db).apply_buffered)
+    reconciler = PlatformReconciler(session_factory=db.factory, redis=fake_redis, buffer=buffer)
+    drift = reconciler.reconcile(interval=3600)
+    assert drift == {"users": 1, "sessions": 1, "sessions:mock": 1, "scores": 1, "sessions:legacy": -4}
+    assert reconciler.reconcile(interval=3600) == {}  # another pass this interval is skipped
+
+    db.expire_all()
+    counters = PlatformCounterRepository(db).snapshot()
+    assert counters["scores"] == (1, 50.0) and counters["sessions:legacy"] == (0, 0.0)
+    assert reconciler.reconcile() == {}
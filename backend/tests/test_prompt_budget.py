@@ -0,0 +1,78 @@
+# backend/tests/test_prompt_budget.py
+import asyncio
+from app.services.ai_service import AIService
+from app.services.cache_service import LayeredCache
+from app.services.prompt_budget import (
+    PromptBudget, compact_nlp_features, estimate_tokens, truncate_code, truncate_resume, truncate_text,
+)
+
+RESUME = (
+    "Jane Doe\njane@example.com\n\n\nSUMMARY\nBackend engineer, 6 years of distributed systems.\n\nEXPERIENCE\n"
+    + "\n".join(f"- Role {i}: moved the payments service to Kafka, cutting p99 latency by {i}0%." for i in range(250))
+    + "\n\nSkills:\nPython, Go, Kafka, Postgres, Redis\n\nPROJECTS\n"
+    + "\n".join(f"- Project {i}: token-bucket rate limiter serving 1M rps." for i in range(40))
+    + "\n\nEducation\nB.Tech CSE, 2018\n\nHobbies\n" + "chess, running\n" * 30
+)
+
+
+def test_short_input_passes_through_and_estimate_is_conservative():
+    assert estimate_tokens("") == 0
+    # ~1 token per common word, more for long words and numbers
+    assert 8 <= estimate_tokens("Designed a rate limiter serving 1000000 requests per second.") <= 16
+    fitted, before, after = PromptBudget(answer=100).fit({"answer": "Short answer.", "question": "Q?"})
+    assert fitted == {"answer": "Short answer.", "question": "Q?"}
+    assert before == after
+
+
+def test_resume_is_trimmed_by_section_within_budget():
+    out = truncate_resume(RESUME, 600)
+    assert estimate_tokens(out) <= 600
+    # Every kept section still has its heading and its first (most recent) lines
+    for line in ("SUMMARY", "EXPERIENCE", "- Role 0:", "Skills:", "Python, Go", "PROJECTS", "- Project 0:", "Education"):
+        assert line in out
+    assert "chess" not in out and "[omitted sections: Hobbies]" in out
+    assert "- Role 249:" not in out
+    # Experience gets a larger share than projects
+    lines = out.splitlines()
+    assert (sum(estimate_tokens(l) for l in lines if l.startswith("- Role "))
+            > sum(estimate_tokens(l) for l in lines if l.startswith("- Project ")))
+
+
+def test_code_keeps_indentation_drops_comments_then_elides_middle():
+    code = "import sys\n\n\n" + "".join(
+        f"def f{i}(x):\n    # add {i}\n    y  =  x\n    return y + {i}\n\n" for i in range(200))
+    out = truncate_code(code, 300, "python")
+    assert estimate_tokens(out) <= 300
+    assert out.startswith("import sys\n\ndef f0(x):\n    y  =  x\n    return y + 0")
+    assert out.rstrip().endswith("return y + 199")
+    assert "# add" not in out and "# ... " in out and "lines omitted ..." in out
+    assert "// ... " in truncate_code(code.replace("# add", "// add"), 300, "javascript")
+
+    # A run-on paragraph with no line breaks keeps its head and tail words
+    text = truncate_text(" ".join(f"w{i}" for i in range(3000)), 100)
+    assert text.startswith("w0 w1") and text.endswith("w2999") and estimate_tokens(text) <= 100
+
+
+def test_service_applies_budgets_and_reports_savings(fake_redis):
+    service = AIService()
+    service.api_key = "test-key"
+    service.redis = fake_redis
+    service.cache = LayeredCache(service.redis)
+    prompts = []
+
+    async def upstream(system, prompt):
+        prompts.append(prompt)
+        return "{}"  # invalid for the schemas: the prompt is what's under test
+
+    service._call_upstream = upstream
+    asyncio.run(service.rate_resume_ats(RESUME))
+    asyncio.run(service.evaluate_interview_response("Tell me about a conflict.", "Um, so basically, like, I fixed it. " * 5))
+
+    assert "- Role 0:" in prompts[0] and "chess" not in prompts[0]
+    assert "Integrate local NLP signals: fillers: " in prompts[1] and "'severity'" not in prompts[1]
+    stats = service.prompt_token_stats()
+    assert stats["resume_ats"]["truncated"] == 1
+    assert stats["resume_ats"]["saved"] == stats["resume_ats"]["saved_per_call"] > estimate_tokens(RESUME) - 3000 - 50
+    # Nothing truncated, but the compact NLP features alone save tokens
+    assert stats["interview_eval"]["truncated"] == 1 and stats["interview_eval"]["saved"] > 50
+    assert compact_nlp_features({"fillers": []}) == "fillers: none"
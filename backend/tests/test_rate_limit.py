@@ -0,0 +1,57 @@
+# backend/tests/test_rate_limit.py
+import asyncio
+from app.middleware.rate_limit import RateLimiter, RateLimitRule, TokenBucket
+
+
+class BrokenRedis:
+    def register_script(self, script):
+        async def call(keys, args):
+            raise ConnectionError("redis down")
+        return call
+
+
+def _limiter(**kwargs):
+    rules = [RateLimitRule("/api/auth/login", 2, 60), RateLimitRule("/api/auth", 5, 60)]
+    return RateLimiter(limit=3, window=60, rules=rules, **kwargs)
+
+
+def test_token_bucket_allows_burst_then_reports_retry_after():
+    bucket = TokenBucket()
+    assert [bucket.hit("k", 3, 60)[0] for _ in range(4)] == [True, True, True, False]
+    allowed, retry_after, remaining = bucket.hit("k", 3, 60)
+    assert not allowed and 0 < retry_after <= 20 and remaining == 0
+
+
+def test_longest_prefix_rule_wins():
+    limiter = _limiter()
+    assert limiter.rule_for("/api/auth/login").limit == 2
+    assert limiter.rule_for("/api/auth/me").limit == 5
+    assert limiter.rule_for("/api/dashboard").prefix == ""
+
+
+def test_users_and_ips_are_limited_separately():
+    limiter = _limiter(user_limit=4)
+
+    async def run():
+        ip = [(await limiter.hit("1.2.3.4", "/api/auth/login"))[0] for _ in range(3)]
+        user = [(await limiter.hit("1.2.3.4", "/api/auth/login", "u1"))[0] for _ in range(3)]
+        # Unmatched routes use the default rule: 3/min per IP, 4/min per user, per path
+        default = [(await limiter.hit("1.2.3.4", "/api/dashboard", "u1"))[0] for _ in range(5)]
+        other_path = (await limiter.hit("1.2.3.4", "/api/tracker", "u1"))[0]
+        return ip, user, default, other_path
+
+    ip, user, default, other_path = asyncio.run(run())
+    assert ip == [True, True, False]
+    assert user == [True, True, False]
+    assert default == [True, True, True, True, False]
+    assert other_path is True
+
+
+def test_redis_failure_falls_back_to_local_bucket():
+    limiter = _limiter(redis=BrokenRedis())
+
+    async def run():
+        return [(await limiter.hit("5.6.7.8", "/api/auth/login"))[0] for _ in range(3)]
+
+    assert asyncio.run(run()) == [True, True, False]
+    assert limiter.metrics["redis_errors"] == 3 and limiter.metrics["local"] == 3
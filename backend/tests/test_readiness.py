@@ -0,0 +1,79 @@
+# backend/tests/test_readiness.py
+import datetime
+from app.controllers.dashboard_controller import DashboardController
+from app.models import User, InterviewSession, EvaluationSession, ReadinessScore
+from app.repositories.readiness_repository import EMPTY_READINESS, ReadinessRepository
+from app.repositories.streak_repository import StreakRepository
+from app.services.readiness_service import ReadinessRefresher
+
+
+def _dashboard(run_async, user_id):
+    return run_async(lambda adb: DashboardController(adb).get_dashboard_data(user_id))
+
+
+def _row(db, user_id):
+    db.expire_all()
+    return db.query(ReadinessScore).filter_by(user_id=user_id).first()
+
+
+def test_dashboard_reads_never_write_and_writes_are_recomputed_once_debounced(db, run_async):
+    user = User(name="u", email="u@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+
+    # No activity yet: the zero-stats score, and still no row
+    assert _dashboard(run_async, user.id)["readiness_score"]["score"] == EMPTY_READINESS["score"]
+    assert _row(db, user.id) is None
+
+    # A burst of writes marks the row once and keeps the first write's timestamp
+    repo = ReadinessRepository(db)
+    db.add(EvaluationSession(user_id=user.id, question="q", answer="a", overall_score=80))
+    db.add_all([InterviewSession(user_id=user.id, session_type="mock") for _ in range(4)])
+    StreakRepository(db).record_activity(user.id)
+    repo.mark_dirty(user.id)
+    first = _row(db, user.id).dirty_since
+    repo.mark_dirty(user.id)
+    assert (_row(db, user.id).dirty_since, _row(db, user.id).version) == (first, 2)
+
+    readiness = _dashboard(run_async, user.id)["readiness_score"]
+    assert readiness["stale"] is True and readiness["computed_at"] is None
+
+    refresher = ReadinessRefresher(session_factory=db.factory)
+    assert refresher.refresh_due(debounce=3600) == 0  # still inside the debounce window
+    assert refresher.refresh_due(debounce=0) == 1
+    assert refresher.refresh_due(debounce=0) == 0
+
+    readiness = _dashboard(run_async, user.id)["readiness_score"]
+    # streak 1/30*20 + 80% of 30 + 10 flat DSA + 0 ATS + 4/10*15
+    assert readiness["score"] == round(20 / 30 + 24 + 10 + 6, 1)
+    assert readiness["breakdown"]["mock"] == 6.0
+    assert readiness["stale"] is False and readiness["computed_at"]
+    assert _row(db, user.id).breakdown["sessions_completed"] == 4
+
+
+def test_write_during_recompute_keeps_row_dirty_and_streaks_expire_daily(db, monkeypatch):
+    user = User(name="u", email="u@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+    repo = ReadinessRepository(db)
+    repo.mark_dirty(user.id)
+
+    stats = repo._stats
+    def stats_with_concurrent_write(user_id):
+        other = db.factory()
+        ReadinessRepository(other).mark_dirty(user_id)
+        other.close()
+        return stats(user_id)
+    monkeypatch.setattr(repo, "_stats", stats_with_concurrent_write)
+    repo.recompute(user.id)
+    assert _row(db, user.id).dirty_since is not None
+    monkeypatch.undo()
+
+    ReadinessRepository(db).recompute(user.id)
+    row = _row(db, user.id)
+    assert row.dirty_since is None
+    row.streak_weight = 4.0
+    row.computed_at = datetime.datetime.utcnow() - datetime.timedelta(days=1)
+    db.commit()
+    assert repo.expire_streaks(datetime.date.today()) == 1
+    assert repo.due(debounce=0) == [user.id]
@@ -0,0 +1,82 @@
+# backend/tests/test_refresh_tokens.py
+import asyncio
+import datetime
+import threading
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core import security
+from app.controllers.auth_controller import AuthController
+from app.models import Base, User, RefreshToken
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+
+def _db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    user = User(name="a", email="a@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+    return db, user
+
+
+def test_password_hashing_runs_off_the_event_loop(monkeypatch):
+    threads = []
+    monkeypatch.setattr(security, "verify_password", lambda p, h: threads.append(threading.current_thread().name) or True)
+
+    async def run():
+        return await security.verify_password_async("pw", "hash"), threading.current_thread().name
+
+    ok, loop_thread = asyncio.run(run())
+    assert ok and threads[0].startswith("bcrypt") and threads[0] != loop_thread
+
+
+def test_refresh_rotates_within_family_and_stores_only_digests():
+    db, user = _db()
+    first = RefreshTokenRepository(db).issue(user.id)
+    rotated = asyncio.run(AuthController(db).refresh(first))["refresh_token"]
+
+    rows = sorted(db.query(RefreshToken).all(), key=lambda r: r.used_at is None)
+    assert len(rows) == 2 and rows[0].family_id == rows[1].family_id
+    assert rows[0].used_at is not None and rows[1].used_at is None
+    assert all(r.token_digest == security.token_digest(t) for r, t in zip(rows, (first, rotated)))
+    assert first != rotated
+
+
+def test_reusing_a_rotated_token_revokes_the_family():
+    db, user = _db()
+    other_login = RefreshTokenRepository(db).issue(user.id)
+    stolen = RefreshTokenRepository(db).issue(user.id)
+    current = asyncio.run(AuthController(db).refresh(stolen))["refresh_token"]
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(AuthController(db).refresh(stolen))
+    assert "reuse" in exc.value.detail
+    with pytest.raises(HTTPException):
+        asyncio.run(AuthController(db).refresh(current))
+    # Other logins (families) are untouched
+    assert asyncio.run(AuthController(db).refresh(other_login))["refresh_token"]
+
+
+def test_logout_revokes_all_refresh_tokens():
+    db, user = _db()
+    token = RefreshTokenRepository(db).issue(user.id)
+    asyncio.run(AuthController(db).logout(user.id))
+    with pytest.raises(HTTPException):
+        asyncio.run(AuthController(db).refresh(token))
+
+
+def test_purge_deletes_only_expired_tokens():
+    db, user = _db()
+    repo = RefreshTokenRepository(db)
+    expired, live = repo.issue(user.id), repo.issue(user.id)
+    repo.get_by_token(expired).expires_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+    db.commit()
+
+    assert repo.purge_expired() == 1
+    assert repo.purge_expired() == 0
+    assert [r.token_digest for r in db.query(RefreshToken)] == [security.token_digest(live)]
+    with pytest.raises(HTTPException):
+        asyncio.run(AuthController(db).refresh(expired))
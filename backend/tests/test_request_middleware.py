@@ -0,0 +1,52 @@
+# backend/tests/test_request_middleware.py
+import asyncio
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from app.core.security import create_access_token
+from app.middleware.request_middleware import RequestContextMiddleware
+
+inner = FastAPI()
+
+@inner.get("/whoami")
+def whoami(request: Request):
+    return {"user_id": request.state.user_id, "sub": (request.state.token_payload or {}).get("sub")}
+
+@inner.get("/stream")
+def stream():
+    def chunks():
+        for i in range(3):
+            yield f"chunk{i}\n"
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+def _get(app, path, headers=None):
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers=headers or {})
+    return asyncio.run(run())
+
+
+def test_token_is_decoded_once_into_request_state():
+    app = RequestContextMiddleware(inner)
+    token = create_access_token({"sub": "user-1", "role": "user"})
+    assert _get(app, "/whoami", {"Authorization": f"Bearer {token}"}).json() == {"user_id": "user-1", "sub": "user-1"}
+    assert _get(app, "/whoami", {"Authorization": "Bearer not-a-jwt"}).json() == {"user_id": None, "sub": None}
+
+
+def test_streaming_body_passes_through():
+    response = _get(RequestContextMiddleware(inner), "/stream")
+    assert response.status_code == 200
+    assert response.text == "chunk0\nchunk1\nchunk2\n"
+
+
+def test_rejected_requests_get_429_without_reaching_the_app():
+    app = RequestContextMiddleware(inner)
+    async def reject(client_ip, path, user_id=None):
+        return False, 2.5, 0
+    app.rate_limiter.hit = reject
+    response = _get(app, "/whoami")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3"
+    assert response.json()["success"] is False
@@ -0,0 +1,75 @@
+# backend/tests/test_response_cache.py
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+import app.services.response_cache as response_cache_module
+from app.routes import questions, resume
+from app.services.cache_service import LayeredCache
+from app.services.response_cache import cached_response
+
+
+def _client(*routers):
+    app = FastAPI()
+    for router in routers:
+        app.include_router(router, prefix="/api")
+    return TestClient(app)
+
+
+def test_cached_routes_render_once_per_key_and_revalidate(monkeypatch, fake_redis):
+    redis = fake_redis
+    monkeypatch.setattr(response_cache_module, "response_cache", LayeredCache(redis))
+    calls = []
+    router = APIRouter(prefix="/probe")
+
+    @router.get("/{kind}")
+    @cached_response(ttl=120, vary={"kind": None, "level": ("easy", "hard")})
+    def probe(kind: str, level: str = "easy", trace: str = ""):
+        calls.append((kind, level))
+        if kind == "missing":
+            raise HTTPException(404, "Not found")
+        return {"kind": kind, "level": level, "note": "héllo"}
+
+    client = _client(router, questions.router, resume.router)
+    first = client.get("/api/probe/dsa?level=hard")
+    assert first.json() == {"kind": "dsa", "level": "hard", "note": "héllo"}
+    assert first.headers["cache-control"] == "public, max-age=120"
+    etag = first.headers["etag"]
+
+    # Same arguments: served from the stored bytes; other arguments are their own entry
+    again = client.get("/api/probe/dsa?level=hard")
+    assert again.content == first.content and again.headers["etag"] == etag
+    client.get("/api/probe/dsa")
+    assert calls == [("dsa", "hard"), ("dsa", "easy")]
+
+    # Only declared parameters and values make keys: the rest can't grow the cache
+    entries = len(redis.data)
+    assert client.get("/api/probe/dsa?level=hard&trace=abc").content == first.content
+    assert client.get("/api/probe/dsa?level=bogus").json()["level"] == "bogus"
+    assert client.get("/api/probe/dsa?level=bogus").status_code == 200
+    assert len(redis.data) == entries
+    assert calls[2:] == [("dsa", "bogus"), ("dsa", "bogus")]
+
+    # Another worker (empty local LRU) shares the Redis entry
+    monkeypatch.setattr(response_cache_module, "response_cache", LayeredCache(redis))
+    assert client.get("/api/probe/dsa?level=hard").content == first.content
+    assert len(calls) == 4
+
+    not_modified = client.get("/api/probe/dsa?level=hard", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+
+    # Errors are never cached
+    assert client.get("/api/probe/missing").status_code == 404
+    assert client.get("/api/probe/missing").status_code == 404
+    assert calls[-2:] == [("missing", "easy"), ("missing", "easy")]
+
+    # Decorated public routes keep their query parameters and response bodies
+    topics = client.get("/api/questions/topics?type=System Design")
+    assert topics.json() == {"topics": ["Medium", "Hard"], "type": "System Design"}
+    assert client.get("/api/questions/topics").json()["type"] == "DSA / Coding"
+    assert client.get("/api/questions/bank").json()["types"][0] == "DSA / Coding"
+    assert client.get("/api/resume/templates").json()[0]["role"] == "SWE"
+
+
+def test_vary_must_name_route_parameters():
+    with pytest.raises(ValueError):
+        cached_response(ttl=60, vary=("typo",))(lambda kind: kind)
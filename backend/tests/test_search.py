@@ -0,0 +1,94 @@
+# backend/tests/test_search.py
+import asyncio
+import pytest
+from fastapi import HTTPException
+from app.models import User, Problem, SearchDocument
+from app.repositories import search_repository
+from app.repositories.post_repository import PostRepository
+from app.repositories.search_repository import (
+    AsyncSearchRepository, SearchIndexer, fts5_match, parse_terms, pg_tsquery,
+)
+from app.routes.search import search
+
+
+def _search(run_async, q, **kwargs):
+    return run_async(lambda adb: AsyncSearchRepository(adb).search(q, **kwargs))
+
+
+def test_query_builders_and_term_sanitising():
+    assert fts5_match(["system", "desi"]) == '"system" "desi"*'
+    assert pg_tsquery(["system", "desi"]) == "system & desi:*"
+    # FTS5 / tsquery operators never reach the query syntax
+    assert parse_terms('kube* OR "drop" & !x:*') == ["kube", "or", "drop", "x"]
+
+
+def test_writes_are_indexed_and_searchable_with_ranking_prefix_and_facets(db, run_async):
+    user = User(name="u", email="u@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+    repo = PostRepository(db)
+    google = repo.create_post({"user_id": user.id, "title": "Google system design round",
+                               "body": "Designed a rate limiter.", "company": "Google", "round_type": "System Design"})
+    repo.create_post({"user_id": user.id, "title": "Amazon onsite", "body": "One system design question on caching.",
+                      "company": "Amazon", "round_type": "System Design"})
+    repo.create_post({"user_id": user.id, "title": "Amazon OA", "body": "Two DP problems.",
+                      "company": "Amazon", "round_type": "Online Assessment"})
+    repo.add_comment({"user_id": user.id, "post_id": google.id, "body": "Did they ask about sharding?"})
+    problem = Problem(title="LRU Cache", description="Design a cache with O(1) ops", topic="Design", difficulty="Medium")
+    db.add(problem)
+    db.flush()
+    SearchIndexer(db).index_problem(problem)
+    db.commit()
+    SearchIndexer(db).sync_static()
+
+    result = _search(run_async, "system desig", doc_types=["post"])  # prefix on the last term
+    assert result["total"] == 2
+    # Title match outranks a body-only match
+    assert [r["title"] for r in result["results"][:2]] == ["Google system design round", "Amazon onsite"]
+    assert {"value": "System Design", "count": 2} in result["facets"]["round_type"]
+
+    # Company filter narrows results but not the company facet itself
+    amazon = _search(run_async, "system design", company="Amazon", doc_types=["post"])
+    assert [r["title"] for r in amazon["results"]] == ["Amazon onsite"]
+    assert {f["value"] for f in amazon["facets"]["company"]} == {"Google", "Amazon"}
+
+    comment = _search(run_async, "sharding")["results"][0]
+    assert (comment["type"], comment["post_id"], comment["company"]) == ("comment", google.id, "Google")
+    assert "<b>sharding</b>" in comment["snippet"]
+
+    assert {r["type"] for r in _search(run_async, "cache")["results"]} >= {"problem", "question", "post"}
+    assert _search(run_async, "conflict", doc_types=["behavioral"])["total"] == 1
+
+    # Re-indexing replaces the old text
+    google.title = "Meta product sense"
+    SearchIndexer(db).index_post(google)
+    db.commit()
+    assert _search(run_async, "meta", doc_types=["post"])["total"] == 1
+    assert _search(run_async, "google", doc_types=["post"])["total"] == 0
+
+    before = {(d.doc_type, d.ref_id) for d in db.query(SearchDocument)}
+    assert SearchIndexer(db).rebuild() == len(before)
+    assert {(d.doc_type, d.ref_id) for d in db.query(SearchDocument)} == before
+    assert _search(run_async, "meta", doc_types=["post"])["total"] == 1
+    assert _search(run_async, "!!!")["total"] == 0
+
+
+def test_broad_queries_rank_within_newest_candidate_window(db, run_async, monkeypatch):
+    monkeypatch.setattr(search_repository, "CANDIDATE_WINDOW", 3)
+    db.add_all([SearchDocument(doc_type="post", ref_id=str(i), title="kafka" if i == 0 else "queue",
+                               body="kafka consumer lag", company="Uber") for i in range(5)])
+    db.commit()
+
+    result = _search(run_async, "kafka")
+    assert (result["total"], result["total_capped"]) == (3, True)
+    # The strongest match (title hit) is the oldest row, outside the window
+    assert [r["id"] for r in result["results"]] == ["4", "3", "2"]
+    assert result["facets"]["company"] == [{"value": "Uber", "count": 3}]
+    assert _search(run_async, "kafka", offset=3)["results"] == []
+
+
+def test_route_rejects_unknown_types():
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(search(q="x", types="post,users", company=None, round_type=None,
+                           limit=20, offset=0, facets=True, db=None))
+    assert exc.value.status_code == 400
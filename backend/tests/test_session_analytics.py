@@ -0,0 +1,75 @@
+# backend/tests/test_session_analytics.py
+import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models import Base, User, InterviewSession, SessionDailyRollup
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.routes.sessions import get_analytics
+
+now = datetime.datetime.now()
+
+def _db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def _seed(db, user_id):
+    specs = [
+        (0, "voice", 80.0, 3, 1, {"clarity": 70, "tone": 60}),
+        (0, "voice", 60.0, 1, 0, {"clarity": 50}),
+        (0, "behavioral", 90.0, 0, 0, {"star": 80}),
+        (3, "voice", 70.0, 2, 4, {"clarity": 90, "tone": 40}),
+        (3, "mock", 0.0, 0, 0, None),
+        (45, "voice", 99.0, 9, 9, {"clarity": 10}),
+    ]
+    sessions = []
+    for days_ago, kind, score, fillers, vocal, dims in specs:
+        s = InterviewSession(
+            user_id=user_id, session_type=kind, overall_score=score, filler_count=fillers,
+            vocal_filler_count=vocal, dim_scores=dims, created_at=now - datetime.timedelta(days=days_ago),
+        )
+        db.add(s)
+        db.commit()
+        AnalyticsRepository(db).record_session(s)
+        sessions.append(s)
+    return sessions
+
+def _user(db):
+    user = User(name="a", email="a@test.dev", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+def test_analytics_from_rollups():
+    db = _db()
+    user = _user(db)
+    _seed(db, user.id)
+
+    data = get_analytics(user_id=user.id, days=30, db=db)
+    assert data["total_sessions"] == 5
+    assert data["by_type"] == {"voice": 3, "behavioral": 1, "mock": 1}
+    assert data["avg_score"] == 60.0
+    assert data["best_score"] == 90.0
+    assert data["dim_avgs"] == {"clarity": 70.0, "tone": 50.0}
+    assert data["total_filler_words"] == 6
+    assert data["total_vocal_fillers"] == 5
+    assert [t["count"] for t in data["trend"]] == [2, 3]
+    assert data["trend"][-1]["avg_score"] == round(230 / 3, 1)
+    assert set(data["latest"]) == {"voice", "behavioral", "mock"}
+
+def test_rebuild_matches_incremental_and_delete_refreshes_bucket():
+    db = _db()
+    user = _user(db)
+    sessions = _seed(db, user.id)
+    incremental = get_analytics(user_id=user.id, days=365, db=db)
+
+    assert AnalyticsRepository(db).rebuild() == db.query(SessionDailyRollup).count()
+    assert get_analytics(user_id=user.id, days=365, db=db) == incremental
+
+    best = sessions[0]
+    db.delete(best)
+    db.flush()
+    AnalyticsRepository(db).remove_session(best)
+    data = get_analytics(user_id=user.id, days=1, db=db)
+    assert data["by_type"]["voice"] == 1
+    assert data["best_score"] == 90.0
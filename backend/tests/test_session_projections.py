@@ -0,0 +1,54 @@
+# backend/tests/test_session_projections.py
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.controllers.mock_controller import MockController
+from app.models import Base, InterviewSession
+from app.routes.voice import get_history, get_session
+
+HEAVY = ("answer_text", "evaluation_json", "minute_logs", "ai_feedback", "conversation_history")
+
+
+def _db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return sessionmaker(bind=engine)(), statements
+
+
+def test_history_lists_select_no_payload_columns():
+    db, statements = _db()
+    for i in range(3):
+        db.add(InterviewSession(user_id="u1", session_type="voice", question_text="Q" * 500,
+                                answer_text="A" * 50_000, evaluation_json={"x": "y" * 10_000},
+                                minute_logs=[{"m": i}], ai_feedback="F" * 5_000, overall_score=i))
+    db.add(InterviewSession(user_id="u1", role="SWE", company="Acme", overall_score=80,
+                            conversation_history=[{"role": "user", "content": "hi"}] * 100))
+    db.commit()
+    statements.clear()
+
+    page = get_history(user_id="u1", cursor=None, limit=10, include_total=True, db=db)
+    assert page["total"] == 3
+    assert all(len(s["question_text"]) == 120 for s in page["sessions"])
+
+    mock = MockController(db).get_history("u1")
+    assert [s["company"] for s in mock["sessions"]] == ["Acme"]
+    assert "conversation_history" not in mock["sessions"][0]
+
+    assert statements and not any(col in sql for sql in statements for col in HEAVY)
+
+
+def test_detail_loads_payload_in_one_query():
+    db, statements = _db()
+    s = InterviewSession(user_id="u1", session_type="voice", answer_text="full answer", minute_logs=[1, 2])
+    db.add(s)
+    db.commit()
+    session_id = s.id
+    db.expunge_all()
+    statements.clear()
+
+    detail = get_session(session_id, db=db)
+    assert detail.answer_text == "full answer"
+    assert detail.minute_logs == [1, 2]
+    assert len(statements) == 1
@@ -0,0 +1,52 @@
+# backend/tests/test_session_routes.py
+import json
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.core.database import get_db, get_async_db
+from app.main import app
+from app.models import InterviewSession
+from app.routes import voice
+from app.services import nlp_service as nlp
+from app.services.job_service import JobQueue, MemoryJobStore
+
+
+def test_voice_and_sessions_routes_are_served_by_the_app(db, monkeypatch, tmp_path):
+    async def async_db():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db.db_path}")
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as adb:
+                yield adb
+        finally:
+            await engine.dispose()
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(nlp, "_batch_pool", lambda: pool)
+    monkeypatch.setattr(nlp, "evaluate_answer", lambda text, question_type: {"words": len(text.split())})
+    monkeypatch.setattr(voice, "RECORDINGS_DIR", tmp_path)
+    monkeypatch.setattr(voice, "job_queue", JobQueue(MemoryJobStore()))
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: db)
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, async_db)
+    client = TestClient(app)
+
+    try:
+        batch = client.post("/api/voice/evaluate/batch", json={"items": [{"transcript": "one two"}]})
+    finally:
+        pool.shutdown()
+    assert [json.loads(line) for line in batch.text.splitlines()] == [{"index": 0, "result": {"words": 2}}]
+
+    def save():
+        return client.post("/api/voice/save", files={"audio": ("a.webm", b"audio", "audio/webm")},
+                           data={"question_id": "q1", "transcript": "hello"})
+    saved = save()
+    assert saved.status_code == 202 and saved.json()["status"] == "queued"
+    # A retried upload maps to the same job and keeps only the first file
+    assert save().json()["filename"] == saved.json()["filename"]
+    assert [p.name for p in tmp_path.iterdir()] == [saved.json()["filename"]]
+
+    session = InterviewSession(user_id="u1", session_type="voice", question_text="Tell me", overall_score=80)
+    db.add(session)
+    db.commit()
+    assert [s["id"] for s in client.get("/api/voice/history?user_id=u1").json()["sessions"]] == [session.id]
+    assert [s["id"] for s in client.get("/api/sessions/history?user_id=u1").json()["sessions"]] == [session.id]
+    assert client.get(f"/api/sessions/{session.id}").json()["question_text"] == "Tell me"
@@ -0,0 +1,53 @@
+# backend/tests/test_streaks.py
+import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models import Base, User
+from app.repositories.streak_repository import StreakRepository
+
+today = datetime.date.today()
+day = datetime.timedelta(days=1)
+
+def _db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def _user(db, email):
+    user = User(name=email, email=email, password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+def test_record_activity_tracks_current_and_longest():
+    db = _db()
+    user = _user(db, "a@test.dev")
+    repo = StreakRepository(db)
+    for offset in [9, 8, 7, 6, 2, 1, 0, 0]:
+        repo.record_activity(user.id, today - offset * day)
+
+    streak = repo.get(user.id)
+    assert streak.current_streak == 3
+    assert streak.longest_streak == 4
+    assert repo.get_current_streak(user.id) == 3
+
+def test_stale_streak_reads_as_zero():
+    db = _db()
+    user = _user(db, "b@test.dev")
+    repo = StreakRepository(db)
+    repo.record_activity(user.id, today - 3 * day)
+    assert repo.get_current_streak(user.id) == 0
+
+def test_backfill_matches_incremental_updates():
+    db = _db()
+    users = [_user(db, f"{i}@test.dev") for i in range(3)]
+    repo = StreakRepository(db)
+    history = [[5, 4, 3, 1, 0], [2, 1], [30, 29, 28, 27, 26, 0]]
+    for user, offsets in zip(users, history):
+        for offset in offsets:
+            repo.record_activity(user.id, today - offset * day)
+
+    expected = {u.id: (repo.get(u.id).current_streak, repo.get(u.id).longest_streak) for u in users}
+    assert repo.backfill() == 3
+    db.expire_all()
+    assert {u.id: (repo.get(u.id).current_streak, repo.get(u.id).longest_streak) for u in users} == expected